@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak memory of DocxWriter vs StreamingDocxWriter on a large document
+Generates a synthetic Markdown file (default 50k paragraphs with headings, lists
+and tables) and converts it once per writer, each in a fresh process so peak
+RSS is measured independently. tracemalloc covers Python objects only; lxml
+trees live outside it, which is why RSS is reported as well.
+
+Usage: python3 scripts/benchmarks/bench_docx_memory.py [--paragraphs 50000]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS))
+
+MODES = ["docx", "stream"]
+
+
+def write_synthetic_markdown(path, paragraphs):
+    """Candidate-appendix style document: a section per 50 paragraphs, a table per 500"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# HIREINBOX Candidate Appendix\n\n")
+        for i in range(paragraphs):
+            if i % 50 == 0:
+                f.write(f"\n## Candidate {i // 50 + 1}\n\n")
+            if i % 500 == 0:
+                f.write("| Criterion | Evidence | Score |\n|---|---|---|\n")
+                for row in range(10):
+                    f.write(f"| Criterion {row} | **CA(SA)**, {row + 3} years at a JSE-listed firm | {60 + row} |\n")
+                f.write("\n")
+            if i % 7 == 0:
+                f.write(f"- Evidence point {i}: *led* a team of {i % 12 + 2} analysts\n")
+            else:
+                f.write(f"Paragraph {i}: the candidate's CV shows **relevant experience** in `IFRS` reporting, "
+                        f"audit and [POPIA](https://popia.co.za) compliance across {i % 9 + 1} roles.\n\n")
+
+
+def run_mode(mode, md_path, out_path):
+    """Child process: convert once and print seconds, tracemalloc peak and peak RSS"""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("md_to_docx", SCRIPTS / "md-to-docx.py")
+    md_to_docx = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(md_to_docx)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    md_to_docx.convert_file(md_path, out_path, stream=(mode == "stream"))
+    seconds = time.perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{seconds} {traced_peak} {rss_kb}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paragraphs", type=int, default=50000)
+    parser.add_argument("--run", nargs=3, metavar=("MODE", "MD", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        md_path = os.path.join(tmp, "appendix.md")
+        write_synthetic_markdown(md_path, args.paragraphs)
+        print(f"{args.paragraphs} paragraphs, {os.path.getsize(md_path) / 1e6:.1f} MB of Markdown\n")
+        print(f"{'writer':<8} {'seconds':>8} {'traced peak':>12} {'peak RSS':>10} {'output':>9}")
+        for mode in MODES:
+            out_path = os.path.join(tmp, f"{mode}.docx")
+            result = subprocess.run([sys.executable, __file__, "--run", mode, md_path, out_path],
+                                    capture_output=True, text=True, check=True)
+            seconds, traced, rss_kb = result.stdout.split()
+            print(f"{mode:<8} {float(seconds):>7.1f}s {int(traced) / 1e6:>10.1f}MB {int(rss_kb) / 1e3:>8.0f}MB "
+                  f"{os.path.getsize(out_path) / 1e6:>7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
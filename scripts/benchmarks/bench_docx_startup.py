@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-document start-up cost of the DOCX generators
+Stock template + restyling on every document vs cloning the cached branded
+base template (docx_helpers.new_document).
+
+Usage: python3 scripts/benchmarks/bench_docx_startup.py [--documents 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document  # noqa: E402
+
+from docx_helpers import apply_brand_styles, new_document  # noqa: E402
+
+
+def restyled_document():
+    """What DocxWriter did before: load the stock template, then apply the brand styles."""
+    doc = Document()
+    apply_brand_styles(doc)
+    return doc
+
+
+def timed(func, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        func()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=200, help="Documents to start per strategy")
+    args = parser.parse_args()
+
+    new_document()  # load the base template once, as a batch worker would
+    print(f"{'strategy':<22} {'total':>8} {'ms/doc':>8}")
+    for label, func in [("Document() + styles", restyled_document), ("new_document() clone", new_document)]:
+        seconds = timed(func, args.documents)
+        print(f"{label:<22} {seconds:>7.3f}s {seconds / args.documents * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
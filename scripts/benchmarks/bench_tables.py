@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bulk w:tbl builder vs python-docx table.cell(i, j) filling
+Shows per-row cost staying flat for build_table as the row count grows.
+
+Usage: python3 scripts/benchmarks/bench_tables.py [--legacy-max 250]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx import Document  # noqa: E402
+
+from docx_helpers import build_table, set_cell_shading  # noqa: E402
+
+ROW_COUNTS = [250, 500, 1000, 2000, 4000]
+COLUMNS = ["Candidate", "Role", "Score", "Status", "Notes"]
+
+
+def candidate_rows(count):
+    return [COLUMNS] + [
+        [f"Candidate {i}", "Financial Manager", str(60 + i % 40), "Shortlist" if i % 3 else "Consider",
+         f"**CA(SA)**, {i % 12} years experience"]
+        for i in range(count)
+    ]
+
+
+def legacy_table(doc, rows):
+    """The original md-to-docx.py create_table loop (cell(i, j) per cell)."""
+    num_cols = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=num_cols)
+    table.style = 'Table Grid'
+    for i, row in enumerate(rows):
+        for j, cell_text in enumerate(row):
+            cell = table.cell(i, j)
+            cell.text = cell_text
+            if i == 0:
+                set_cell_shading(cell, 'E6E6E6')
+                cell.paragraphs[0].runs[0].bold = True
+
+
+def timed(func, rows):
+    doc = Document()
+    started = time.perf_counter()
+    func(doc, rows)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--legacy-max", type=int, default=250,
+                        help="Largest row count to run the slow legacy path for")
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'build_table':>12} {'us/row':>8} {'legacy':>10} {'us/row':>9}")
+    for count in ROW_COUNTS:
+        rows = candidate_rows(count)
+        bulk = timed(build_table, rows)
+        line = f"{count:>6} {bulk:>11.3f}s {bulk / count * 1e6:>8.0f}"
+        if count <= args.legacy_max:
+            legacy = timed(legacy_table, rows)
+            line += f" {legacy:>9.3f}s {legacy / count * 1e6:>9.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
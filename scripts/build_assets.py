@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Asset pipeline for the SVG logos in public/
+Discovers public/hyred-logo*.svg and renders every configured size as PNG and
+WebP, plus a multi-size favicon ICO, with one worker process per source (each
+SVG is parsed once and each pixel size rendered once). An output is skipped
+while its source's content hash and its format/size config are unchanged, so a
+no-op rebuild only stats the sources. public/asset-manifest.json maps every
+output to a content-hashed URL for cache busting.
+
+The logo the app shows (RESPONSIVE_SOURCE) is also rendered at every CSS size x
+device pixel ratio it is displayed at - only the distinct pixel sizes, reusing
+fixed sizes that coincide - and src/lib/logo-srcset.json gives the app a ready
+srcSet per CSS size, so each client fetches the smallest adequate file.
+
+--optimize adds a per-output PNG stage (run in parallel across sizes): lossless
+palette quantization for flat logos, the smallest of several zlib settings,
+and no metadata chunks. Bytes saved are reported per asset.
+
+Usage: python3 scripts/build_assets.py [--jobs N] [--force] [--optimize] [--list]
+                                       [--css-sizes 32,36,40] [--dprs 1,2,3]
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+
+from build_cache import CACHE_ROOT, PROJECT_ROOT, InputHasher, content_hash, file_hash, write_if_changed
+
+PUBLIC_DIR = PROJECT_ROOT / "public"
+SOURCE_PATTERN = "hyred-logo*.svg"
+ASSET_MANIFEST = PUBLIC_DIR / "asset-manifest.json"
+ASSET_STATE = CACHE_ROOT / "assets-state.json"
+SRCSET_MANIFEST = PROJECT_ROOT / "src" / "lib" / "logo-srcset.json"
+
+# Bump when rendering or encoding changes so every output is rebuilt
+PIPELINE_VERSION = 1
+
+SIZES = [48, 128, 512, 1024]
+FORMATS = ["png", "webp"]
+WEBP_OPTIONS = {"lossless": True, "method": 4}
+DPI = 96  # cairosvg's default
+# cairosvg rewrites these nodes while drawing, so a tree containing them can't be reused
+MUTATED_ELEMENTS_RE = re.compile(rb"<(?:[\w-]+:)?(?:mask|pattern)\b")
+
+# PNG optimization: every zlib level tried per candidate image (plus Pillow's optimize pass)
+ZLIB_LEVELS = [6, 9]
+OPTIMIZE_VERSION = 1  # part of PNG output keys when --optimize is on
+
+# Favicon: each size rendered from the vector source and packed into one .ico
+FAVICON_SOURCE = "hyred-logo.svg"
+FAVICON_SIZES = [16, 32, 48]
+
+# Responsive variants: CSS sizes the app renders the logo at (px) and the DPRs to serve
+RESPONSIVE_SOURCE = "hyred-logo.svg"
+RESPONSIVE_CSS_SIZES = [32, 36, 40]
+RESPONSIVE_DPRS = [1, 2, 3]
+
+# Source stem -> output prefix, where the stem itself would read as a rendered size
+OUTPUT_PREFIX = {"hyred-logo-1024": "hyred-logo-hq"}
+
+
+def renderer():
+    """(Tree, PNGSurface, Image), exiting with install instructions if missing"""
+    try:
+        from cairosvg.parser import Tree
+        from cairosvg.surface import PNGSurface
+    except (ImportError, OSError):  # cairocffi raises OSError when the Cairo library is absent
+        print("❌ Error: cairosvg not installed (or the Cairo library is missing)")
+        print("Install with: pip3 install cairosvg")
+        sys.exit(1)
+    try:
+        from PIL import Image
+    except ImportError:
+        print("❌ Error: Pillow not installed (needed for WebP and ICO output)")
+        print("Install with: pip3 install Pillow")
+        sys.exit(1)
+    return Tree, PNGSurface, Image
+
+
+def discover_sources():
+    """SVG sources as paths relative to the project root"""
+    return [path.relative_to(PROJECT_ROOT).as_posix() for path in sorted(PUBLIC_DIR.glob(SOURCE_PATTERN))]
+
+
+def output_prefix(source):
+    stem = source.rsplit("/", 1)[-1][:-len(".svg")]
+    return OUTPUT_PREFIX.get(stem, stem)
+
+
+def responsive_widths(css_sizes, dprs):
+    """Distinct pixel sizes needed to serve every CSS size at every DPR"""
+    return sorted({math.ceil(css * dpr) for css in css_sizes for dpr in dprs})
+
+
+def asset_outputs(source, css_sizes=RESPONSIVE_CSS_SIZES, dprs=RESPONSIVE_DPRS):
+    """Outputs rendered from one source: [{"path", "format", "sizes"}, ...]"""
+    prefix = output_prefix(source)
+    sizes = SIZES
+    if source == f"public/{RESPONSIVE_SOURCE}":
+        sizes = sorted(set(SIZES) | set(responsive_widths(css_sizes, dprs)))
+    outputs = [
+        {"path": f"public/{prefix}-{size}.{fmt}", "format": fmt, "sizes": [size]}
+        for fmt in FORMATS for size in sizes
+    ]
+    if source == f"public/{FAVICON_SOURCE}":
+        outputs.append({"path": f"public/{prefix}.ico", "format": "ico", "sizes": FAVICON_SIZES})
+    return outputs
+
+
+def all_outputs():
+    """Every file the pipeline writes, relative to the project root"""
+    paths = [output["path"] for source in discover_sources() for output in asset_outputs(source)]
+    manifests = [ASSET_MANIFEST, SRCSET_MANIFEST]
+    return paths + [manifest.relative_to(PROJECT_ROOT).as_posix() for manifest in manifests]
+
+
+def output_signature(source_hash, output, optimize=False):
+    options = {"webp": WEBP_OPTIONS, "png": {"optimize": OPTIMIZE_VERSION} if optimize else None}
+    return content_hash("asset", PIPELINE_VERSION, source_hash, output["format"], output["sizes"],
+                        options.get(output["format"]), DPI)
+
+
+def encode(output, png, Image):
+    """Output bytes; png(size) returns the source rendered at size x size"""
+    sizes = output["sizes"]
+    if output["format"] == "png":
+        return png(sizes[0])
+    images = [Image.open(BytesIO(png(size))) for size in sizes]
+    buffer = BytesIO()
+    if output["format"] == "webp":
+        images[0].save(buffer, "WEBP", **WEBP_OPTIONS)
+    else:
+        images[-1].save(buffer, "ICO", sizes=[(size, size) for size in sizes], append_images=images[:-1])
+    return buffer.getvalue()
+
+
+def optimize_png(data, Image):
+    """
+    Smallest lossless re-encoding of a PNG: a palette image when the logo has at
+    most 256 colours and round-trips exactly, each zlib level and Pillow's
+    optimize pass. Nothing from image.info is passed on, so text/time/ICC chunks
+    are stripped. Returns data unchanged if nothing is smaller.
+    """
+    image = Image.open(BytesIO(data))
+    image.load()
+    variants = [image]
+    if image.getcolors(256) is not None:
+        palette = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        if palette.convert(image.mode).tobytes() == image.tobytes():
+            variants.insert(0, palette)
+
+    candidates = [data]
+    for variant in variants:
+        for options in [{"compress_level": level} for level in ZLIB_LEVELS] + [{"optimize": True}]:
+            buffer = BytesIO()
+            variant.save(buffer, "PNG", **options)
+            candidates.append(buffer.getvalue())
+    return min(candidates, key=len)
+
+
+def finish_output(path, data, optimize=False):
+    """
+    Worker: optimize (PNG only, when asked) and write one output. Returns (sha256
+    of the written bytes, bytes before optimization, bytes written, error).
+    """
+    try:
+        raw_size = len(data)
+        if optimize and path.endswith(".png"):
+            data = optimize_png(data, renderer()[2])
+        write_if_changed(PROJECT_ROOT / path, data)
+        return hashlib.sha256(data).hexdigest(), raw_size, len(data), None
+    except Exception as e:
+        return None, 0, 0, f"{type(e).__name__}: {e}"
+
+
+def render_source(source, outputs):
+    """
+    Worker: render one SVG and encode the given outputs. Returns ({path: bytes},
+    seconds, error) instead of raising.
+    """
+    started = time.perf_counter()
+    try:
+        Tree, PNGSurface, Image = renderer()
+        svg_path = PROJECT_ROOT / source
+        svg = svg_path.read_bytes()
+        tree = Tree(bytestring=svg, url=str(svg_path))
+        # Drawing mask/pattern nodes mutates the tree, so those sources render each size from a copy
+        shared = not MUTATED_ELEMENTS_RE.search(svg)
+        rendered = {}
+
+        def png(size):
+            if size not in rendered:
+                buffer = BytesIO()
+                surface_tree = tree if shared else copy.deepcopy(tree)
+                PNGSurface(surface_tree, buffer, DPI, output_width=size, output_height=size).finish()
+                rendered[size] = buffer.getvalue()
+            return rendered[size]
+
+        encoded = {output["path"]: encode(output, png, Image) for output in outputs}
+        return encoded, time.perf_counter() - started, None
+    except Exception as e:
+        return {}, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+
+
+def asset_url(path, digest):
+    """Content-hashed URL of a public/ output"""
+    return f"/{path[len('public/'):]}?v={digest[:12]}"
+
+
+def write_manifest(entries):
+    """public/asset-manifest.json: output name -> content-hashed URL"""
+    manifest = {
+        path[len("public/"):]: {"url": asset_url(path, digest), "sha256": digest}
+        for path, (_, digest) in sorted(entries.items())
+    }
+    write_if_changed(ASSET_MANIFEST, (json.dumps(manifest, indent=2) + "\n").encode())
+
+
+def write_srcset_manifest(entries, css_sizes, dprs):
+    """
+    src/lib/logo-srcset.json for the Next.js app:
+    {prefix: {css size: {"width", "height", "src", "srcSet": {format: "url 1x, url 2x"}}}}
+    """
+    prefix = output_prefix(f"public/{RESPONSIVE_SOURCE}")
+    variants = {}
+    for css in sorted(css_sizes):
+        srcset = {}
+        for fmt in FORMATS:
+            candidates = []
+            for dpr in dprs:
+                path = f"public/{prefix}-{math.ceil(css * dpr)}.{fmt}"
+                if path in entries:
+                    candidates.append(f"{asset_url(path, entries[path][1])} {dpr:g}x")
+            srcset[fmt] = ", ".join(candidates)
+        fallback = f"public/{prefix}-{math.ceil(css * min(dprs))}.png"
+        if fallback in entries:
+            variants[str(css)] = {"width": css, "height": css, "src": asset_url(fallback, entries[fallback][1]),
+                                  "srcSet": srcset}
+    write_if_changed(SRCSET_MANIFEST, (json.dumps({prefix: variants}, indent=2) + "\n").encode())
+
+
+def build(jobs=None, force=False, optimize=False, css_sizes=RESPONSIVE_CSS_SIZES, dprs=RESPONSIVE_DPRS):
+    """Render stale outputs; returns the number of sources and outputs that failed"""
+    state = json.loads(ASSET_STATE.read_text()) if ASSET_STATE.exists() else {}
+    hasher = InputHasher(state.get("files", {}))
+    previous = state.get("outputs", {})  # path -> [signature, sha256]
+    # Older state recorded a content_hash() of the bytes, not their SHA-256: re-hash reused outputs
+    rehash = state.get("digest") != "sha256"
+    current = {}
+
+    sources = discover_sources()
+    if not sources:
+        print(f"❌ Error: no {SOURCE_PATTERN} found in {PUBLIC_DIR}")
+        sys.exit(1)
+
+    pending = {}
+    total = 0
+    for source in sources:
+        source_hash = hasher(source)
+        for output in asset_outputs(source, css_sizes, dprs):
+            total += 1
+            signature = output_signature(source_hash, output, optimize)
+            entry = previous.get(output["path"])
+            if not force and entry and entry[0] == signature and (PROJECT_ROOT / output["path"]).exists():
+                current[output["path"]] = [signature, file_hash(PROJECT_ROOT / output["path"])] if rehash else entry
+            else:
+                pending.setdefault(source, []).append((output, signature))
+
+    rendered, failed = 0, 0
+    raw_total, written_total = 0, 0
+    started = time.perf_counter()
+    if pending:
+        renderer()  # report a missing dependency once, before starting workers
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(render_source, source, [output for output, _ in items]): (source, items)
+                for source, items in pending.items()
+            }
+            writes = {}
+            for future in as_completed(futures):
+                source, items = futures[future]
+                encoded, seconds, error = future.result()
+                if error:
+                    failed += 1
+                    print(f"FAILED {source}: {error}")
+                    continue
+                print(f"✅ Rendered: {source} -> {len(items)} outputs ({seconds:.2f}s)")
+                for output, signature in items:
+                    path = output["path"]
+                    writes[pool.submit(finish_output, path, encoded[path], optimize)] = (path, signature)
+
+            for future in as_completed(writes):
+                path, signature = writes[future]
+                digest, raw_size, size, error = future.result()
+                if error:
+                    failed += 1
+                    print(f"FAILED {path}: {error}")
+                    continue
+                current[path] = [signature, digest]
+                rendered += 1
+                raw_total += raw_size
+                written_total += size
+                if optimize and path.endswith(".png"):
+                    saved = raw_size - size
+                    print(f"  {path}: {raw_size:,} -> {size:,} bytes ({saved:,} saved, {saved / raw_size:.0%})")
+    elapsed = time.perf_counter() - started
+
+    write_manifest(current)
+    write_srcset_manifest(current, css_sizes, dprs)
+    write_if_changed(ASSET_STATE, json.dumps({"files": {**hasher.previous, **hasher.current}, "outputs": current, "digest": "sha256"},
+                                             indent=2, sort_keys=True).encode())
+    fresh = total - sum(len(items) for items in pending.values())
+    print(f"\n{total} outputs: {rendered} rendered, {fresh} up to date, {failed} failed in {elapsed:.2f}s")
+    if optimize and raw_total:
+        print(f"Optimized: {raw_total:,} -> {written_total:,} bytes ({raw_total - written_total:,} saved)")
+    return failed
+
+
+def parse_numbers(value):
+    """'1,1.5,2' -> [1, 1.5, 2] (positive numbers)"""
+    try:
+        numbers = [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        numbers = []
+    if not numbers or min(numbers) <= 0:
+        raise argparse.ArgumentTypeError("expected comma-separated positive numbers")
+    return [int(n) if n.is_integer() else n for n in numbers]
+
+
+def format_numbers(numbers):
+    return ",".join(f"{n:g}" for n in numbers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render public/ SVG logos to PNG, WebP and ICO")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Render even if outputs are up to date")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Losslessly shrink PNG outputs (palette, zlib level, no metadata)")
+    parser.add_argument("--css-sizes", type=parse_numbers, default=RESPONSIVE_CSS_SIZES,
+                        help=f"CSS px sizes the logo is shown at (default: {format_numbers(RESPONSIVE_CSS_SIZES)})")
+    parser.add_argument("--dprs", type=parse_numbers, default=RESPONSIVE_DPRS,
+                        help=f"Device pixel ratios to serve (default: {format_numbers(RESPONSIVE_DPRS)})")
+    parser.add_argument("--list", action="store_true", help="List sources with their outputs")
+    args = parser.parse_args()
+
+    if args.list:
+        for source in discover_sources():
+            print(f"{source}:")
+            outputs = asset_outputs(source, args.css_sizes, args.dprs)
+            print(f"  outputs: {', '.join(output['path'] for output in outputs)}")
+        return
+
+    failed = build(args.jobs, args.force, args.optimize, args.css_sizes, args.dprs)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache shared by the document/forecast generators
+Results are stored under a hash of their inputs, so a stage only re-runs when
+something it depends on actually changed. FragmentCache is the in-memory
+front for pieces reused between documents, optionally backed by a ContentCache
+so fragments also survive across processes and runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_ROOT = Path(os.environ.get("HIREINBOX_CACHE_DIR", PROJECT_ROOT / ".cache" / "build"))
+
+
+def content_hash(*parts) -> str:
+    """Stable SHA-256 of JSON-serialisable parts (bytes are hashed as-is)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray)):
+            digest.update(part)
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def file_hash(path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_atomic(path, data: bytes):
+    """Write bytes via a temp file + rename so readers never see partial output"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates 0600; keep the target's mode, or what open() would have given a new file
+        os.chmod(tmp, path.stat().st_mode & 0o7777 if path.exists() else 0o666 & ~current_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_if_changed(path, data: bytes) -> bool:
+    """Write only when the file is missing or differs; returns True if written"""
+    path = Path(path)
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    write_atomic(path, data)
+    return True
+
+
+class InputHasher:
+    """
+    Hashes of files (paths relative to the project root) that reuse the previous
+    run's value while (mtime, size) is unchanged, so a no-op build reads almost
+    no file contents. Persist {**previous, **current} for the next run.
+    """
+
+    def __init__(self, previous):
+        self.previous = previous
+        self.current = {}
+
+    def __call__(self, path):
+        if path in self.current:
+            return self.current[path][2]
+        try:
+            stat = os.stat(PROJECT_ROOT / path)
+        except FileNotFoundError:
+            return None
+        entry = self.previous.get(path)
+        if not entry or entry[:2] != [stat.st_mtime_ns, stat.st_size]:
+            entry = [stat.st_mtime_ns, stat.st_size, file_hash(PROJECT_ROOT / path)]
+        self.current[path] = entry
+        return entry[2]
+
+
+class ContentCache:
+    """One namespace of the on-disk cache: JSON values and raw blobs keyed by hash"""
+
+    def __init__(self, namespace, root=None, enabled=True):
+        self.dir = Path(root or CACHE_ROOT) / namespace
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key, suffix):
+        return self.dir / key[:2] / f"{key}{suffix}"
+
+    def get(self, key):
+        """Cached JSON value or None"""
+        path = self._path(key, ".json")
+        if self.enabled and path.exists():
+            self.hits += 1
+            return json.loads(path.read_text(encoding="utf-8"))
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if self.enabled:
+            write_atomic(self._path(key, ".json"), json.dumps(value).encode())
+        return value
+
+    def get_bytes(self, key):
+        """Cached blob or None"""
+        path = self._path(key, ".bin")
+        if self.enabled and path.exists():
+            self.hits += 1
+            return path.read_bytes()
+        self.misses += 1
+        return None
+
+    def put_bytes(self, key, data: bytes):
+        if self.enabled:
+            write_atomic(self._path(key, ".bin"), data)
+        return data
+
+    def memoize(self, key, compute):
+        """Return the cached value for key, running compute() only on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def stats(self) -> str:
+        return f"{self.dir.name}: {self.hits} hits, {self.misses} misses"
+
+
+class FragmentCache:
+    """
+    In-memory LRU cache of rendered fragments (e.g. DOCX table XML) shared by
+    every document built in one process, keyed by a content hash of the
+    fragment's data and style. With a store (a ContentCache) memory misses fall
+    through to disk and new fragments are written there too, so worker
+    processes and later runs share them.
+    """
+
+    def __init__(self, name, maxsize=512, store=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.store = store
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Cached fragment or None (a hit marks it most recently used)"""
+        if key not in self.entries:
+            value = self.store.get(key) if self.store else None
+            if value is None:
+                self.misses += 1
+                return None
+            self._remember(key, value)
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        if self.store:
+            self.store.put(key, value)
+        return self._remember(key, value)
+
+    def _remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def counts(self):
+        """(hits, misses, evictions) - worker processes return these to be summed"""
+        return self.hits, self.misses, self.evictions
+
+    def stats(self, counts=None) -> str:
+        hits, misses, evictions = counts or self.counts()
+        return f"{self.name}: {hits} hits, {misses} misses, {evictions} evicted"
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Incremental build runner for the HireInbox partner pack
+Each target lists the files it reads (content, the script and the helper
+modules it imports) and the files it writes. A target is rebuilt only when
+an input's content hash changed or an output is missing; targets that also
+read external data (billed actuals) fold a fingerprint of it into their
+signature. Independent targets run in parallel. Targets that read another target's outputs wait for it.
+
+Usage: python3 scripts/build_docs.py [targets...] [--jobs N] [--force] [--list]
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from billing_actuals import connect, fetch_monthly_actuals
+from build_assets import SOURCE_PATTERN, all_outputs
+from build_cache import PROJECT_ROOT, InputHasher, content_hash, write_atomic
+
+BUILD_DIR = "build/partner-pack"
+BUILD_MANIFEST = "build/.build-manifest.json"
+
+# Helper modules shared by several generators (paths relative to the project root)
+CACHE_MODULES = ["scripts/build_cache.py"]
+DOCX_MODULES = ["scripts/md_blocks.py", "scripts/docx_helpers.py"]
+FORECAST_MODULES = ["scripts/formula_eval.py", "scripts/forecast_export.py", "scripts/billing_actuals.py"]
+
+PARTNER_MARKDOWN = [
+    "HIREINBOX_PRD_TECHNICAL.md",
+    "HIREINBOX_MARKET_SIZE.md",
+    "HIREINBOX_REVENUE_FORECAST_Y1.md",
+]
+MARKDOWN_FORMATS = ["docx", "html", "pdf"]
+
+# generate-financial-forecast.py blends billed actuals in when this is set
+BILLING_DSN_ENV = "HIREINBOX_BILLING_DSN"
+
+
+def actuals_fingerprint():
+    """Hash of the DSN and the billed actuals it holds; "" without a DSN, None if they can't be read"""
+    dsn = os.environ.get(BILLING_DSN_ENV)
+    if not dsn:
+        return ""
+    try:
+        conn, dialect = connect(dsn)
+        try:
+            return content_hash(dsn, fetch_monthly_actuals(conn, dialect))
+        finally:
+            conn.close()
+    except (Exception, SystemExit):
+        return None
+
+
+# name -> command (script + args, run from the project root), inputs (files or globs), outputs,
+# and optionally a fingerprint() of external data the command reads
+TARGETS = {
+    "partner-documents": {
+        "command": ["scripts/create-documents.py", "--output-dir", BUILD_DIR],
+        "inputs": ["scripts/create-documents.py", "scripts/doc_templates.py", "scripts/templates/*.yaml",
+                   *CACHE_MODULES, *DOCX_MODULES, *FORECAST_MODULES],
+        "outputs": [f"{BUILD_DIR}/HIREINBOX_PRD_TECHNICAL.docx", f"{BUILD_DIR}/HIREINBOX_MARKET_SIZE.docx",
+                    f"{BUILD_DIR}/HIREINBOX_REVENUE_FORECAST_Y1.xlsx"],
+    },
+    "forecast-18-month": {
+        "command": ["scripts/generate-financial-forecast.py", "--output",
+                    f"{BUILD_DIR}/HIREINBOX_18_Month_Forecast.xlsx"],
+        "inputs": ["scripts/generate-financial-forecast.py", *CACHE_MODULES, *FORECAST_MODULES],
+        "outputs": [f"{BUILD_DIR}/HIREINBOX_18_Month_Forecast.xlsx"],
+        "fingerprint": actuals_fingerprint,
+    },
+    "markdown-docs": {
+        "command": ["scripts/md-to-docx.py", *PARTNER_MARKDOWN, "--output-dir", f"{BUILD_DIR}/markdown",
+                    "--format", ",".join(MARKDOWN_FORMATS), "--force", "--jobs", str(len(PARTNER_MARKDOWN))],
+        "inputs": [*PARTNER_MARKDOWN, "scripts/md-to-docx.py", "scripts/md_backends.py", "scripts/docx_stream.py",
+                   *CACHE_MODULES, *DOCX_MODULES],
+        "outputs": [f"{BUILD_DIR}/markdown/{name[:-3]}.{fmt}" for name in PARTNER_MARKDOWN for fmt in MARKDOWN_FORMATS],
+    },
+    "logos": {
+        "command": ["scripts/build_assets.py", "--optimize"],
+        "inputs": ["scripts/build_assets.py", f"public/{SOURCE_PATTERN}", *CACHE_MODULES],
+        "outputs": all_outputs(),
+    },
+}
+
+
+def expand_inputs(patterns):
+    """Input globs -> sorted existing paths (relative to the project root)"""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, root_dir=PROJECT_ROOT)
+        paths.update(matches or [pattern])
+    return sorted(paths)
+
+
+def target_signature(name, target, hasher):
+    """Hash of the command, every input's content and any external fingerprint; None if one is unavailable"""
+    hashes = {path: hasher(path) for path in expand_inputs(target["inputs"])}
+    external = [target["fingerprint"]()] if "fingerprint" in target else []
+    if None in hashes.values() or None in external:
+        return None
+    return content_hash(name, target["command"], hashes, *external)
+
+
+def target_order(names):
+    """Group targets into waves: a target runs after any target producing one of its inputs"""
+    producers = {output: name for name, target in TARGETS.items() for output in target["outputs"]}
+    deps = {
+        name: {producers[path] for path in expand_inputs(TARGETS[name]["inputs"])
+               if producers.get(path, name) != name and producers[path] in names}
+        for name in names
+    }
+    waves, done = [], set()
+    while len(done) < len(names):
+        wave = [name for name in names if name not in done and deps[name] <= done]
+        if not wave:
+            raise ValueError(f"Dependency cycle between targets: {', '.join(sorted(set(names) - done))}")
+        waves.append(wave)
+        done.update(wave)
+    return waves
+
+
+def run_target(name, target):
+    """
+    Run one target's command; returns (seconds, error, cache stats lines from its
+    output) instead of raising
+    """
+    script, *args = target["command"]
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, script, *args], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    seconds = time.perf_counter() - started
+    stats = [line.strip() for line in result.stdout.splitlines() if " hits, " in line]
+    if result.returncode != 0:
+        lines = (result.stderr or result.stdout).strip().splitlines()
+        return seconds, lines[-1] if lines else f"exit status {result.returncode}", stats
+    missing = [path for path in target["outputs"] if not (PROJECT_ROOT / path).exists()]
+    if missing:
+        return seconds, f"did not write {', '.join(missing)}", stats
+    return seconds, None, stats
+
+
+def build(names, jobs=None, force=False):
+    """Bring the named targets up to date; returns the number of failed targets"""
+    manifest_path = PROJECT_ROOT / BUILD_MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    hasher = InputHasher(manifest.get("files", {}))
+    signatures = manifest.get("targets", {})
+
+    built, fresh, failed = 0, 0, 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for wave in target_order(names):
+            futures = {}
+            for name in wave:
+                target = TARGETS[name]
+                signature = target_signature(name, target, hasher)
+                outputs_exist = all((PROJECT_ROOT / path).exists() for path in target["outputs"])
+                if not force and signature and signature == signatures.get(name) and outputs_exist:
+                    fresh += 1
+                    continue
+                futures[pool.submit(run_target, name, target)] = (name, signature)
+
+            for future in as_completed(futures):
+                name, signature = futures[future]
+                seconds, error, stats = future.result()
+                if error:
+                    failed += 1
+                    signatures.pop(name, None)
+                    print(f"FAILED {name}: {error}")
+                    continue
+                built += 1
+                signatures[name] = signature
+                print(f"Built: {name} ({seconds:.2f}s)")
+                for line in stats:
+                    print(f"  {line}")
+    elapsed = time.perf_counter() - started
+
+    write_atomic(manifest_path, json.dumps({"files": {**hasher.previous, **hasher.current}, "targets": signatures},
+                                           indent=2, sort_keys=True).encode())
+    print(f"\n{len(names)} targets: {built} built, {fresh} up to date, {failed} failed in {elapsed:.2f}s")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild stale HireInbox partner-pack artifacts")
+    parser.add_argument("targets", nargs="*", help=f"Targets to build (default: all of {', '.join(TARGETS)})")
+    parser.add_argument("--jobs", type=int, default=None, help="Targets to run at once (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--list", action="store_true", help="List targets with their inputs and outputs")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, target in TARGETS.items():
+            print(f"{name}:")
+            print(f"  inputs:  {', '.join(expand_inputs(target['inputs']))}")
+            print(f"  outputs: {', '.join(target['outputs'])}")
+        return
+
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    failed = build(args.targets or list(TARGETS), args.jobs, args.force)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
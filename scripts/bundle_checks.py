@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Client bundle weight for the Next.js pages
+Every src/app/**/page.tsx (plus the layouts above it) is walked through its
+imports. Server modules are followed without being counted; once a module is
+'use client' it and everything it imports statically ship to the browser.
+
+    local      bytes of the client source modules reachable from the page
+    packages   bytes of the npm packages they pull in, measured offline from
+               node_modules: the package.json entry (browser/module/main/exports)
+               and every file reachable from it, plus the packages it imports
+
+Packages shared between modules are counted once per page. React/Next ship
+with every page and are reported separately. Package sizes are cached by
+name@version in the build cache, so only new or upgraded packages are re-read.
+
+    HEAVY_CLIENT_IMPORT  a package over HEAVY_IMPORT_BYTES imported statically by
+                         a client module - a candidate for next/dynamic or import()
+"""
+
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from build_cache import PROJECT_ROOT, ContentCache, content_hash
+from query_checks import mask_source
+
+SRC_DIR = PROJECT_ROOT / "src"
+APP_DIR = SRC_DIR / "app"
+NODE_MODULES = PROJECT_ROOT / "node_modules"
+TSCONFIG = PROJECT_ROOT / "tsconfig.json"
+
+# Bump when the way package weights are measured changes
+ANALYZER_VERSION = 1
+HEAVY_IMPORT_BYTES = 50 * 1024
+
+RESOLVE_EXTENSIONS = [".tsx", ".ts", ".jsx", ".js", ".mjs", ".cjs", ".json"]
+PAGE_NAMES = {"page.tsx", "page.ts", "page.jsx", "page.js"}
+LAYOUT_NAMES = {"layout.tsx", "layout.ts", "layout.jsx", "layout.js"}
+# Shipped by the framework runtime on every page, whatever the page imports
+FRAMEWORK_PACKAGES = {"react", "react-dom", "next", "scheduler"}
+NODE_BUILTINS = {"assert", "buffer", "child_process", "crypto", "dns", "events", "fs", "http", "https",
+                 "net", "os", "path", "querystring", "stream", "string_decoder", "tls", "url", "util", "zlib"}
+# Condition keys tried in package.json "exports", browser builds first
+EXPORT_CONDITIONS = ["browser", "import", "module", "default", "require"]
+
+USE_CLIENT_RE = re.compile(r"\s*(?:(?://[^\n]*|/\*.*?\*/)\s*)*['\"]use client['\"]", re.S)
+# Run on masked source: string contents are blank, quotes kept
+STATIC_IMPORT_RE = re.compile(r"\b(?:import|export)\s+(type\s+)?(?:[\w$*{},\s]*?\s*from\s*)?(['\"])")
+REQUIRE_RE = re.compile(r"\brequire\s*\(\s*()(['\"])")
+DYNAMIC_IMPORT_RE = re.compile(r"\bimport\s*\(\s*()(['\"`])")
+
+
+def load_aliases():
+    """tsconfig "paths" as [(prefix, directory)], e.g. ("@/", src/)"""
+    aliases = []
+    try:
+        paths = json.loads(TSCONFIG.read_text(encoding="utf-8"))["compilerOptions"]["paths"]
+    except (OSError, ValueError, KeyError):
+        paths = {"@/*": ["./src/*"]}
+    for pattern, targets in paths.items():
+        if pattern.endswith("/*") and targets:
+            aliases.append((pattern[:-1], (PROJECT_ROOT / targets[0][:-1]).resolve()))
+    return aliases
+
+
+def parse_imports(text):
+    """{"static": [(specifier, line)], "dynamic": [...]} - type-only imports dropped"""
+    masked = mask_source(text)
+    found = {"static": [], "dynamic": []}
+    for kind, regex in (("static", STATIC_IMPORT_RE), ("static", REQUIRE_RE), ("dynamic", DYNAMIC_IMPORT_RE)):
+        for match in regex.finditer(masked):
+            if match.group(1):
+                continue
+            quote = match.end() - 1
+            close = masked.find(masked[quote], quote + 1)
+            if close == -1:
+                continue
+            found[kind].append((text[quote + 1:close], masked.count("\n", 0, quote) + 1))
+    return found
+
+
+def resolve_file(base):
+    """base, base.<ext> or base/index.<ext>, whichever exists"""
+    if base.is_file():
+        return base
+    for extension in RESOLVE_EXTENSIONS:
+        candidate = base.with_name(base.name + extension)
+        if candidate.is_file():
+            return candidate
+    for extension in RESOLVE_EXTENSIONS:
+        candidate = base / f"index{extension}"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def split_package(specifier):
+    """'@scope/pkg/sub/path' -> ('@scope/pkg', 'sub/path')"""
+    parts = specifier.split("/")
+    count = 2 if specifier.startswith("@") else 1
+    return "/".join(parts[:count]), "/".join(parts[count:])
+
+
+def find_package(name, start, stop):
+    """Directory of an installed package, searched the way Node does from start up to stop"""
+    for directory in [start, *start.parents]:
+        candidate = directory / "node_modules" / name
+        if (candidate / "package.json").is_file():
+            return candidate
+        if directory == stop:
+            break
+    return None
+
+
+def export_target(value):
+    """First file path in an "exports" entry, following nested conditions"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        for item in value:
+            target = export_target(item)
+            if target:
+                return target
+    if isinstance(value, dict):
+        for condition in EXPORT_CONDITIONS:
+            if condition in value:
+                target = export_target(value[condition])
+                if target:
+                    return target
+    return None
+
+
+def package_entry(package_dir, meta, subpath):
+    """The file a bundler would load for 'pkg' or 'pkg/subpath'"""
+    exports = meta.get("exports")
+    key = f"./{subpath}" if subpath else "."
+    if isinstance(exports, dict) and any(name.startswith(".") for name in exports):
+        target = export_target(exports.get(key))
+    elif not subpath and exports is not None:
+        target = export_target(exports)
+    else:
+        target = None
+    if not target:
+        if subpath:
+            target = subpath
+        else:
+            browser = meta.get("browser")
+            target = next((meta[field] for field in ("module", "main") if isinstance(meta.get(field), str)), "index")
+            target = browser if isinstance(browser, str) else target
+    return resolve_file((package_dir / target).resolve())
+
+
+def measure_package(package_dir, meta, subpath):
+    """{"bytes", "files", "imports"} for the files reachable from the entry inside the package"""
+    entry = package_entry(package_dir, meta, subpath)
+    if entry is None:
+        return {"bytes": 0, "files": 0, "imports": []}
+    root = package_dir.resolve()
+    seen, stack, imports = set(), [entry], set()
+    total = 0
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        total += path.stat().st_size
+        if path.suffix == ".json":
+            continue
+        found = parse_imports(path.read_text(encoding="utf-8", errors="ignore"))
+        # A package's own lazy chunks are still on disk in it; other packages only count when static
+        for specifier, _ in found["static"] + found["dynamic"]:
+            if specifier.startswith("."):
+                target = resolve_file((path.parent / specifier).resolve())
+                if target and target.is_relative_to(root):
+                    stack.append(target)
+        imports.update(specifier for specifier, _ in found["static"]
+                       if specifier and not specifier.startswith((".", "/", "node:")))
+    return {"bytes": total, "files": len(seen), "imports": sorted(imports)}
+
+
+class PackageSizer:
+    """Offline package weights: own bytes cached by name@version, closures per process"""
+
+    def __init__(self, node_modules=NODE_MODULES, cache=None):
+        self.node_modules = Path(node_modules)
+        self.cache = cache or ContentCache("bundle-packages")
+        self.closures = {}
+        self.unresolved = set()
+
+    def own(self, name, subpath, start):
+        """(package key, {"bytes", "files", "imports"}, package dir) or None if not installed"""
+        package_dir = find_package(name, start, self.node_modules.parent) if start else None
+        if package_dir is None and (self.node_modules / name / "package.json").is_file():
+            package_dir = self.node_modules / name
+        if package_dir is None:
+            self.unresolved.add(name)
+            return None
+        meta = json.loads((package_dir / "package.json").read_text(encoding="utf-8"))
+        version = meta.get("version", "0")
+        label = f"{name}@{version}" + (f"/{subpath}" if subpath else "")
+        key = content_hash(ANALYZER_VERSION, label, str(package_dir.relative_to(self.node_modules.parent)))
+        info = self.cache.memoize(key, lambda: measure_package(package_dir, meta, subpath))
+        return label, info, package_dir
+
+    def closure(self, specifier, start=None):
+        """{package label: bytes} for a bare import and every package it pulls in"""
+        name, subpath = split_package(specifier)
+        if name in NODE_BUILTINS or name in FRAMEWORK_PACKAGES:
+            return {}
+        cache_key = (specifier, start)
+        if cache_key in self.closures:
+            return self.closures[cache_key]
+        weights = {}
+        stack = [(name, subpath, start)]
+        while stack:
+            name, subpath, start = stack.pop()
+            if name in NODE_BUILTINS or name in FRAMEWORK_PACKAGES:
+                continue
+            found = self.own(name, subpath, start)
+            if found is None:
+                continue
+            label, info, package_dir = found
+            if label in weights:
+                continue
+            weights[label] = info["bytes"]
+            for imported in info["imports"]:
+                stack.append((*split_package(imported), package_dir))
+        self.closures[cache_key] = weights
+        return weights
+
+
+class ModuleGraph:
+    """Parsed local modules and their resolved imports, built lazily"""
+
+    def __init__(self):
+        self.aliases = load_aliases()
+        self.modules = {}
+
+    def module(self, path):
+        if path not in self.modules:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            imports = parse_imports(text)
+            self.modules[path] = {
+                "client": bool(USE_CLIENT_RE.match(text)),
+                "size": len(text.encode("utf-8")),
+                "static": [(self.resolve(spec, path), spec, line) for spec, line in imports["static"]],
+                "dynamic": [(self.resolve(spec, path), spec, line) for spec, line in imports["dynamic"]],
+            }
+        return self.modules[path]
+
+    def is_local(self, specifier):
+        return specifier.startswith(("/", ".")) or any(specifier.startswith(prefix) for prefix, _ in self.aliases)
+
+    def resolve(self, specifier, importer):
+        """A local Path, or None for packages and anything that doesn't resolve"""
+        if specifier.startswith("."):
+            return resolve_file((importer.parent / specifier).resolve())
+        for prefix, directory in self.aliases:
+            if specifier.startswith(prefix):
+                return resolve_file(directory / specifier[len(prefix):])
+        return None
+
+
+def page_route(page, app_dir=APP_DIR):
+    """src/app/(group)/jobs/[id]/page.tsx -> /jobs/[id]"""
+    parts = [part for part in page.parent.relative_to(app_dir).parts if not part.startswith("(")]
+    return "/" + "/".join(parts)
+
+
+def page_entries(page, app_dir=APP_DIR):
+    """The page plus every layout that wraps it, outermost first"""
+    entries = []
+    for directory in reversed(page.parents):
+        if directory.is_relative_to(app_dir):
+            entries += [directory / name for name in sorted(LAYOUT_NAMES) if (directory / name).is_file()]
+    return entries + [page]
+
+
+def page_weight(entries, graph, sizer):
+    """Walk from the page entries; returns its client weight and the static package edges"""
+    client_modules, packages, lazy = set(), {}, set()
+    edges = []
+    seen = set()
+    stack = [(entry, False) for entry in entries]
+    while stack:
+        path, in_client = stack.pop()
+        module = graph.module(path)
+        in_client = in_client or module["client"]
+        if (path, in_client) in seen:
+            continue
+        seen.add((path, in_client))
+        if in_client:
+            client_modules.add(path)
+        for target, specifier, line in module["static"]:
+            if target is not None:
+                stack.append((target, in_client))
+            elif in_client and not graph.is_local(specifier):
+                weights = sizer.closure(specifier)
+                packages.update(weights)
+                edges.append((path, line, specifier, sum(weights.values())))
+        for target, specifier, line in module["dynamic"]:
+            if in_client:
+                # Split into its own chunk: not part of the page's initial load
+                lazy.add(specifier)
+            elif target is not None:
+                stack.append((target, False))
+    local = sum(graph.module(path)["size"] for path in client_modules)
+    return {
+        "client_modules": len(client_modules),
+        "local": local,
+        "packages": packages,
+        "total": local + sum(packages.values()),
+        "lazy": sorted(lazy),
+    }, edges
+
+
+def check_bundles(app_dir=APP_DIR, node_modules=NODE_MODULES):
+    """({route: weight}, issues by type, sizer) for every page, heaviest first"""
+    graph = ModuleGraph()
+    sizer = PackageSizer(node_modules)
+    pages, heavy = {}, {}
+    app_dir = Path(app_dir)
+    for page in sorted(path for path in app_dir.rglob("page.*") if path.name in PAGE_NAMES):
+        route = page_route(page, app_dir)
+        weight, edges = page_weight(page_entries(page, app_dir), graph, sizer)
+        pages[route] = weight
+        for path, line, specifier, size in edges:
+            if size >= HEAVY_IMPORT_BYTES:
+                item = heavy.setdefault((path, line), {"specifier": specifier, "size": size, "pages": set()})
+                item["pages"].add(route)
+
+    issues = defaultdict(list)
+    for (path, line), item in heavy.items():
+        kb = item["size"] // 1024
+        issues["HEAVY_CLIENT_IMPORT"].append({
+            "file": str(path.relative_to(PROJECT_ROOT)), "line": line, "cost": item["size"],
+            "issue": f"[{kb} KB] '{item['specifier']}' loads up front on {len(item['pages'])} page(s);"
+                     f" use next/dynamic or await import() where it is needed",
+        })
+    issues["HEAVY_CLIENT_IMPORT"].sort(key=lambda item: -item["cost"])
+    ordered = dict(sorted(pages.items(), key=lambda page: -page[1]["total"]))
+    return ordered, {key: value for key, value in issues.items() if value}, sizer
@@ -7,9 +7,19 @@ Scans codebase for TODOs, FIXMEs, incomplete features, and potential issues
 import os
 import re
 import json
+import argparse
+from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
 
+from build_cache import ContentCache, content_hash
+from bundle_checks import HEAVY_IMPORT_BYTES, check_bundles
+from clone_checks import check_clones
+from git_objects import list_tree, rev_list, stream_blobs
+from migration_checks import MIGRATIONS_DIR, check_migrations
+from query_checks import check_queries
+from trend_store import TrendStore
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent
 SRC_DIR = PROJECT_ROOT / "src"
@@ -29,6 +39,20 @@ PATTERNS = {
     "MISSING_ERROR": re.compile(r"\.catch\(\(\)\s*=>\s*\{\s*\}\)", re.IGNORECASE),
 }
 
+# Migration hazard types (see migration_checks.py), most damaging first
+MIGRATION_TYPES = ["LOCKING_ALTER", "UNBATCHED_BACKFILL", "FK_WITHOUT_INDEX", "RLS_UNINDEXED"]
+
+# Supabase query hot paths (see query_checks.py), each list sorted by estimated cost
+QUERY_TYPES = ["N_PLUS_ONE", "UNBOUNDED_SELECT", "SEQUENTIAL_AWAIT"]
+
+# Copy-pasted blocks (see clone_checks.py), most duplicated lines first
+CLONE_TYPES = ["CLONE_GROUP"]
+
+# Per-file checks cached per git blob; bump when any of them changes
+SCAN_VERSION = 1
+HISTORY_TYPES = ["TODO", "CONSOLE_LOG", "MISSING_AUTH"]
+HISTORY_BATCH = 50
+
 # Critical checks
 CRITICAL_PATTERNS = {
     "MISSING_AUTH": re.compile(r"\/api\/.*route\.ts", re.IGNORECASE),
@@ -44,24 +68,29 @@ def should_skip(path: Path) -> bool:
     return False
 
 
+def pattern_issues(content: str, relative: str) -> dict:
+    """Line-level pattern matches in one file's text"""
+    issues = defaultdict(list)
+    for line_num, line in enumerate(content.split("\n"), 1):
+        for issue_type, pattern in PATTERNS.items():
+            matches = pattern.findall(line)
+            if matches:
+                for match in matches:
+                    issues[issue_type].append({
+                        "file": relative,
+                        "line": line_num,
+                        "content": match if isinstance(match, str) else line.strip()[:100]
+                    })
+    return issues
+
+
 def scan_file(filepath: Path) -> dict:
     """Scan a single file for issues"""
     issues = defaultdict(list)
 
     try:
         content = filepath.read_text(encoding="utf-8", errors="ignore")
-        lines = content.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            for issue_type, pattern in PATTERNS.items():
-                matches = pattern.findall(line)
-                if matches:
-                    for match in matches:
-                        issues[issue_type].append({
-                            "file": str(filepath.relative_to(PROJECT_ROOT)),
-                            "line": line_num,
-                            "content": match if isinstance(match, str) else line.strip()[:100]
-                        })
+        issues.update(pattern_issues(content, str(filepath.relative_to(PROJECT_ROOT))))
 
     except Exception as e:
         issues["SCAN_ERROR"].append({
@@ -72,6 +101,38 @@ def scan_file(filepath: Path) -> dict:
     return dict(issues)
 
 
+# Public routes that don't need auth
+PUBLIC_ROUTES = {
+    "analyze-cv", "analyze-video", "rewrite-cv", "health",
+    "payments/notify", "auth"
+}
+
+
+def route_auth_issue(route_name: str, content: str, relative: str):
+    """Missing-auth finding for one API route, or None"""
+    # Skip public routes
+    if any(pub in route_name for pub in PUBLIC_ROUTES):
+        return None
+
+    # Check if route has auth
+    has_auth = any([
+        "getServerSession" in content,
+        "verifyAuth" in content,
+        "checkAuth" in content,
+        "requireAuth" in content,
+        "auth_context" in content.lower(),
+        "user_id" in content.lower() and "supabase" in content.lower()
+    ])
+
+    if has_auth:
+        return None
+    return {
+        "route": route_name,
+        "file": relative,
+        "issue": "May be missing authentication check"
+    }
+
+
 def check_api_routes(src_dir: Path) -> list:
     """Check API routes for missing auth"""
     issues = []
@@ -80,39 +141,31 @@ def check_api_routes(src_dir: Path) -> list:
     if not api_dir.exists():
         return issues
 
-    # Public routes that don't need auth
-    PUBLIC_ROUTES = {
-        "analyze-cv", "analyze-video", "rewrite-cv", "health",
-        "payments/notify", "auth"
-    }
-
     for route_file in api_dir.rglob("route.ts"):
         route_name = str(route_file.parent.relative_to(api_dir))
+        content = route_file.read_text(encoding="utf-8", errors="ignore")
+        issue = route_auth_issue(route_name, content, str(route_file.relative_to(PROJECT_ROOT)))
+        if issue:
+            issues.append(issue)
 
-        # Skip public routes
-        is_public = any(pub in route_name for pub in PUBLIC_ROUTES)
-        if is_public:
-            continue
+    return issues
 
-        content = route_file.read_text(encoding="utf-8", errors="ignore")
 
-        # Check if route has auth
-        has_auth = any([
-            "getServerSession" in content,
-            "verifyAuth" in content,
-            "checkAuth" in content,
-            "requireAuth" in content,
-            "auth_context" in content.lower(),
-            "user_id" in content.lower() and "supabase" in content.lower()
-        ])
-
-        if not has_auth:
-            issues.append({
-                "route": route_name,
-                "file": str(route_file.relative_to(PROJECT_ROOT)),
-                "issue": "May be missing authentication check"
-            })
+ENV_PATTERN = re.compile(r"process\.env\.(\w+)(?!\s*\|\||\s*\?\?|\!)")
 
+
+def env_issues(content: str, relative: str) -> list:
+    """Env var accesses without a fallback in one file's text"""
+    issues = []
+    for match in set(ENV_PATTERN.findall(content)):
+        # Check if it's used with ! (assertion) which means no fallback
+        if f"process.env.{match}!" in content:
+            continue  # This is intentional assertion
+        issues.append({
+            "file": relative,
+            "env_var": match,
+            "issue": "Env var used without fallback (may fail if not set)"
+        })
     return issues
 
 
@@ -125,53 +178,57 @@ def check_env_usage(src_dir: Path) -> list:
             continue
 
         content = filepath.read_text(encoding="utf-8", errors="ignore")
+        issues.extend(env_issues(content, str(filepath.relative_to(PROJECT_ROOT))))
 
-        # Find env var accesses without fallback
-        env_pattern = re.compile(r"process\.env\.(\w+)(?!\s*\|\||\s*\?\?|\!)")
-        matches = env_pattern.findall(content)
+    return issues
 
-        for match in set(matches):
-            # Check if it's used with ! (assertion) which means no fallback
-            if f"process.env.{match}!" in content:
-                continue  # This is intentional assertion
-            issues.append({
-                "file": str(filepath.relative_to(PROJECT_ROOT)),
-                "env_var": match,
-                "issue": "Env var used without fallback (may fail if not set)"
-            })
 
-    return issues
+INCOMPLETE_INDICATORS = [
+    (r"Coming\s+Soon", "Feature marked as coming soon"),
+    (r"Not\s+implemented", "Feature not implemented"),
+    (r"TODO:\s*implement", "TODO to implement"),
+    (r"placeholder", "Placeholder content"),
+    (r"return\s+null\s*;?\s*//", "Returns null with comment"),
+    (r"throw\s+new\s+Error\(['\"]not\s+implemented", "Throws not implemented"),
+]
+
+
+def incomplete_issues(content: str, relative: str) -> list:
+    """Incomplete-feature markers in one file's text"""
+    return [{"file": relative, "issue": description}
+            for pattern, description in INCOMPLETE_INDICATORS if re.search(pattern, content, re.IGNORECASE)]
 
 
 def check_incomplete_features(src_dir: Path) -> list:
     """Check for incomplete feature implementations"""
     issues = []
 
-    incomplete_indicators = [
-        (r"Coming\s+Soon", "Feature marked as coming soon"),
-        (r"Not\s+implemented", "Feature not implemented"),
-        (r"TODO:\s*implement", "TODO to implement"),
-        (r"placeholder", "Placeholder content"),
-        (r"return\s+null\s*;?\s*//", "Returns null with comment"),
-        (r"throw\s+new\s+Error\(['\"]not\s+implemented", "Throws not implemented"),
-    ]
-
     for filepath in src_dir.rglob("*.tsx"):
         if should_skip(filepath):
             continue
 
         content = filepath.read_text(encoding="utf-8", errors="ignore")
-
-        for pattern, description in incomplete_indicators:
-            if re.search(pattern, content, re.IGNORECASE):
-                issues.append({
-                    "file": str(filepath.relative_to(PROJECT_ROOT)),
-                    "issue": description
-                })
+        issues.extend(incomplete_issues(content, str(filepath.relative_to(PROJECT_ROOT))))
 
     return issues
 
 
+def scan_content(content: str, relative: str) -> dict:
+    """Every per-file check on one file's text, as check_issues would report it in the working tree"""
+    path = Path(relative)
+    issues = pattern_issues(content, relative) if path.suffix in EXTENSIONS else defaultdict(list)
+    api_parts = ("src", "app", "api")
+    if path.name == "route.ts" and path.parts[:3] == api_parts:
+        issue = route_auth_issue(str(path.parent.relative_to(*api_parts)), content, relative)
+        if issue:
+            issues["MISSING_AUTH"].append(issue)
+    if path.suffix == ".ts":
+        issues["ENV_ISSUES"].extend(env_issues(content, relative))
+    if path.suffix == ".tsx":
+        issues["INCOMPLETE"].extend(incomplete_issues(content, relative))
+    return {issue_type: items for issue_type, items in issues.items() if items}
+
+
 def main():
     print("=" * 60)
     print("HIREINBOX ISSUE SCANNER")
@@ -180,41 +237,63 @@ def main():
     all_issues = defaultdict(list)
 
     # Scan source files
-    print("\n[1/4] Scanning source files for TODOs/FIXMEs...")
-    file_count = 0
+    print("\n[1/7] Scanning source files for TODOs/FIXMEs...")
+    source_files = []
     for filepath in SRC_DIR.rglob("*"):
         if filepath.is_file() and filepath.suffix in EXTENSIONS and not should_skip(filepath):
             file_issues = scan_file(filepath)
             for issue_type, items in file_issues.items():
                 all_issues[issue_type].extend(items)
-            file_count += 1
-    print(f"      Scanned {file_count} files")
+            source_files.append(filepath)
+    print(f"      Scanned {len(source_files)} files")
 
     # Check API routes
-    print("\n[2/4] Checking API routes for auth...")
+    print("\n[2/7] Checking API routes for auth...")
     auth_issues = check_api_routes(SRC_DIR)
     if auth_issues:
         all_issues["MISSING_AUTH"] = auth_issues
 
     # Check env vars
-    print("\n[3/4] Checking environment variable usage...")
+    print("\n[3/7] Checking environment variable usage...")
     env_issues = check_env_usage(SRC_DIR)
     if env_issues:
         all_issues["ENV_ISSUES"] = env_issues[:10]  # Limit to top 10
 
     # Check incomplete features
-    print("\n[4/4] Checking for incomplete features...")
+    print("\n[4/7] Checking for incomplete features...")
     incomplete = check_incomplete_features(SRC_DIR)
     if incomplete:
         all_issues["INCOMPLETE"] = incomplete
 
-    # Summary
+    # Check SQL migrations
+    print("\n[5/7] Analyzing SQL migrations for performance hazards...")
+    migration_files = sorted(MIGRATIONS_DIR.glob("*.sql"))
+    migration_issues, schema = check_migrations(migration_files)
+    all_issues.update(migration_issues)
+    print(f"      Parsed {len(migration_files)} migrations")
+
+    # Check Supabase query patterns (ranked by estimated cost)
+    print("\n[6/7] Checking Supabase query patterns in API routes...")
+    all_issues.update(check_queries(schema))
+
+    # Detect copy-pasted code (fingerprints cached per file)
+    print("\n[7/7] Detecting duplicated code blocks...")
+    clone_issues, clone_stats = check_clones(sorted(source_files))
+    all_issues.update(clone_issues)
+    print(f"      Fingerprinted {clone_stats['fingerprinted']} of {clone_stats['files']} files")
+
+    print_summary(all_issues)
+    return all_issues
+
+
+def print_summary(all_issues: dict):
+    """Issue summary and the ship checklist"""
     print("\n" + "=" * 60)
     print("ISSUE SUMMARY")
     print("=" * 60)
 
     total = 0
-    priority_order = ["TODO", "FIXME", "MISSING_AUTH", "INCOMPLETE", "HACK", "STUB", "ENV_ISSUES"]
+    priority_order = ["TODO", "FIXME", "MISSING_AUTH", "INCOMPLETE", "HACK", "STUB", "ENV_ISSUES"] + MIGRATION_TYPES + QUERY_TYPES + CLONE_TYPES
 
     for issue_type in priority_order:
         if issue_type in all_issues:
@@ -251,6 +330,11 @@ def main():
         critical.append(f"- {len(all_issues['MISSING_AUTH'])} API routes may need auth")
     if all_issues.get("INCOMPLETE"):
         critical.append(f"- {len(all_issues['INCOMPLETE'])} incomplete features")
+    migration_count = sum(len(all_issues.get(issue_type, [])) for issue_type in MIGRATION_TYPES)
+    if migration_count:
+        critical.append(f"- {migration_count} migration performance hazards")
+    if all_issues.get("N_PLUS_ONE"):
+        critical.append(f"- {len(all_issues['N_PLUS_ONE'])} Supabase queries run once per loop iteration")
 
     for item in critical:
         print(item)
@@ -258,8 +342,159 @@ def main():
     if not critical:
         print("No critical issues found!")
 
-    return all_issues
+
+def scan_revisions(revs: list) -> dict:
+    """Per-file checks for each revision read from git objects; no checkout needed"""
+    cache = ContentCache("scan-blobs")
+    memo, results = {}, {}
+    for rev in revs:
+        print("=" * 60)
+        print(f"HIREINBOX ISSUE SCANNER @ {rev}")
+        print("=" * 60)
+        print(f"\n[1/1] Scanning {rev} from git objects...")
+        entries = source_entries(rev)
+        before = len(memo)
+        all_issues = defaultdict(list)
+        for relative, file_issues in sorted(tree_issues(entries, cache, memo).items()):
+            for issue_type, items in file_issues.items():
+                all_issues[issue_type].extend(items)
+        if all_issues.get("ENV_ISSUES"):
+            all_issues["ENV_ISSUES"] = all_issues["ENV_ISSUES"][:10]  # Limit to top 10
+        distinct = len({sha for sha, _ in entries})
+        print(f"      {len(entries)} files, {distinct} distinct blobs, {len(memo) - before} new results")
+        print("      Repo-wide stages (migrations, query chains, clones) need a working tree; skipped")
+        print_summary(all_issues)
+        results[rev] = dict(all_issues)
+        print()
+    print(f"Blob results: {cache.stats()}")
+    return results
+
+
+def tree_issues(entries: list, cache: ContentCache, memo: dict) -> dict:
+    """scan_content for [(blob sha, path)] from git objects, reused across trees and runs by blob sha
+
+    Blobs that are neither in memo nor in the on-disk cache are streamed through
+    one `git cat-file --batch` and each distinct sha is read and scanned once.
+    """
+    keys, missing = {}, defaultdict(list)
+    for sha, relative in entries:
+        path = Path(relative)
+        # Which checks run depends on where the blob sits, so that is part of the key
+        route = str(path.parent) if path.name == "route.ts" and path.parts[:3] == ("src", "app", "api") else ""
+        key = keys[sha, relative] = content_hash(SCAN_VERSION, sha, path.suffix, route)
+        if key not in memo:
+            found = cache.get(key)
+            if found is None:
+                missing[sha].append((key, relative))
+            else:
+                memo[key] = found
+    for sha, content in stream_blobs(missing):
+        for key, relative in missing[sha]:
+            if key not in memo:
+                issues = scan_content(content, relative)
+                memo[key] = cache.put(key, {
+                    issue_type: [{k: v for k, v in item.items() if k != "file"} for item in items]
+                    for issue_type, items in issues.items()})
+    return {relative: {issue_type: [{"file": relative, **item} for item in items]
+                       for issue_type, items in memo.get(keys[sha, relative], {}).items()}
+            for sha, relative in entries}
+
+
+def source_entries(rev: str) -> list:
+    """[(blob sha, path)] of the files the scanner looks at in rev's src/ tree"""
+    return [(sha, relative) for sha, relative in list_tree(rev)
+            if Path(relative).suffix in EXTENSIONS and not should_skip(Path(relative))]
+
+
+def scan_history(rev_range: str, store: TrendStore) -> set:
+    """Scan each commit in rev_range from git objects and append its per-type totals to the store"""
+    known = store.commits()
+    in_range = rev_list(rev_range)
+    commits = [(sha, timestamp) for sha, timestamp in in_range if sha not in known]
+    print(f"      {len(commits)} new commits to scan, {len(known)} already stored")
+    cache = ContentCache("scan-blobs")
+    memo, rows = {}, []
+    for sha, timestamp in commits:
+        totals = defaultdict(int)
+        for file_issues in tree_issues(source_entries(sha), cache, memo).values():
+            for issue_type, items in file_issues.items():
+                totals[issue_type] += len(items)
+        rows.append((sha, timestamp, totals))
+        if len(rows) == HISTORY_BATCH:
+            store.append(rows)
+            rows = []
+    store.append(rows)
+    print(f"      Blob results: {len(memo)} distinct, {cache.stats()}")
+    return {sha for sha, _ in in_range}
+
+
+def trend_report(issue_types: list, store: TrendStore, points=20, commits=None):
+    """Counts per commit for issue_types (optionally only those commits), sampled down to points rows"""
+    rows = [row for row in store.query(issue_types) if commits is None or row[1] in commits]
+    if not rows:
+        print("No history stored yet (run with --history <range>)")
+        return rows
+    shown = rows
+    if len(rows) > points:
+        shown = [rows[round(i * (len(rows) - 1) / (points - 1))] for i in range(points)]
+    widths = [max(len(issue_type), 6) for issue_type in issue_types]
+    print(f"\n{'DATE':<10}  {'COMMIT':<9}" + "".join(f" {t:>{w}}" for t, w in zip(issue_types, widths)))
+    for timestamp, sha, counts in shown:
+        date = datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+        print(f"{date:<10}  {sha[:9]:<9}" + "".join(f" {counts[t]:>{w}}" for t, w in zip(issue_types, widths)))
+    first, last = rows[0][2], rows[-1][2]
+    print(f"{'CHANGE':<10}  {'':<9}" + "".join(f" {last[t] - first[t]:>+{w}}" for t, w in zip(issue_types, widths)))
+    print(f"\n      {len(rows)} commits ({store.rows} in the store)")
+    return rows
+
+
+def bundle_report(limit=15):
+    """Client bundle weight per page and the heavy imports that could load lazily"""
+    print("=" * 60)
+    print("HIREINBOX CLIENT BUNDLE WEIGHT")
+    print("=" * 60)
+
+    pages, issues, sizer = check_bundles()
+    print(f"\n{'PAGE':<36} {'LOCAL':>8} {'PACKAGES':>9} {'TOTAL':>8}  LAZY")
+    for route, weight in list(pages.items())[:limit]:
+        packages = sum(weight["packages"].values())
+        print(f"{route:<36} {weight['local'] // 1024:>6}KB {packages // 1024:>7}KB {weight['total'] // 1024:>6}KB"
+              f"  {len(weight['lazy'])}")
+    if len(pages) > limit:
+        print(f"... {len(pages) - limit} lighter pages")
+    print(f"\n      {len(pages)} pages, framework runtime (react/next) not counted")
+    print(f"      Package sizes: {sizer.cache.stats()}")
+    if sizer.unresolved:
+        print(f"      Not installed, counted as 0 bytes (run npm install): {', '.join(sorted(sizer.unresolved))}")
+
+    heavy = issues.get("HEAVY_CLIENT_IMPORT", [])
+    print(f"\nHEAVY_CLIENT_IMPORT (>= {HEAVY_IMPORT_BYTES // 1024} KB): {len(heavy)} issues")
+    for item in heavy:
+        print(f"  - {item['file']} (line {item['line']}): {item['issue']}")
+    return issues
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scan the codebase for issues")
+    parser.add_argument("--bundle", action="store_true",
+                        help="Report client bundle weight per page instead of the issue scan")
+    parser.add_argument("--history", metavar="RANGE",
+                        help="Scan every commit in a git revision range (e.g. main~200..main) into the trend store")
+    parser.add_argument("--trend", metavar="TYPES", nargs="?", const=",".join(HISTORY_TYPES),
+                        help=f"Show stored counts per commit (default {','.join(HISTORY_TYPES)})")
+    parser.add_argument("--points", type=int, default=20, help="Rows to show in the trend table")
+    parser.add_argument("--rev", metavar="REV", nargs="+",
+                        help="Scan branches/commits straight from git objects instead of the working tree")
+    args = parser.parse_args()
+    if args.bundle:
+        bundle_report()
+    elif args.rev:
+        scan_revisions(args.rev)
+    elif args.history or args.trend:
+        store, commits = TrendStore(), None
+        if args.history:
+            print(f"Scanning {args.history} from git objects...")
+            commits = scan_history(args.history, store)
+        trend_report((args.trend or ",".join(HISTORY_TYPES)).split(","), store, args.points, commits)
+    else:
+        main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate code detection across src/
+Each file is masked (query_checks.mask_source) and tokenized with identifiers,
+strings and numbers normalized, so renamed copies still match. Every
+CLONE_TOKENS-token shingle gets a Rabin-Karp rolling hash and winnowing keeps
+the minimum of each WINDOW consecutive hashes as the file's fingerprints -
+any shared run of CLONE_TOKENS + WINDOW - 1 tokens is guaranteed to share one.
+
+An inverted index (fingerprint -> postings) pairs up matching positions;
+matches that advance together in both files are chained into blocks, and
+overlapping blocks are merged into clone groups:
+
+    CLONE_GROUP    MIN_CLONE_TOKENS+ tokens repeated in two or more places
+
+Fingerprints are cached per file content hash, so only edited files are
+re-tokenized. Fingerprints shared by more than MAX_POSTINGS places are
+boilerplate (imports, handler signatures) and are left out of the pairing,
+which keeps matching linear in the size of the tree.
+"""
+
+import json
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+from build_cache import CACHE_ROOT, PROJECT_ROOT, InputHasher, write_if_changed
+from query_checks import mask_source
+
+SRC_DIR = PROJECT_ROOT / "src"
+CLONE_STATE = CACHE_ROOT / "clone-state.json"
+
+# Bump when tokenizing or fingerprinting changes so cached fingerprints are dropped
+FINGERPRINT_VERSION = 1
+CLONE_TOKENS = 30
+WINDOW = 10
+MIN_CLONE_TOKENS = 120
+MAX_POSTINGS = 12
+
+HASH_BASE = 1_000_003
+HASH_MODULUS = (1 << 61) - 1
+
+TOKEN_RE = re.compile(r"(['\"`])[^'\"`]*?\1|[A-Za-z_$][\w$]*|\d[\w.]*|=>|[=!]==?|\.\.\.|&&|\|\||\?\?|\S")
+KEYWORDS = {
+    "as", "async", "await", "break", "case", "catch", "class", "const", "continue", "default", "delete", "do",
+    "else", "export", "extends", "false", "finally", "for", "from", "function", "if", "import", "in",
+    "instanceof", "interface", "let", "new", "null", "of", "return", "switch", "this", "throw", "true", "try",
+    "type", "typeof", "undefined", "var", "void", "while", "yield",
+}
+
+
+def tokenize(text):
+    """[(normalized token, line)]; property names after '.' are kept, other identifiers become 'I'"""
+    masked = mask_source(text)
+    tokens, line, position, previous = [], 1, 0, None
+    for match in TOKEN_RE.finditer(masked):
+        line += masked.count("\n", position, match.start())
+        position = match.start()
+        token = match.group()
+        if match.group(1):
+            token = "S"
+        elif token[0].isdigit():
+            token = "N"
+        elif (token[0].isalpha() or token[0] in "_$") and token not in KEYWORDS and previous != ".":
+            token = "I"
+        tokens.append((token, line))
+        previous = token
+    return tokens
+
+
+def rolling_hashes(values, k):
+    """Rabin-Karp hash of every k-long run of values"""
+    if len(values) < k:
+        return []
+    top = pow(HASH_BASE, k - 1, HASH_MODULUS)
+    current = 0
+    for value in values[:k]:
+        current = (current * HASH_BASE + value) % HASH_MODULUS
+    hashes = [current]
+    for i in range(k, len(values)):
+        current = ((current - values[i - k] * top) * HASH_BASE + values[i]) % HASH_MODULUS
+        hashes.append(current)
+    return hashes
+
+
+def winnow(hashes, window):
+    """Positions of the rightmost minimum of every window, each recorded once"""
+    selected, chosen, count = [], -1, len(hashes)
+    for start in range(max(count - window + 1, min(count, 1))):
+        end = min(start + window, count) - 1
+        if chosen < start:
+            # The previous minimum slid out: rescan this window
+            chosen = min(range(start, end + 1), key=lambda i: (hashes[i], -i))
+        elif hashes[end] <= hashes[chosen]:
+            chosen = end
+        if not selected or selected[-1] != chosen:
+            selected.append(chosen)
+    return selected
+
+
+def fingerprints(text):
+    """[[hash, token position, first line, last line]] for one file"""
+    tokens = tokenize(text)
+    values = [zlib.crc32(token.encode()) for token, _ in tokens]
+    hashes = rolling_hashes(values, CLONE_TOKENS)
+    return [[hashes[i], i, tokens[i][1], tokens[i + CLONE_TOKENS - 1][1]] for i in winnow(hashes, WINDOW)]
+
+
+def chain_blocks(matches):
+    """Group (print a, print b) matches that advance together in both files into blocks"""
+    blocks, open_blocks = [], []
+    for a, b in sorted(matches, key=lambda match: (match[0][1], match[1][1])):
+        open_blocks = [block for block in open_blocks if a[1] - block[-1][0][1] <= CLONE_TOKENS]
+        for block in open_blocks:
+            last_a, last_b = block[-1]
+            if 0 < a[1] - last_a[1] <= CLONE_TOKENS and 0 < b[1] - last_b[1] <= CLONE_TOKENS:
+                block.append((a, b))
+                break
+        else:
+            block = [(a, b)]
+            open_blocks.append(block)
+            blocks.append(block)
+    return blocks
+
+
+def find_clones(prints_by_file):
+    """[[(file, first line, last line)]] clone groups, largest first"""
+    index = defaultdict(list)
+    for path, prints in prints_by_file.items():
+        for fingerprint in prints:
+            index[fingerprint[0]].append((path, fingerprint))
+
+    pairs = defaultdict(list)
+    for postings in index.values():
+        if len(postings) < 2 or len(postings) > MAX_POSTINGS:
+            continue
+        for i, (path_a, a) in enumerate(postings):
+            for path_b, b in postings[i + 1:]:
+                if path_a == path_b and abs(a[1] - b[1]) < CLONE_TOKENS:
+                    continue
+                if (path_a, a[1]) > (path_b, b[1]):
+                    path_a, a, path_b, b = path_b, b, path_a, a
+                pairs[path_a, path_b].append((a, b))
+
+    # Union-find over regions; overlapping regions in one file are the same node
+    regions, parent = [], []
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for (path_a, path_b), matches in pairs.items():
+        for block in chain_blocks(matches):
+            if block[-1][0][1] + CLONE_TOKENS - block[0][0][1] < MIN_CLONE_TOKENS:
+                continue
+            first = len(regions)
+            regions.append((path_a, block[0][0][2], block[-1][0][3]))
+            regions.append((path_b, block[0][1][2], block[-1][1][3]))
+            parent += [first, first]
+
+    by_file = defaultdict(list)
+    for node, (path, start, end) in enumerate(regions):
+        by_file[path].append((start, end, node))
+    for spans in by_file.values():
+        spans.sort()
+        reach, owner = -1, None
+        for start, end, node in spans:
+            if start <= reach:
+                parent[find(node)] = find(owner)
+            else:
+                owner = node
+            reach = max(reach, end)
+
+    groups = defaultdict(lambda: defaultdict(list))
+    for node, (path, start, end) in enumerate(regions):
+        groups[find(node)][path].append((start, end))
+    clones = []
+    for files in groups.values():
+        members = []
+        for path, spans in files.items():
+            spans.sort()
+            merged = [list(spans[0])]
+            for start, end in spans[1:]:
+                if start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            members += [(path, start, end) for start, end in merged]
+        if len(members) > 1:
+            clones.append(sorted(members))
+    clones.sort(key=lambda members: -max(end - start + 1 for _, start, end in members) * (len(members) - 1))
+    return clones
+
+
+def check_clones(paths):
+    """Clone groups over the given files, reusing cached fingerprints; returns (issues by type, stats)"""
+    state = json.loads(CLONE_STATE.read_text()) if CLONE_STATE.exists() else {}
+    if state.get("version") != FINGERPRINT_VERSION:
+        state = {}
+    hasher = InputHasher(state.get("files", {}))
+    cached = state.get("prints", {})
+    current, prints_by_file, computed = {}, {}, 0
+    for path in paths:
+        relative = str(Path(path).relative_to(PROJECT_ROOT))
+        digest = hasher(relative)
+        if digest is None:
+            continue
+        if digest not in cached:
+            cached[digest] = fingerprints(Path(path).read_text(encoding="utf-8", errors="ignore"))
+            computed += 1
+        current[digest] = prints_by_file[relative] = cached[digest]
+    write_if_changed(CLONE_STATE, json.dumps({"version": FINGERPRINT_VERSION, "files": hasher.current,
+                                              "prints": current}).encode())
+
+    items = []
+    for members in find_clones(prints_by_file):
+        lines = max(end - start + 1 for _, start, end in members)
+        path, start, end = members[0]
+        others = ", ".join(f"{other}:{first}-{last}" for other, first, last in members[1:])
+        items.append({
+            "file": path, "line": start, "cost": lines * (len(members) - 1),
+            "issue": f"[{lines} lines x {len(members)}] lines {start}-{end} repeated in {others}",
+        })
+    stats = {"files": len(prints_by_file), "fingerprinted": computed}
+    return ({"CLONE_GROUP": items} if items else {}), stats
@@ -3,14 +3,19 @@
 Create Word and Excel documents for HireInbox partner review
 """
 
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
+from io import BytesIO
+import argparse
 import os
+import sys
+
+from build_cache import ContentCache, content_hash, write_if_changed
+from doc_templates import render_template
+from docx_helpers import TABLE_FRAGMENTS
+from formula_eval import FormulaEvaluator
+from forecast_export import export_frames, forecast_frame, parse_formats
 
 # Output paths
 DESKTOP = "/Users/simon/Desktop"
@@ -18,416 +23,84 @@ PRD_PATH = os.path.join(DESKTOP, "HIREINBOX_PRD_TECHNICAL.docx")
 MARKET_PATH = os.path.join(DESKTOP, "HIREINBOX_MARKET_SIZE.docx")
 FORECAST_PATH = os.path.join(DESKTOP, "HIREINBOX_REVENUE_FORECAST_Y1.xlsx")
 
-def add_heading(doc, text, level=1):
-    """Add a styled heading"""
-    heading = doc.add_heading(text, level=level)
-    return heading
-
-def add_table(doc, headers, rows):
-    """Add a formatted table"""
-    table = doc.add_table(rows=1, cols=len(headers))
-    table.style = 'Table Grid'
-
-    # Header row
-    hdr_cells = table.rows[0].cells
-    for i, header in enumerate(headers):
-        hdr_cells[i].text = header
-        hdr_cells[i].paragraphs[0].runs[0].bold = True
+# Cache keys: bump REVENUE_FORECAST_VERSION when compute_revenue_forecast() changes
+# and REVENUE_TEMPLATE_VERSION when the forecast workbook layout or styling changes
+REVENUE_FORECAST_VERSION = 1
+REVENUE_TEMPLATE_VERSION = 1
 
-    # Data rows
-    for row_data in rows:
-        row_cells = table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = str(cell_data)
+def create_templated_document(name, output_path, use_cache=True, context=None):
+    """Render a partner document from scripts/templates/<name>.yaml"""
+    written, stats = render_template(name, output_path, context=context, use_cache=use_cache)
+    print(f"{'Created' if written else 'Unchanged'}: {output_path}")
+    print(f"  Cache: {stats}")
 
-    return table
-
-def create_prd_document():
+def create_prd_document(use_cache=True, context=None, output_path=PRD_PATH):
     """Create PRD Technical Document"""
-    doc = Document()
-
-    # Title
-    title = doc.add_heading('HIREINBOX - PRODUCT REQUIREMENTS DOCUMENT (PRD)', 0)
-
-    doc.add_paragraph('Version: 1.0')
-    doc.add_paragraph('Date: 25 January 2026')
-    doc.add_paragraph('Author: Claude (CTO)')
-    doc.add_paragraph('For: Partner Review - MVP Assessment')
-    doc.add_paragraph()
+    create_templated_document("prd", output_path, use_cache, context)
 
-    # Executive Summary
-    add_heading(doc, '1. EXECUTIVE SUMMARY', 1)
-
-    add_heading(doc, 'What is HireInbox?', 2)
-    doc.add_paragraph('HireInbox is an AI-powered CV screening platform built specifically for South African SMEs. The platform screens CVs with evidence-based reasoning, providing explainable AI decisions that are POPIA compliant.')
-
-    add_heading(doc, 'Core Value Proposition', 2)
-    doc.add_paragraph('"Less noise. Better hires."')
-    bullets = doc.add_paragraph()
-    bullets.add_run('• Screen 200 CVs in 30 seconds (vs 17-50 hours manually)\n')
-    bullets.add_run('• Every decision shows WHY with direct quotes from the CV\n')
-    bullets.add_run('• South African context built-in (CA(SA), BCom, local companies)\n')
-    bullets.add_run('• Per-role pricing (not per-CV) - predictable costs')
-
-    add_heading(doc, 'Target Markets', 2)
-    add_table(doc,
-        ['Segment', 'Description', 'Pricing Model'],
-        [
-            ['B2B (Employers)', 'SMEs hiring 1-50 roles/year', 'Per role (R1,750+)'],
-            ['B2C (Candidates)', 'Job seekers wanting feedback', 'Free + Upsells (R99-R299)'],
-            ['B2Recruiter', 'Recruitment agencies', 'Per search/role']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, 'Current Build Status', 2)
-    add_table(doc,
-        ['Component', 'Status', 'Completeness'],
-        [
-            ['AI CV Screening', 'LIVE', '95%'],
-            ['B2B Employer Flow', 'Working', '75%'],
-            ['B2C Candidate Flow', 'Working', '80%'],
-            ['Talent Pool', 'Partial', '60%'],
-            ['B2Recruiter', 'UI Only', '40%'],
-            ['Payments', 'Not Integrated', '20%'],
-            ['Mobile', 'Needs Work', '30%']
-        ]
-    )
-    doc.add_paragraph()
-    doc.add_paragraph('Overall MVP Status: ~60%')
-
-    # Product Overview
-    add_heading(doc, '2. PRODUCT OVERVIEW', 1)
-
-    add_heading(doc, '2.1 Product Philosophy', 2)
-    bullets = doc.add_paragraph()
-    bullets.add_run('1. AI as Assistant - AI assists humans, never makes final decisions\n')
-    bullets.add_run('2. Evidence-Based - Every recommendation backed by direct quotes\n')
-    bullets.add_run('3. POPIA Compliant - Full audit trail, data rights respected\n')
-    bullets.add_run('4. SA-Specific - Understands local qualifications, companies, context\n')
-    bullets.add_run('5. Simple Pricing - Per-role, not per-CV; no usage anxiety')
-
-    # Tech Stack
-    add_heading(doc, '3. TECHNICAL ARCHITECTURE', 1)
-
-    add_heading(doc, '3.1 Tech Stack', 2)
-    add_table(doc,
-        ['Layer', 'Technology', 'Purpose'],
-        [
-            ['Frontend', 'Next.js 16 (App Router)', 'React framework with SSR'],
-            ['Styling', 'Inline CSS', 'No Tailwind (design decision)'],
-            ['Language', 'TypeScript', 'Type safety'],
-            ['Database', 'Supabase (PostgreSQL)', 'Data persistence, auth'],
-            ['AI - CV Screening', 'OpenAI GPT-4o-mini (Fine-tuned)', 'Core screening intelligence'],
-            ['AI - Video', 'Claude Vision (claude-sonnet-4)', 'Video analysis'],
-            ['AI - Transcription', 'Whisper-1', 'Audio to text'],
-            ['Email', 'IMAP Integration', 'Fetch CVs from inbox'],
-            ['Payments', 'PayFast (Planned)', 'SA payment gateway'],
-            ['Hosting', 'Vercel', 'Edge deployment'],
-            ['Domain', 'hireinbox.co.za', 'Live']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, '3.3 Fine-Tuned AI Model', 2)
-    doc.add_paragraph('Model ID: ft:gpt-4o-mini-2024-07-18:personal:hireinbox-cv-screener:CphiMaZU')
-    doc.add_paragraph('Training Data: 860 hand-curated screening examples (v1), 10,000 examples generating (v2 - in progress)')
-
-    # B2B Products
-    add_heading(doc, '4. B2B PRODUCTS (EMPLOYERS)', 1)
-
-    add_heading(doc, '4.1 AI CV Screening', 2)
-    doc.add_paragraph('Price: R1,750 per role')
-    doc.add_paragraph('What It Does:')
-    bullets = doc.add_paragraph()
-    bullets.add_run('1. Employer creates a role with requirements\n')
-    bullets.add_run('2. System fetches CVs from their email inbox (IMAP)\n')
-    bullets.add_run('3. AI screens each CV against role requirements\n')
-    bullets.add_run('4. Candidates scored 0-100 with evidence\n')
-    bullets.add_run('5. Auto-generates shortlist (80+), consider (60-79), reject (<60)\n')
-    bullets.add_run('6. Sends acknowledgment emails to candidates')
-    doc.add_paragraph('Status: LIVE - Core feature working')
-
-    add_heading(doc, '4.2 AI Interview (Add-On)', 2)
-    doc.add_paragraph('Price: R799 per role')
-    doc.add_paragraph('Status: Experimental - UI exists, needs production hardening')
-
-    add_heading(doc, '4.3 Verification Bundle (Add-On)', 2)
-    doc.add_paragraph('Price: R800 per role (or individual: R50 ID, R100 Credit, R200 Reference)')
-    doc.add_paragraph('Status: API stubs exist, third-party integrations pending')
-
-    # B2C Products
-    add_heading(doc, '5. B2C PRODUCTS (CANDIDATES)', 1)
-
-    add_heading(doc, '5.1 Free CV Scan', 2)
-    doc.add_paragraph('Price: FREE (1 per user)')
-    doc.add_paragraph('Status: LIVE - Core feature working')
-
-    add_heading(doc, '5.2 Video Analysis (Paid Upsell)', 2)
-    doc.add_paragraph('Price: R99-R199')
-    doc.add_paragraph('Status: LIVE - Claude Vision working')
-
-    add_heading(doc, '5.3-5.5 Other B2C Products', 2)
-    add_table(doc,
-        ['Product', 'Price', 'Status'],
-        [
-            ['AI Coaching', 'R149-R299', 'UI mockup only'],
-            ['Position Prep', 'R199', 'UI mockup only'],
-            ['Video Pitch', 'R149', 'UI mockup only']
-        ]
-    )
-    doc.add_paragraph()
-
-    # Talent Pool
-    add_heading(doc, '6. TALENT POOL PLATFORM', 1)
-    doc.add_paragraph('The Talent Pool is a two-sided marketplace:')
-    bullets = doc.add_paragraph()
-    bullets.add_run('• Candidates join for FREE to be discovered\n')
-    bullets.add_run('• Employers pay R2,500 to post a job and access matched candidates')
-
-    # B2Recruiter
-    add_heading(doc, '7. B2RECRUITER PRODUCTS', 1)
-
-    add_heading(doc, '7.1 Talent Mapping', 2)
-    doc.add_paragraph('Price: R999 per search')
-    doc.add_paragraph('Status: Working - basic search functional')
-
-    # Pricing Summary
-    add_heading(doc, '8. PRICING SUMMARY', 1)
-
-    add_heading(doc, 'B2B Pricing', 2)
-    add_table(doc,
-        ['Product', 'Price', 'Unit'],
-        [
-            ['AI CV Screening', 'R1,750', 'per role'],
-            ['AI Interview', 'R799', 'per role (add-on)'],
-            ['Verification Bundle', 'R800', 'per role (add-on)'],
-            ['ID Check only', 'R50', 'per candidate'],
-            ['Credit Check only', 'R100', 'per candidate'],
-            ['Reference Check only', 'R200', 'per candidate'],
-            ['Job Listing (Talent Pool)', 'R2,500', 'per listing'],
-            ['Talent Mapping', 'R999', 'per search']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, 'B2C Pricing', 2)
-    add_table(doc,
-        ['Product', 'Price'],
-        [
-            ['CV Scan', 'FREE (1x)'],
-            ['CV Rewrite', 'FREE (1x)'],
-            ['Video Analysis', 'R99-R199'],
-            ['AI Coaching', 'R149-R299'],
-            ['Position Prep', 'R199'],
-            ['Video Pitch', 'R149']
-        ]
-    )
-    doc.add_paragraph()
-
-    # Footer
-    doc.add_paragraph()
-    doc.add_paragraph('Prepared for: Partner Review')
-    doc.add_paragraph('Next Steps: Review this PRD, Review REMAINING_MVP_ITEMS.md, Review revenue forecast')
-    doc.add_paragraph()
-    doc.add_paragraph('HireInbox - Less noise. Better hires.')
-    doc.add_paragraph('Built in Cape Town, South Africa')
-
-    doc.save(PRD_PATH)
-    print(f"Created: {PRD_PATH}")
-
-def create_market_size_document():
+def create_market_size_document(use_cache=True, context=None, output_path=MARKET_PATH):
     """Create Market Size Document"""
-    doc = Document()
-
-    # Title
-    title = doc.add_heading('HIREINBOX - MARKET SIZE ANALYSIS', 0)
-
-    doc.add_paragraph('Date: 25 January 2026')
-    doc.add_paragraph('Prepared by: Claude (CTO)')
-    doc.add_paragraph('For: Partner Review')
-    doc.add_paragraph()
-
-    # Executive Summary
-    add_heading(doc, 'EXECUTIVE SUMMARY', 1)
-    doc.add_paragraph('HireInbox operates in a large, fragmented market with significant growth potential:')
-
-    add_table(doc,
-        ['Market', 'TAM (Total Addressable)', 'SAM (Serviceable)', 'SOM (Obtainable Y1)'],
-        [
-            ['B2B (Employers)', 'R8.75 billion', 'R1.75 billion', 'R3.5 million'],
-            ['B2C (Job Seekers)', 'R4.1 billion', 'R820 million', 'R1.3 million'],
-            ['Recruiters', 'R2.5 billion', 'R500 million', 'R300,000'],
-            ['TOTAL', 'R15.35 billion', 'R3.07 billion', 'R5.1 million']
-        ]
-    )
-    doc.add_paragraph()
-
-    # B2B Market
-    add_heading(doc, 'PART 1: THE PAYING CUSTOMERS (B2B)', 1)
-
-    add_heading(doc, '1.1 South African Business Landscape', 2)
-    add_table(doc,
-        ['Metric', 'Value', 'Source'],
-        [
-            ['Total MSMEs in SA', '2.0+ million', 'UNCTAD 2023'],
-            ['Formal registered businesses', '~550,000', 'Small Business Institute'],
-            ['SMEs (10-250 employees)', '~150,000', 'StatsSA estimates'],
-            ['SMEs that hire annually', '~75,000 (50%)', 'Industry estimate'],
-            ['Average roles per hiring SME', '4-5 per year', 'Industry estimate']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, '1.2 B2B TAM Calculation', 2)
-    doc.add_paragraph('75,000 SMEs hiring annually x 5 roles x R1,750 = R656M base CV screening')
-    doc.add_paragraph('Conservative estimate including enterprise: R1.75 billion')
-
-    # Recruitment Agencies
-    add_heading(doc, 'PART 2: RECRUITMENT AGENCIES', 1)
-
-    add_table(doc,
-        ['Metric', 'Value', 'Source'],
-        [
-            ['Africa staffing market (2023)', '$16.5 billion', 'Business Market Insights'],
-            ['SA share (~40% of Africa)', '~$6.6 billion', 'Estimate'],
-            ['SA recruitment market CAGR', '13.7%', 'Research and Markets'],
-            ['Number of registered agencies', '~2,500', 'APSO estimate'],
-            ['Active boutique recruiters', '~1,000', 'Industry estimate']
-        ]
-    )
-    doc.add_paragraph()
-    doc.add_paragraph('Recruiter TAM: ~R67 million')
-
-    # Job Seekers
-    add_heading(doc, 'PART 3: JOB SEEKERS (B2C)', 1)
-
-    add_heading(doc, '3.1 South African Labor Market', 2)
-    add_table(doc,
-        ['Metric', 'Value', 'Source'],
-        [
-            ['Working-age population', '40.4 million', 'StatsSA Q1 2025'],
-            ['Labor force', '25.1 million', 'StatsSA Q3 2025'],
-            ['Employed', '17.1 million', 'StatsSA Q3 2025'],
-            ['Unemployed (official)', '8.1 million', 'StatsSA Q3 2025'],
-            ['Unemployment rate', '31.9%', 'StatsSA Q3 2025'],
-            ['Expanded unemployment', '42.4%', 'StatsSA Q3 2025'],
-            ['Youth unemployment (15-24)', '58.5%', 'StatsSA Q3 2025'],
-            ['Youth unemployment (15-34)', '46.1%', 'StatsSA Q1 2025']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, '3.2 Active Job Seekers', 2)
-    add_table(doc,
-        ['Segment', 'Size', 'Profile'],
-        [
-            ['Officially unemployed', '8.1 million', 'Actively seeking work'],
-            ['Underemployed', '~3 million', 'Want more work'],
-            ['Passive seekers (employed)', '~5 million', 'Open to opportunities'],
-            ['Total potential users', '~16 million', '']
-        ]
-    )
-    doc.add_paragraph()
-
-    # Competitive Landscape
-    add_heading(doc, 'PART 4: COMPETITIVE LANDSCAPE', 1)
-
-    add_heading(doc, 'Direct Competitors', 2)
-    add_table(doc,
-        ['Competitor', 'Focus', 'Pricing', 'HireInbox Advantage'],
-        [
-            ['Pnet', 'Job board', 'Per listing', 'AI screening included'],
-            ['CareerJunction', 'Job board', 'Per listing', 'Evidence-based AI'],
-            ['Indeed SA', 'Aggregator', 'CPC/CPA', 'Predictable pricing'],
-            ['LinkedIn', 'Professional network', 'Subscription', 'SA-specific context'],
-            ['OfferZen', 'Tech talent', '% of salary', 'Broader market']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, 'Why HireInbox Wins', 2)
-    bullets = doc.add_paragraph()
-    bullets.add_run('1. SA-Specific AI - Understands CA(SA), BCom, local companies\n')
-    bullets.add_run('2. Evidence-Based - Every decision backed by quotes (POPIA compliant)\n')
-    bullets.add_run('3. Per-Role Pricing - Predictable, fair, no usage anxiety\n')
-    bullets.add_run('4. Email-Native - Works where HR already works\n')
-    bullets.add_run('5. Unified Platform - B2B, B2C, and Talent Pool in one')
-
-    # Market Sizing Summary
-    add_heading(doc, 'PART 5: MARKET SIZING SUMMARY', 1)
-
-    add_heading(doc, 'Total Addressable Market (TAM)', 2)
-    add_table(doc,
-        ['Segment', 'Size', 'Description'],
-        [
-            ['B2B Employers', 'R1.75 billion', 'All SA SME hiring spend'],
-            ['Recruitment Agencies', 'R67 million', 'Boutique recruiter tools'],
-            ['B2C Job Seekers', 'R50 million', 'Paid CV services at scale'],
-            ['TOTAL TAM', 'R1.87 billion', 'Annual opportunity']
-        ]
+    create_templated_document("market-size", output_path, use_cache, context)
+
+# Revenue drivers: month followed by one column per product in REVENUE_PRODUCTS.
+# TOTAL, MoM Growth and the totals row are derived - see compute_revenue_forecast()
+REVENUE_PRODUCTS = ["B2B Screening", "B2B Interview", "B2B Verify", "Talent Pool", "Talent Map", "B2C Video", "B2C Coaching", "B2C Prep"]
+
+REVENUE_DRIVERS = [
+    ["May 2026", 17500, 1598, 800, 5000, 2997, 11920, 3980, 1990],
+    ["Jun 2026", 31500, 3196, 2400, 10000, 4995, 17880, 6965, 3980],
+    ["Jul 2026", 52500, 6392, 4800, 15000, 7992, 26820, 9950, 6965],
+    ["Aug 2026", 78750, 9588, 8000, 25000, 11988, 37250, 13930, 9950],
+    ["Sep 2026", 105000, 14382, 12000, 35000, 17982, 47680, 17910, 12935],
+    ["Oct 2026", 140000, 19975, 16000, 45000, 24975, 59600, 23880, 15920],
+    ["Nov 2026", 175000, 25568, 22400, 55000, 29970, 71520, 29850, 19900],
+    ["Dec 2026", 122500, 15980, 14400, 30000, 19980, 52150, 19900, 13930],
+    ["Jan 2027", 227500, 31960, 28000, 70000, 34965, 89400, 39800, 25870],
+    ["Feb 2027", 262500, 39950, 33600, 80000, 39960, 104300, 47760, 29850],
+    ["Mar 2027", 306250, 46342, 40000, 95000, 47952, 119200, 55720, 34825],
+    ["Apr 2027", 350000, 55930, 48000, 112500, 54945, 141550, 67660, 41790]
+]
+
+# Year 1 revenue scenarios as adjustments to the base forecast
+REVENUE_SCENARIOS = [
+    ("Conservative", -0.30),
+    ("Base Case", 0.0),
+    ("Optimistic", 0.40)
+]
+
+def compute_revenue_forecast(drivers):
+    """Derive TOTAL, MoM Growth and the year totals row from the revenue drivers"""
+    rows = []
+    previous = None
+    for month, *revenues in drivers:
+        total = sum(revenues)
+        growth = "Launch" if previous is None else f"{total / previous - 1:+.0%}"
+        rows.append([month] + revenues + [total, growth])
+        previous = total
+    totals = ["YEAR 1 TOTAL"] + [sum(col) for col in zip(*(row[1:10] for row in rows))] + [""]
+    return rows, totals
+
+def revenue_frame(forecast):
+    """Typed monthly revenue table (month as date, amounts in cents) for columnar export"""
+    rows, _ = forecast
+    products = [name.lower().replace(" ", "_") for name in REVENUE_PRODUCTS]
+    df = forecast_frame(
+        [row[:-1] for row in rows],
+        ["month"] + products + ["total"],
+        month_column="month",
+        amount_columns=products + ["total"],
     )
-    doc.add_paragraph()
-
-    add_heading(doc, 'Serviceable Obtainable Market (SOM) - Year 1', 2)
-    add_table(doc,
-        ['Segment', 'Size', 'Description'],
-        [
-            ['B2B', 'R2.4 million', '~200 customers'],
-            ['Recruiters', 'R300,000', '~50 recruiters'],
-            ['B2C', 'R1.3 million', '~8,000 paid users'],
-            ['Talent Pool', 'R580,000', '~230 job posts'],
-            ['TOTAL SOM Y1', 'R4.58 million', 'First year target']
-        ]
-    )
-    doc.add_paragraph()
-
-    # SA Statistics
-    add_heading(doc, 'PART 6: KEY STATISTICS REFERENCE', 1)
-
-    add_heading(doc, 'South Africa at a Glance (2025)', 2)
-    add_table(doc,
-        ['Metric', 'Value'],
-        [
-            ['Population', '62 million'],
-            ['Working-age (15-64)', '40.4 million'],
-            ['Labor force', '25.1 million'],
-            ['Employed', '17.1 million'],
-            ['Unemployed', '8.1 million'],
-            ['Unemployment rate', '31.9%'],
-            ['Youth (15-24) unemployment', '58.5%'],
-            ['GDP (2024)', '$380 billion'],
-            ['SMEs', '2+ million'],
-            ['Formal businesses', '~550,000']
-        ]
-    )
-    doc.add_paragraph()
-
-    add_heading(doc, 'Internet/Mobile Penetration', 2)
-    add_table(doc,
-        ['Metric', 'Value'],
-        [
-            ['Smartphone users', '25+ million'],
-            ['Internet penetration', '72%'],
-            ['Social media users', '26 million'],
-            ['WhatsApp users', '20+ million']
-        ]
-    )
-    doc.add_paragraph()
+    df["mom_growth"] = df["total_cents"].pct_change()
+    return df
 
-    # Footer
-    doc.add_paragraph()
-    doc.add_paragraph('Prepared by: Claude (CTO)')
-    doc.add_paragraph('For: HireInbox Partner Review')
-    doc.add_paragraph('Date: 25 January 2026')
-    doc.add_paragraph()
-    doc.add_paragraph('"In a market with 8 million unemployed and 75,000 SMEs hiring annually, there is no shortage of opportunity. The question is execution."')
+def revenue_formula_row(row):
+    """Live-formula version of one Monthly Detail row, reading drivers from Assumptions"""
+    inputs = [f"=Assumptions!{col}{row}" for col in "ABCDEFGHI"]
+    growth = "Launch" if row == 2 else f"=IF(J{row - 1}=0,\"\",J{row}/J{row - 1}-1)"
+    return inputs + [f"=SUM(B{row}:I{row})", growth]
 
-    doc.save(MARKET_PATH)
-    print(f"Created: {MARKET_PATH}")
-
-def create_revenue_forecast():
-    """Create Revenue Forecast Excel"""
+def build_revenue_forecast(forecast, live_formulas=False):
+    """Build the Revenue Forecast workbook from computed (rows, totals)"""
     wb = Workbook()
 
     # Styles
@@ -436,6 +109,7 @@ def create_revenue_forecast():
     total_fill = PatternFill(start_color="10B981", end_color="10B981", fill_type="solid")
     total_font = Font(bold=True, color="FFFFFF")
     currency_format = 'R#,##0'
+    growth_format = '+0%;-0%;0%'
     thin_border = Border(
         left=Side(style='thin'),
         right=Side(style='thin'),
@@ -535,7 +209,7 @@ def create_revenue_forecast():
     ws2 = wb.create_sheet("Monthly Detail")
 
     # Headers
-    headers = ["Month", "B2B Screening", "B2B Interview", "B2B Verify", "Talent Pool", "Talent Map", "B2C Video", "B2C Coaching", "B2C Prep", "TOTAL", "MoM Growth"]
+    headers = ["Month"] + REVENUE_PRODUCTS + ["TOTAL", "MoM Growth"]
     for col_idx, header in enumerate(headers, start=1):
         cell = ws2.cell(row=1, column=col_idx, value=header)
         cell.fill = header_fill
@@ -544,20 +218,30 @@ def create_revenue_forecast():
         cell.alignment = Alignment(horizontal='center')
 
     # Monthly data
-    monthly_data = [
-        ["May 2026", 17500, 1598, 800, 5000, 2997, 11920, 3980, 1990, 45785, "Launch"],
-        ["Jun 2026", 31500, 3196, 2400, 10000, 4995, 17880, 6965, 3980, 80916, "+77%"],
-        ["Jul 2026", 52500, 6392, 4800, 15000, 7992, 26820, 9950, 6965, 130419, "+61%"],
-        ["Aug 2026", 78750, 9588, 8000, 25000, 11988, 37250, 13930, 9950, 194456, "+49%"],
-        ["Sep 2026", 105000, 14382, 12000, 35000, 17982, 47680, 17910, 12935, 262889, "+35%"],
-        ["Oct 2026", 140000, 19975, 16000, 45000, 24975, 59600, 23880, 15920, 345350, "+31%"],
-        ["Nov 2026", 175000, 25568, 22400, 55000, 29970, 71520, 29850, 19900, 429208, "+24%"],
-        ["Dec 2026", 122500, 15980, 14400, 30000, 19980, 52150, 19900, 13930, 288840, "-33%"],
-        ["Jan 2027", 227500, 31960, 28000, 70000, 34965, 89400, 39800, 25870, 547495, "+90%"],
-        ["Feb 2027", 262500, 39950, 33600, 80000, 39960, 104300, 47760, 29850, 637920, "+17%"],
-        ["Mar 2027", 306250, 46342, 40000, 95000, 47952, 119200, 55720, 34825, 745289, "+17%"],
-        ["Apr 2027", 350000, 55930, 48000, 112500, 54945, 141550, 67660, 41790, 872375, "+17%"]
-    ]
+    monthly_data, totals = forecast
+    drivers = [row[:len(REVENUE_PRODUCTS) + 1] for row in monthly_data]
+    totals_row = len(monthly_data) + 2
+
+    if live_formulas:
+        ws_inputs = wb.create_sheet("Assumptions")
+        for col_idx, header in enumerate(["Month"] + REVENUE_PRODUCTS, start=1):
+            cell = ws_inputs.cell(row=1, column=col_idx, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.border = thin_border
+        for row_idx, driver in enumerate(drivers, start=2):
+            for col_idx, value in enumerate(driver, start=1):
+                cell = ws_inputs.cell(row=row_idx, column=col_idx, value=value)
+                cell.border = thin_border
+                if col_idx >= 2:
+                    cell.number_format = currency_format
+        for col in range(1, len(REVENUE_PRODUCTS) + 2):
+            ws_inputs.column_dimensions[get_column_letter(col)].width = 15
+
+        monthly_data = [revenue_formula_row(row_idx) for row_idx in range(2, totals_row)]
+        totals = ["YEAR 1 TOTAL"] + [
+            f"=SUM({col}2:{col}{totals_row - 1})" for col in "BCDEFGHIJ"
+        ] + [""]
 
     for row_idx, row_data in enumerate(monthly_data, start=2):
         for col_idx, value in enumerate(row_data, start=1):
@@ -567,11 +251,12 @@ def create_revenue_forecast():
                 cell.number_format = currency_format
             if col_idx == 10:
                 cell.font = Font(bold=True)
+            if col_idx == 11 and live_formulas:
+                cell.number_format = growth_format
 
     # Totals row
-    totals = ["YEAR 1 TOTAL", 1869000, 270861, 230400, 577500, 298701, 779270, 337305, 217905, 4580942, ""]
     for col_idx, value in enumerate(totals, start=1):
-        cell = ws2.cell(row=14, column=col_idx, value=value)
+        cell = ws2.cell(row=totals_row, column=col_idx, value=value)
         cell.fill = total_fill
         cell.font = total_font
         cell.border = thin_border
@@ -644,11 +329,15 @@ def create_revenue_forecast():
         cell.font = header_font
         cell.border = thin_border
 
-    scenarios = [
-        ["Conservative", "-30%", 3206659],
-        ["Base Case", "This Forecast", 4580942],
-        ["Optimistic", "+40%", 6413319]
-    ]
+    year_total = totals[9]
+    scenarios = []
+    for name, adjustment in REVENUE_SCENARIOS:
+        label = f"{adjustment:+.0%}" if adjustment else "This Forecast"
+        if live_formulas:
+            revenue = f"=ROUND('Monthly Detail'!J{totals_row}*(1{adjustment:+}),0)"
+        else:
+            revenue = round(year_total * (1 + adjustment))
+        scenarios.append([name, label, revenue])
 
     for row_idx, row_data in enumerate(scenarios, start=4):
         for col_idx, value in enumerate(row_data, start=1):
@@ -663,16 +352,85 @@ def create_revenue_forecast():
     ws4.column_dimensions['B'].width = 15
     ws4.column_dimensions['C'].width = 18
 
-    wb.save(FORECAST_PATH)
-    print(f"Created: {FORECAST_PATH}")
+    return wb
+
+def verify_revenue_formulas(wb, forecast):
+    """Recompute the live-formula Monthly Detail sheet in Python and compare with the computed rows"""
+    evaluator = FormulaEvaluator.from_openpyxl(wb)
+    evaluator.calculate()
+
+    rows, totals = forecast
+    mismatches = []
+    for row_idx, expected in enumerate(rows + [totals], start=2):
+        coord = f"J{row_idx}"
+        actual = evaluator.value("Monthly Detail", coord)
+        if actual != expected[9]:
+            mismatches.append((f"Monthly Detail!{coord}", expected[9], actual))
+        growth = evaluator.value("Monthly Detail", f"K{row_idx}")
+        if expected[10].endswith("%") and f"{growth:+.0%}" != expected[10]:
+            mismatches.append((f"Monthly Detail!K{row_idx}", expected[10], growth))
+    return mismatches
+
+def create_revenue_forecast(live_formulas=False, use_cache=True, export_formats=(), export_dir=DESKTOP,
+                            output_path=FORECAST_PATH):
+    """Create Revenue Forecast Excel (compute and render stages are cached separately)"""
+    compute_cache = ContentCache("revenue-compute", enabled=use_cache)
+    render_cache = ContentCache("revenue-render", enabled=use_cache)
+
+    forecast_key = content_hash("revenue-forecast", REVENUE_FORECAST_VERSION, REVENUE_DRIVERS)
+    forecast = compute_cache.memoize(forecast_key, lambda: compute_revenue_forecast(REVENUE_DRIVERS))
+
+    render_key = content_hash("revenue-workbook", REVENUE_TEMPLATE_VERSION, forecast, live_formulas)
+    data = render_cache.get_bytes(render_key)
+    if data is None:
+        buffer = BytesIO()
+        build_revenue_forecast(forecast, live_formulas=live_formulas).save(buffer)
+        data = render_cache.put_bytes(render_key, buffer.getvalue())
+
+    written = write_if_changed(output_path, data)
+    print(f"{'Created' if written else 'Unchanged'}: {output_path}")
+    print(f"  Cache: {compute_cache.stats()}; {render_cache.stats()}")
+
+    if export_formats:
+        for path in export_frames({"revenue_monthly": revenue_frame(forecast)}, export_dir, export_formats):
+            print(f"Exported: {path}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create HireInbox partner documents")
+    parser.add_argument("--formulas", action="store_true",
+                        help="Emit Excel formulas for derived forecast columns with drivers on an Assumptions sheet")
+    parser.add_argument("--verify-formulas", action="store_true",
+                        help="Recompute the forecast formulas in Python and check totals, then exit")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-render the documents and recompute the forecast without the on-disk cache")
+    parser.add_argument("--export", type=parse_formats, default=[],
+                        help="Also write the monthly revenue table as columnar files: csv,parquet,arrow")
+    parser.add_argument("--output-dir", default=DESKTOP, help="Directory for the documents (default: Desktop)")
+    parser.add_argument("--export-dir", help="Directory for columnar exports (default: --output-dir)")
+    args = parser.parse_args()
+
+    if args.verify_formulas:
+        forecast = compute_revenue_forecast(REVENUE_DRIVERS)
+        mismatches = verify_revenue_formulas(build_revenue_forecast(forecast, live_formulas=True), forecast)
+        for ref, expected, actual in mismatches:
+            print(f"MISMATCH {ref}: expected {expected}, got {actual}")
+        print("Formula check failed" if mismatches else "Formula check passed")
+        sys.exit(1 if mismatches else 0)
+
     print("Creating HireInbox partner documents...")
-    create_prd_document()
-    create_market_size_document()
-    create_revenue_forecast()
+    output_paths = [os.path.join(args.output_dir, os.path.basename(path)) for path in (PRD_PATH, MARKET_PATH, FORECAST_PATH)]
+    create_prd_document(use_cache=not args.no_cache, output_path=output_paths[0])
+    create_market_size_document(use_cache=not args.no_cache, output_path=output_paths[1])
+    create_revenue_forecast(
+        live_formulas=args.formulas,
+        use_cache=not args.no_cache,
+        export_formats=args.export,
+        export_dir=args.export_dir or args.output_dir,
+        output_path=output_paths[2],
+    )
+    print(f"  Fragments: {TABLE_FRAGMENTS.stats()}")
     print("\nAll documents created successfully!")
-    print(f"\nFiles on Desktop:")
+    print(f"\nFiles in {args.output_dir}:")
     print(f"  - HIREINBOX_PRD_TECHNICAL.docx")
     print(f"  - HIREINBOX_MARKET_SIZE.docx")
     print(f"  - HIREINBOX_REVENUE_FORECAST_Y1.xlsx")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Template-driven DOCX generation for the HireInbox partner documents
+Content lives in scripts/templates/<name>.yaml. A template is compiled once
+(cached by its file hash), split into sections at every h1, and each section
+is rendered straight to WordprocessingML. Section XML is cached by a hash of
+its resolved content, so a rebuild only re-renders the sections that changed.
+
+Template format:
+    title: HIREINBOX - ...
+    context: {date: 25 January 2026}      # {name} placeholders, overridable
+    body:
+      - h1: 1. EXECUTIVE SUMMARY           # h1-h4
+      - p: "Date: {date}"
+      - lines: [first line, second line]   # one paragraph with line breaks
+      - table: {headers: [...], rows: [[...], ...]}
+      - blank                              # empty paragraph
+"""
+
+import re
+import sys
+from io import BytesIO
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from build_cache import ContentCache, content_hash, file_hash, write_if_changed
+from docx_helpers import base_template_key, cached_table_xml, new_document
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Bump when compilation or the block renderers change so cached XML is discarded
+ENGINE_VERSION = 1
+
+# Heading block -> level (0 is the document title)
+HEADING_KINDS = {"title": 0, "h1": 1, "h2": 2, "h3": 3, "h4": 4}
+BLOCK_KINDS = set(HEADING_KINDS) | {"p", "lines", "table", "blank"}
+PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Compiled templates already loaded in this process, by template key
+_compiled = {}
+
+
+def _compile(path):
+    try:
+        import yaml
+    except ImportError:
+        print("❌ Error: PyYAML not installed (needed for document templates)")
+        print("Install with: pip3 install pyyaml")
+        sys.exit(1)
+
+    spec = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    sections = [[["title", spec.get("title", "")]]]
+    for item in spec.get("body", []):
+        if isinstance(item, str):
+            kind, value = item, None
+        elif isinstance(item, dict) and len(item) == 1:
+            kind, value = next(iter(item.items()))
+        else:
+            raise ValueError(f"{path.name}: each body item needs exactly one block type, got {item!r}")
+        if kind not in BLOCK_KINDS:
+            raise ValueError(f"{path.name}: unknown block type {kind!r}")
+
+        if kind == "table":
+            value = [[str(cell) for cell in row] for row in [value["headers"]] + value["rows"]]
+        elif kind == "lines":
+            value = [str(line) for line in value]
+        elif value is not None:
+            value = str(value)
+
+        if kind == "h1" and sections[-1]:
+            sections.append([])
+        sections[-1].append([kind, value])
+
+    return {"context": spec.get("context") or {}, "sections": sections}
+
+
+def compile_template(path, cache):
+    """Compiled template {"context", "sections": [[[kind, value], ...], ...]}"""
+    path = Path(path)
+    key = content_hash("doc-template", ENGINE_VERSION, file_hash(path))
+    if key not in _compiled:
+        _compiled[key] = cache.memoize(key, lambda: _compile(path))
+    return _compiled[key]
+
+
+def fill(value, context):
+    """Substitute {name} placeholders in every string of value"""
+    if isinstance(value, list):
+        return [fill(item, context) for item in value]
+    if not isinstance(value, str):
+        return value
+
+    def lookup(match):
+        name = match.group(1)
+        if name not in context:
+            raise ValueError(f"Unknown template placeholder {{{name}}}")
+        return str(context[name])
+    return PLACEHOLDER_RE.sub(lookup, value)
+
+
+def document_layout(doc):
+    """Style ids and text width the rendered XML depends on (part of every section key)"""
+    styles = {
+        kind: doc.styles["Title" if level == 0 else f"Heading {level}"].style_id
+        for kind, level in HEADING_KINDS.items()
+    }
+    styles["table"] = doc.styles["Table Grid"].style_id
+    return {"base": base_template_key(), "block_width": doc._block_width, "styles": styles}
+
+
+def paragraph_xml(lines, style_id=None):
+    """w:p with one run; several lines are joined with w:br like add_run('...\\n')"""
+    ppr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ''
+    if not any(lines):
+        return f'<w:p>{ppr}</w:p>'
+    text = '<w:br/>'.join(f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines)
+    return f'<w:p>{ppr}<w:r>{text}</w:r></w:p>'
+
+
+def section_xml(blocks, layout):
+    """WordprocessingML for one section's blocks (body children, no wrapper)"""
+    styles = layout["styles"]
+    parts = []
+    for kind, value in blocks:
+        if kind in HEADING_KINDS:
+            parts.append(paragraph_xml([value], styles[kind]))
+        elif kind == "p":
+            parts.append(paragraph_xml([value]))
+        elif kind == "lines":
+            parts.append(paragraph_xml(value))
+        elif kind == "blank":
+            parts.append('<w:p/>')
+        else:
+            num_cols = max(len(row) for row in value)
+            col_width = layout["block_width"] // num_cols // 635
+            parts.append(cached_table_xml(value, num_cols, col_width, styles["table"], header_fill=None, inline=False))
+    return ''.join(parts)
+
+
+def render_template(name, output_path, context=None, use_cache=True):
+    """
+    Render templates/<name>.yaml to output_path. Returns (written, cache stats);
+    written is False when the output already had identical bytes.
+    """
+    template_cache = ContentCache("doc-templates", enabled=use_cache)
+    section_cache = ContentCache("doc-sections", enabled=use_cache)
+    render_cache = ContentCache("doc-render", enabled=use_cache)
+
+    template = compile_template(TEMPLATE_DIR / f"{name}.yaml", template_cache)
+    context = {**template["context"], **(context or {})}
+    sections = [fill(section, context) for section in template["sections"]]
+
+    doc = new_document()
+    layout = document_layout(doc)
+    keys = [content_hash("doc-section", ENGINE_VERSION, layout, section) for section in sections]
+
+    render_key = content_hash("doc-render", ENGINE_VERSION, keys)
+    data = render_cache.get_bytes(render_key)
+    if data is None:
+        body = doc.element.body
+        for section, key in zip(sections, keys):
+            xml = section_cache.get(key)
+            if xml is None:
+                xml = section_cache.put(key, section_xml(section, layout))
+            for element in list(parse_xml(f'<w:body {nsdecls("w", "r")}>{xml}</w:body>')):
+                body.insert_element_before(element, "w:sectPr")
+        buffer = BytesIO()
+        doc.save(buffer)
+        data = render_cache.put_bytes(render_key, buffer.getvalue())
+
+    written = write_if_changed(output_path, data)
+    stats = "; ".join(cache.stats() for cache in (template_cache, section_cache, render_cache))
+    return written, stats
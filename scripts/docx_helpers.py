@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Shared python-docx helpers for the HireInbox document generators
+Branded base template, hyperlinks, cell shading and a bulk table builder that
+emits the whole w:tbl as one XML string instead of going through
+table.cell(i, j) per cell.
+"""
+
+import copy
+import re
+from io import BytesIO
+from xml.sax.saxutils import escape, quoteattr
+
+import docx
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt, RGBColor
+from docx.table import Table
+
+from build_cache import ContentCache, FragmentCache, content_hash
+from md_blocks import Span, inline_spans
+
+HEADER_SHADING = 'E6E6E6'
+HYPERLINK_COLOR = '0563C1'
+CODE_FONT = 'Courier New'
+
+# Brand styles baked into the base template; bump BASE_TEMPLATE_VERSION when they change
+BASE_TEMPLATE_VERSION = 1
+BRAND_COLOR = RGBColor(0, 51, 102)
+TITLE_SIZE = 28
+HEADING_SIZES = {1: 20, 2: 16, 3: 14, 4: 12}
+
+# Base template loaded once per process; new_document() hands out deep copies
+_base_document = None
+
+# Rendered w:tbl XML keyed on table content, shared across documents, workers and runs
+TABLE_FRAGMENTS = FragmentCache('docx-tables', store=ContentCache('docx-tables'))
+LINK_PLACEHOLDER_RE = re.compile(r'<w:hyperlink r:id="link(\d+)">')
+
+
+def apply_brand_styles(doc):
+    """Title and Heading 1-4 in the HireInbox colours and sizes."""
+    styles = doc.styles
+
+    title_style = styles['Title']
+    title_style.font.size = Pt(TITLE_SIZE)
+    title_style.font.bold = True
+    title_style.font.color.rgb = BRAND_COLOR
+
+    for level, size in HEADING_SIZES.items():
+        h_style = styles[f'Heading {level}']
+        h_style.font.color.rgb = BRAND_COLOR
+        h_style.font.bold = True
+        h_style.font.size = Pt(size)
+
+
+def base_template_key():
+    """Cache key of the branded base template (changes with the brand styles or python-docx)."""
+    return content_hash('docx-base', BASE_TEMPLATE_VERSION, docx.__version__)
+
+
+def base_template_bytes(cache=None):
+    """The branded base .docx: stock template plus brand styles, built once and cached on disk."""
+    cache = cache or ContentCache('docx-base')
+    key = base_template_key()
+    data = cache.get_bytes(key)
+    if data is None:
+        doc = Document()
+        apply_brand_styles(doc)
+        buffer = BytesIO()
+        doc.save(buffer)
+        data = cache.put_bytes(key, buffer.getvalue())
+    return data
+
+
+def new_document():
+    """
+    A fresh Document with the brand styles already applied. The base template
+    is parsed once per process and cloned, instead of reloading the stock
+    template and restyling it for every document.
+    """
+    global _base_document
+    if _base_document is None:
+        _base_document = Document(BytesIO(base_template_bytes()))
+    return copy.deepcopy(_base_document)
+
+
+def add_hyperlink(paragraph, url, text):
+    """Add a hyperlink to a paragraph."""
+    part = paragraph.part
+    r_id = part.relate_to(url, RT.HYPERLINK, is_external=True)
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+    new_run = OxmlElement('w:r')
+    rPr = OxmlElement('w:rPr')
+    c = OxmlElement('w:color')
+    c.set(qn('w:val'), HYPERLINK_COLOR)
+    rPr.append(c)
+    u = OxmlElement('w:u')
+    u.set(qn('w:val'), 'single')
+    rPr.append(u)
+    new_run.append(rPr)
+    new_run.text = text
+    hyperlink.append(new_run)
+    paragraph._p.append(hyperlink)
+    return hyperlink
+
+
+def shading_xml(color):
+    """w:shd markup for a cell background color (shared by both table paths)."""
+    return f'<w:shd {nsdecls("w")} w:fill="{color}"/>'
+
+
+def set_cell_shading(cell, color):
+    """Set cell background color."""
+    cell._tc.get_or_add_tcPr().append(parse_xml(shading_xml(color)))
+
+
+def run_xml(span, part=None):
+    """One w:r (or w:hyperlink around it) for an inline Span."""
+    props = []
+    if span.code:
+        props.append(f'<w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}"/>')
+    if span.bold:
+        props.append('<w:b/>')
+    if span.italic:
+        props.append('<w:i/>')
+    if span.url and part is not None:
+        props.append(f'<w:color w:val="{HYPERLINK_COLOR}"/><w:u w:val="single"/>')
+    rpr = f'<w:rPr>{"".join(props)}</w:rPr>' if props else ''
+    run = f'<w:r>{rpr}<w:t xml:space="preserve">{escape(span.text)}</w:t></w:r>'
+    if span.url and part is not None:
+        r_id = part.relate_to(span.url, RT.HYPERLINK, is_external=True)
+        return f'<w:hyperlink r:id={quoteattr(r_id)}>{run}</w:hyperlink>'
+    return run
+
+
+def table_xml(rows, num_cols, col_width, style_id, part=None, header_fill=HEADER_SHADING, inline=True):
+    """
+    The complete w:tbl for rows (rows[0] is the header) as a single string.
+    Cost is linear in the number of cells.
+    """
+    header_shading = shading_xml(header_fill) if header_fill else ''
+    grid = f'<w:gridCol w:w="{col_width}"/>' * num_cols
+    empty_cell = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr><w:p/></w:tc>'
+
+    parts = [
+        f'<w:tbl {nsdecls("w", "r")}><w:tblPr><w:tblStyle w:val="{style_id}"/>'
+        '<w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        f'</w:tblPr><w:tblGrid>{grid}</w:tblGrid>'
+    ]
+    for i, row in enumerate(rows):
+        header = i == 0
+        parts.append('<w:tr>')
+        for cell in row[:num_cols]:
+            text = str(cell)
+            spans = inline_spans(text, bold=header) if inline else [Span(text, header)]
+            shading = header_shading if header else ''
+            parts.append(
+                f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/>{shading}</w:tcPr>'
+                f'<w:p>{"".join(run_xml(span, part) for span in spans)}</w:p></w:tc>'
+            )
+        parts.append(empty_cell * (num_cols - len(row)))
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+    return ''.join(parts)
+
+
+class LinkRecorder:
+    """Stands in for a part while rendering a cacheable fragment: records URLs instead of relating them."""
+
+    def __init__(self):
+        self.urls = []
+
+    def relate_to(self, url, reltype, is_external=False):
+        self.urls.append(url)
+        return f'link{len(self.urls) - 1}'
+
+
+def cached_table_xml(rows, num_cols, col_width, style_id, part=None, header_fill=HEADER_SHADING, inline=True):
+    """
+    table_xml() through TABLE_FRAGMENTS. Fragments are document-independent:
+    hyperlinks are stored as placeholders and related to part on every use.
+    """
+    key = content_hash('docx-table', rows, num_cols, col_width, style_id, part is not None, header_fill, inline)
+    fragment = TABLE_FRAGMENTS.get(key)
+    if fragment is None:
+        recorder = LinkRecorder() if part is not None else None
+        xml = table_xml(rows, num_cols, col_width, style_id, recorder, header_fill, inline)
+        fragment = TABLE_FRAGMENTS.put(key, (xml, recorder.urls if recorder else []))
+
+    xml, urls = fragment
+    if not urls:
+        return xml
+    r_ids = [part.relate_to(url, RT.HYPERLINK, is_external=True) for url in urls]
+    return LINK_PLACEHOLDER_RE.sub(lambda m: f'<w:hyperlink r:id={quoteattr(r_ids[int(m.group(1))])}>', xml)
+
+
+def build_table(doc, rows, style='Table Grid', header_fill=HEADER_SHADING, inline=True):
+    """
+    Append a table to doc in one pass. rows[0] is the header row (bold,
+    optionally shaded); with inline=True cell text is parsed for Markdown
+    inline formatting.
+    """
+    num_cols = max(len(row) for row in rows)
+    col_width = doc._block_width // num_cols // 635  # EMU -> twips, as python-docx does
+    style_id = doc.styles[style].style_id
+    xml = cached_table_xml(rows, num_cols, col_width, style_id, doc.part, header_fill, inline)
+    tbl = parse_xml(xml)
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Streaming DOCX writer for very large Markdown documents
+python-docx keeps the whole document tree in memory until save(). This writer
+copies the branded base template's parts into the output zip and streams
+word/document.xml into it instead: each block is rendered to an XML string,
+buffered for the current section and flushed to the compressed zip entry at
+every H1/H2 (or once the buffer passes FLUSH_BYTES). Memory stays bounded by
+the largest section, whatever the length of the document.
+
+Output matches md-to-docx.py's DocxWriter block for block.
+"""
+
+import re
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape, quoteattr
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from docx_helpers import CODE_FONT, HEADER_SHADING, base_template_bytes, cached_table_xml, new_document, run_xml
+from md_blocks import BlockWriter, inline_spans, is_title
+
+DOCUMENT_PART = "word/document.xml"
+RELS_PART = "word/_rels/document.xml.rels"
+
+# Flush the section buffer early if a single section grows past this
+FLUSH_BYTES = 1 << 20
+# Headings at or above this level start a new section (flush point)
+SECTION_LEVEL = 2
+
+CODE_SIZE = 18  # half-points: 9pt, as DocxWriter.on_code
+RULE_TEXT = "_" * 50
+STYLE_NAMES = ["Title", "Heading 1", "Heading 2", "Heading 3", "Heading 4",
+               "List Bullet", "List Number", "No Spacing", "Table Grid"]
+
+
+class Relationships:
+    """Hyperlink relationships of the streamed document part; stands in for the part in run_xml()"""
+
+    def __init__(self, first_id):
+        self.next_id = first_id
+        self.links = {}
+
+    def relate_to(self, target, reltype, is_external=False):
+        if target not in self.links:
+            self.links[target] = f"rId{self.next_id}"
+            self.next_id += 1
+        return self.links[target]
+
+    def xml(self):
+        return "".join(
+            f'<Relationship Id="{r_id}" Type="{RT.HYPERLINK}" Target={quoteattr(url)} TargetMode="External"/>'
+            for url, r_id in self.links.items()
+        )
+
+
+def text_run_xml(text, rpr=""):
+    """w:r for literal text; newlines and tabs become w:br / w:tab like python-docx's run.text"""
+    pieces = []
+    for piece in re.split(r"(\n|\t)", text):
+        if piece == "\n":
+            pieces.append("<w:br/>")
+        elif piece == "\t":
+            pieces.append("<w:tab/>")
+        elif piece:
+            pieces.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return f"<w:r>{rpr}{''.join(pieces)}</w:r>"
+
+
+def paragraph_xml(runs="", style_id=None):
+    ppr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ""
+    return f"<w:p>{ppr}{runs}</w:p>"
+
+
+class StreamingDocxWriter(BlockWriter):
+    """DOCX backend that writes the document part incrementally (large-document mode)"""
+
+    def __init__(self, output_path, flush_bytes=FLUSH_BYTES):
+        self.flush_bytes = flush_bytes
+        layout = new_document()
+        self.styles = {name: layout.styles[name].style_id for name in STYLE_NAMES}
+        self.block_width = layout._block_width
+
+        self.zip = zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED)
+        with zipfile.ZipFile(BytesIO(base_template_bytes())) as template:
+            document = template.read(DOCUMENT_PART).decode("utf-8")
+            self.rels = template.read(RELS_PART).decode("utf-8")
+            for item in template.infolist():
+                if item.filename not in (DOCUMENT_PART, RELS_PART):
+                    self.zip.writestr(item, template.read(item.filename))
+
+        # The base body holds only the final w:sectPr, which must stay last
+        head, body = document.split("<w:body>", 1)
+        self.tail = body[:body.rindex("</w:body>")] + "</w:body></w:document>"
+        used_ids = [int(n) for n in re.findall(r'Id="rId(\d+)"', self.rels)]
+        self.relationships = Relationships(max(used_ids, default=0) + 1)
+
+        self.stream = self.zip.open(DOCUMENT_PART, "w", force_zip64=True)
+        self.stream.write(f"{head}<w:body>".encode("utf-8"))
+        self.buffer = []
+        self.buffered = 0
+        self.table_rows = []
+
+    def flush(self):
+        """Write the buffered section to the compressed zip entry"""
+        if self.buffer:
+            self.stream.write("".join(self.buffer).encode("utf-8"))
+            self.buffer = []
+            self.buffered = 0
+
+    def add(self, xml):
+        self.buffer.append(xml)
+        self.buffered += len(xml)
+        if self.buffered >= self.flush_bytes:
+            self.flush()
+
+    def inline_paragraph(self, text, style_id=None):
+        runs = "".join(run_xml(span, self.relationships) for span in inline_spans(text))
+        self.add(paragraph_xml(runs, style_id))
+
+    def on_heading(self, block):
+        level = 0 if is_title(block) else block.level
+        if level <= SECTION_LEVEL:
+            self.flush()
+        style = self.styles["Title" if level == 0 else f"Heading {level}"]
+        self.add(paragraph_xml(text_run_xml(block.text), style))
+
+    def on_paragraph(self, block):
+        if block.text.strip():
+            self.inline_paragraph(block.text)
+
+    def on_list_item(self, block):
+        self.inline_paragraph(block.text, self.styles["List Number" if block.ordered else "List Bullet"])
+
+    def on_code(self, block):
+        rpr = f'<w:rPr><w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}"/><w:sz w:val="{CODE_SIZE}"/></w:rPr>'
+        self.add(paragraph_xml(text_run_xml(block.text, rpr), self.styles["No Spacing"]))
+
+    def on_rule(self, block):
+        self.add(paragraph_xml(text_run_xml(RULE_TEXT)))
+
+    def on_table_start(self, block):
+        self.table_rows = []
+
+    def on_table_row(self, block):
+        self.table_rows.append(block.cells)
+
+    def on_table_end(self, block):
+        if self.table_rows:
+            num_cols = max(len(row) for row in self.table_rows)
+            col_width = self.block_width // num_cols // 635
+            self.add(cached_table_xml(self.table_rows, num_cols, col_width, self.styles["Table Grid"],
+                                      self.relationships, HEADER_SHADING))
+            self.add(paragraph_xml())
+        self.table_rows = []
+
+    def close(self):
+        self.flush()
+        self.stream.write(self.tail.encode("utf-8"))
+        self.stream.close()
+        rels = self.rels.replace("</Relationships>", f"{self.relationships.xml()}</Relationships>")
+        self.zip.writestr(RELS_PART, rels)
+        self.zip.close()
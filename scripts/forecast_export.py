@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Columnar export of the HireInbox forecast tables (CSV / Parquet / Arrow)
+Typed columns for BI tooling: months as dates, amounts as integer cents.
+Frames are built column-wise with pandas, never cell by cell.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+EXPORT_FORMATS = ("csv", "parquet", "arrow")
+
+
+def forecast_frame(rows, columns, month_column, amount_columns):
+    """
+    Typed DataFrame from computed forecast rows.
+
+    month_column ("Feb 2026" labels) becomes a date and amount_columns become
+    int64 cents, renamed with a _cents suffix.
+    """
+    df = pd.DataFrame(rows, columns=columns)
+    df[month_column] = pd.to_datetime(df[month_column], format="%b %Y")
+    df[amount_columns] = (df[amount_columns].astype("float64") * 100).round().astype("int64")
+    return df.rename(columns={col: f"{col}_cents" for col in amount_columns})
+
+
+def parse_formats(value):
+    """'csv,parquet' -> ['csv', 'parquet'] with validation"""
+    formats = [f.strip().lower() for f in value.split(",") if f.strip()]
+    unknown = set(formats) - set(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(sorted(unknown))}")
+    return formats
+
+
+def arrow_table(df):
+    """pyarrow Table with month timestamps stored as date32"""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema = pa.schema([
+        field.with_type(pa.date32()) if pa.types.is_timestamp(field.type) else field
+        for field in table.schema
+    ])
+    return table.cast(schema)
+
+
+def export_frames(frames, output_dir, formats):
+    """Write each named DataFrame in every requested format; returns written paths"""
+    if {"parquet", "arrow"} & set(formats):
+        try:
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("❌ Error: pyarrow not installed (needed for Parquet/Arrow export)")
+            print("Install with: pip3 install pyarrow")
+            sys.exit(1)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, df in frames.items():
+        for fmt in formats:
+            path = output_dir / f"{name}.{fmt}"
+            if fmt == "csv":
+                df.to_csv(path, index=False, date_format="%Y-%m-%d")
+            elif fmt == "parquet":
+                pq.write_table(arrow_table(df), path)
+            else:
+                feather.write_feather(arrow_table(df), path)
+            written.append(path)
+    return written
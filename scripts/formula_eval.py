@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Minimal Excel formula evaluator for the HireInbox forecast workbooks
+Recomputes formula cells in dependency order so totals can be checked in CI
+without opening Excel. Recalculation after an input change is incremental:
+only cells downstream of the changed input are recomputed.
+
+Supported: numbers, strings, booleans, cell refs (with optional sheet prefix),
+ranges, + - * / ^ & %, comparisons and SUM/MIN/MAX/AVERAGE/COUNT/IF/IFERROR/
+ROUND/ABS/AND/OR/NOT.
+"""
+
+import re
+from collections import defaultdict, deque
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+
+class FormulaError(Exception):
+    """Raised for formulas that cannot be parsed or graphs that contain cycles"""
+
+
+class ErrorValue:
+    """An Excel error value (#DIV/0!, #VALUE!, ...) that propagates through formulas"""
+
+    def __init__(self, code):
+        self.code = code
+
+    def __eq__(self, other):
+        return isinstance(other, ErrorValue) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+    def __repr__(self):
+        return self.code
+
+
+DIV0 = ErrorValue("#DIV/0!")
+VALUE = ErrorValue("#VALUE!")
+NAME = ErrorValue("#NAME?")
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<func>[A-Za-z][A-Za-z0-9\.]*(?=\())
+  | (?P<ref>(?:(?:'(?:[^']|'')+'|[A-Za-z_][\w\.]*)!)?\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)
+  | (?P<bool>TRUE|FALSE)
+  | (?P<op><>|<=|>=|[-+*/^&%=<>(),])
+""", re.VERBOSE | re.IGNORECASE)
+
+CELL_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?(\d+)")
+
+
+def normalize_coord(coord):
+    """'$b$3' -> 'B3'"""
+    match = CELL_RE.fullmatch(coord.strip())
+    if not match:
+        raise FormulaError(f"Bad cell reference: {coord}")
+    return f"{match.group(1).upper()}{match.group(2)}"
+
+
+def split_ref(ref, default_sheet):
+    """Split "'Sheet'!A1:B2" into (sheet, 'A1', 'B2' or None)"""
+    sheet = default_sheet
+    if "!" in ref:
+        sheet, ref = ref.rsplit("!", 1)
+        if sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+    start, _, end = ref.partition(":")
+    return sheet, normalize_coord(start), normalize_coord(end) if end else None
+
+
+def expand_range(sheet, start, end):
+    """All cell keys in a rectangular range, row-major"""
+    c1, r1 = CELL_RE.fullmatch(start).groups()
+    c2, r2 = CELL_RE.fullmatch(end).groups()
+    col_lo, col_hi = sorted((column_index_from_string(c1), column_index_from_string(c2)))
+    row_lo, row_hi = sorted((int(r1), int(r2)))
+    return [
+        (sheet, f"{get_column_letter(col)}{row}")
+        for row in range(row_lo, row_hi + 1)
+        for col in range(col_lo, col_hi + 1)
+    ]
+
+
+def tokenize(formula):
+    """Split a formula body (without the leading '=') into (kind, text) tokens"""
+    tokens = []
+    pos = 0
+    while pos < len(formula):
+        match = TOKEN_RE.match(formula, pos)
+        if not match:
+            raise FormulaError(f"Unexpected character at {pos} in ={formula}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+# ============== PARSER ==============
+# Recursive descent producing tuples: ("num", v), ("str", v), ("ref", key),
+# ("range", [keys]), ("call", name, [args]), ("neg", node), ("pct", node),
+# ("bin", op, left, right)
+
+BINARY_LEVELS = [
+    {"=", "<>", "<", ">", "<=", ">="},
+    {"&"},
+    {"+", "-"},
+    {"*", "/"},
+    {"^"},
+]
+
+
+class Parser:
+    def __init__(self, formula, sheet):
+        self.tokens = tokenize(formula)
+        self.pos = 0
+        self.sheet = sheet
+        self.formula = formula
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, text=None):
+        kind, value = self.peek()
+        if kind is None or (text is not None and value != text):
+            raise FormulaError(f"Expected {text or 'token'} in ={self.formula}")
+        self.pos += 1
+        return kind, value
+
+    def parse(self):
+        node = self.binary(0)
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"Trailing input in ={self.formula}")
+        return node
+
+    def binary(self, level):
+        if level == len(BINARY_LEVELS):
+            return self.unary()
+        node = self.binary(level + 1)
+        while True:
+            kind, value = self.peek()
+            if kind != "op" or value not in BINARY_LEVELS[level]:
+                return node
+            self.pos += 1
+            node = ("bin", value, node, self.binary(level + 1))
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == "op" and value in ("-", "+"):
+            self.pos += 1
+            operand = self.unary()
+            return ("neg", operand) if value == "-" else operand
+        node = self.primary()
+        while self.peek() == ("op", "%"):
+            self.pos += 1
+            node = ("pct", node)
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == "number":
+            return ("num", float(value) if "." in value or "e" in value.lower() else int(value))
+        if kind == "string":
+            return ("str", value[1:-1].replace('""', '"'))
+        if kind == "bool":
+            return ("num", value.upper() == "TRUE")
+        if kind == "ref":
+            sheet, start, end = split_ref(value, self.sheet)
+            if end:
+                return ("range", expand_range(sheet, start, end))
+            return ("ref", (sheet, start))
+        if kind == "func":
+            self.take("(")
+            args = []
+            if self.peek() != ("op", ")"):
+                args.append(self.binary(0))
+                while self.peek() == ("op", ","):
+                    self.pos += 1
+                    args.append(self.binary(0))
+            self.take(")")
+            return ("call", value.upper(), args)
+        if (kind, value) == ("op", "("):
+            node = self.binary(0)
+            self.take(")")
+            return node
+        raise FormulaError(f"Unexpected {value!r} in ={self.formula}")
+
+
+def collect_refs(node, refs):
+    """Gather every cell key a parsed formula reads"""
+    tag = node[0]
+    if tag == "ref":
+        refs.add(node[1])
+    elif tag == "range":
+        refs.update(node[1])
+    elif tag == "call":
+        for arg in node[2]:
+            collect_refs(arg, refs)
+    elif tag in ("neg", "pct"):
+        collect_refs(node[1], refs)
+    elif tag == "bin":
+        collect_refs(node[2], refs)
+        collect_refs(node[3], refs)
+    return refs
+
+
+# ============== EVALUATION ==============
+
+def to_number(value):
+    if isinstance(value, ErrorValue):
+        return value
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return VALUE
+
+
+def to_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def numbers_in(values):
+    """Numeric values from function arguments; text and blanks are ignored like Excel"""
+    for value in values:
+        if isinstance(value, ErrorValue):
+            raise _Propagate(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield value
+
+
+class _Propagate(Exception):
+    def __init__(self, error):
+        self.error = error
+
+
+def flatten(args):
+    for arg in args:
+        if isinstance(arg, list):
+            yield from arg
+        else:
+            yield arg
+
+
+def _average(values):
+    nums = list(numbers_in(values))
+    return sum(nums) / len(nums) if nums else DIV0
+
+
+FUNCTIONS = {
+    "SUM": lambda args: sum(numbers_in(flatten(args))),
+    "MIN": lambda args: min(numbers_in(flatten(args)), default=0),
+    "MAX": lambda args: max(numbers_in(flatten(args)), default=0),
+    "AVERAGE": lambda args: _average(flatten(args)),
+    "COUNT": lambda args: sum(1 for _ in numbers_in(flatten(args))),
+    "AND": lambda args: all(flatten(args)),
+    "OR": lambda args: any(flatten(args)),
+    "NOT": lambda args: not args[0],
+    "ABS": lambda args: abs(to_number(args[0])),
+    "ROUND": lambda args: round(to_number(args[0]), int(to_number(args[1])) if len(args) > 1 else 0),
+}
+
+COMPARE = {
+    "=": lambda a, b: a == b,
+    "<>": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def binary_op(op, left, right):
+    if isinstance(left, ErrorValue):
+        return left
+    if isinstance(right, ErrorValue):
+        return right
+    if op == "&":
+        return to_text(left) + to_text(right)
+    if op in COMPARE:
+        if isinstance(left, str) or isinstance(right, str):
+            return COMPARE[op](to_text(left).lower(), to_text(right).lower())
+        return COMPARE[op](to_number(left), to_number(right))
+    a, b = to_number(left), to_number(right)
+    if isinstance(a, ErrorValue):
+        return a
+    if isinstance(b, ErrorValue):
+        return b
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op == "*":
+        return a * b
+    if op == "/":
+        return DIV0 if b == 0 else a / b
+    if op == "^":
+        return a ** b
+    raise FormulaError(f"Unknown operator {op}")
+
+
+def evaluate_node(node, get):
+    """Evaluate a parsed formula; get(key) returns the current value of a cell"""
+    tag = node[0]
+    if tag in ("num", "str"):
+        return node[1]
+    if tag == "ref":
+        return get(node[1])
+    if tag == "range":
+        return [get(key) for key in node[1]]
+    if tag == "neg":
+        value = to_number(evaluate_node(node[1], get))
+        return value if isinstance(value, ErrorValue) else -value
+    if tag == "pct":
+        value = to_number(evaluate_node(node[1], get))
+        return value if isinstance(value, ErrorValue) else value / 100
+    if tag == "bin":
+        return binary_op(node[1], evaluate_node(node[2], get), evaluate_node(node[3], get))
+
+    name, args = node[1], node[2]
+    # IF and IFERROR are lazy in the branch they do not take
+    if name == "IF":
+        condition = evaluate_node(args[0], get)
+        if isinstance(condition, ErrorValue):
+            return condition
+        if condition:
+            return evaluate_node(args[1], get) if len(args) > 1 else True
+        return evaluate_node(args[2], get) if len(args) > 2 else False
+    if name == "IFERROR":
+        value = evaluate_node(args[0], get)
+        return evaluate_node(args[1], get) if isinstance(value, ErrorValue) else value
+    if name not in FUNCTIONS:
+        return NAME
+    values = [evaluate_node(arg, get) for arg in args]
+    try:
+        return FUNCTIONS[name](values)
+    except _Propagate as exc:
+        return exc.error
+
+
+# ============== WORKBOOK MODEL ==============
+
+class FormulaEvaluator:
+    """Dependency-ordered evaluator over a set of (sheet, coord) cells"""
+
+    def __init__(self):
+        self.inputs = {}
+        self.formulas = {}
+        self.values = {}
+        self.precedents = {}
+        self.dependents = defaultdict(set)
+        self.order = None
+        self.recalculated = 0
+
+    @classmethod
+    def from_openpyxl(cls, wb):
+        """Load every non-empty cell of an openpyxl workbook"""
+        evaluator = cls()
+        for ws in wb.worksheets:
+            for row in ws.iter_rows():
+                for cell in row:
+                    if cell.value is not None:
+                        evaluator.set_cell(ws.title, cell.coordinate, cell.value)
+        return evaluator
+
+    def set_cell(self, sheet, coord, value):
+        """Define a cell as an input value or, when it starts with '=', a formula"""
+        key = (sheet, normalize_coord(coord))
+        for ref in self.precedents.pop(key, ()):
+            self.dependents[ref].discard(key)
+        was_formula = self.formulas.pop(key, None) is not None
+        self.inputs.pop(key, None)
+
+        if isinstance(value, str) and value.startswith("="):
+            node = Parser(value[1:], sheet).parse()
+            self.formulas[key] = node
+            self.precedents[key] = collect_refs(node, set())
+            for ref in self.precedents[key]:
+                self.dependents[ref].add(key)
+        else:
+            self.inputs[key] = value
+            self.values[key] = value
+        # The order only covers formula cells: plain value changes keep it
+        if was_formula or key in self.formulas:
+            self.order = None
+        return key
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _topological_order(self):
+        """Formula cells sorted so every cell follows its precedents (Kahn)"""
+        pending = {
+            key: sum(1 for ref in refs if ref in self.formulas)
+            for key, refs in self.precedents.items()
+        }
+        ready = deque(sorted(key for key, count in pending.items() if count == 0))
+        order = []
+        while ready:
+            key = ready.popleft()
+            order.append(key)
+            for dependent in sorted(self.dependents.get(key, ())):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.formulas):
+            cyclic = sorted(key for key, count in pending.items() if count > 0)
+            raise FormulaError(f"Circular reference involving: {cyclic[:5]}")
+        return order
+
+    def _ensure_order(self):
+        if self.order is None:
+            ordered = self._topological_order()
+            self.order = {key: index for index, key in enumerate(ordered)}
+        return self.order
+
+    def _recompute(self, keys):
+        for key in keys:
+            self.values[key] = evaluate_node(self.formulas[key], self._get)
+        self.recalculated += len(keys)
+
+    def calculate(self):
+        """Full recalculation of every formula cell in dependency order"""
+        order = self._ensure_order()
+        self._recompute(sorted(order, key=order.get))
+        return self.values
+
+    def set_value(self, sheet, coord, value):
+        """Change a cell and recompute only its downstream formulas; returns recomputed keys"""
+        key = self.set_cell(sheet, coord, value)
+        order = self._ensure_order()
+
+        dirty = {key} if key in self.formulas else set()
+        queue = deque([key])
+        while queue:
+            for dependent in self.dependents.get(queue.popleft(), ()):
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    queue.append(dependent)
+
+        affected = sorted(dirty, key=order.get)
+        self._recompute(affected)
+        return affected
+
+    def value(self, sheet, coord):
+        return self.values.get((sheet, normalize_coord(coord)))
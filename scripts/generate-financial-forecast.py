@@ -10,14 +10,33 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from io import BytesIO
+from itertools import product
+from pathlib import Path
+import argparse
+import json
 import os
+import sys
+
+from billing_actuals import connect, fetch_monthly_actuals, segment_totals
+from build_cache import ContentCache, content_hash, file_hash, write_if_changed
+from formula_eval import FormulaEvaluator
+from forecast_export import export_frames, forecast_frame, parse_formats
 
 # Output path
 OUTPUT_PATH = "/Users/simon/Desktop/hireinbox/HIREINBOX_18_Month_Forecast.xlsx"
+OUTPUT_STEM = "HIREINBOX_18_Month_Forecast"
+
+# Batch mode keeps a record of what it built next to the workbooks
+BATCH_MANIFEST = ".forecast-manifest.json"
+SCENARIO_MULTIPLIERS = ("expenses", "b2b_revenue", "b2c_revenue")
 
-# Create workbook
-wb = Workbook()
+# Cache keys: bump FORECAST_VERSION when compute_monthly_forecast() changes and
+# TEMPLATE_VERSION when the layout or styling of the rendered workbook changes
+FORECAST_VERSION = 1
+TEMPLATE_VERSION = 2
 
 # Styles
 header_font = Font(bold=True, size=12, color="FFFFFF")
@@ -55,214 +74,551 @@ def auto_column_width(ws):
         adjusted_width = min(max_length + 2, 20)
         ws.column_dimensions[column_letter].width = adjusted_width
 
-# ============== SHEET 1: SUMMARY ==============
-ws_summary = wb.active
-ws_summary.title = "Summary"
-
-# Title
-ws_summary['A1'] = "HIREINBOX - 18 Month Financial Forecast"
-ws_summary['A1'].font = Font(bold=True, size=16)
-ws_summary['A2'] = "February 2026 - July 2027 | All figures ex VAT"
-ws_summary['A2'].font = Font(italic=True, size=11)
-ws_summary['A3'] = f"Generated: {datetime.now().strftime('%d %B %Y')}"
-
-# Key Metrics
-ws_summary['A5'] = "KEY METRICS"
-ws_summary['A5'].font = Font(bold=True, size=14)
-
-metrics = [
-    ["Metric", "Value"],
-    ["Total Investment Required", "R 5,500,000"],
-    ["Build Phase Cost", "R 1,358,000"],
-    ["Monthly Burn (Post-Launch)", "R 404,000"],
-    ["Break-Even Month", "Month 17 (Jun 2027)"],
-    ["Month 18 Revenue", "R 485,000"],
-    ["Month 18 Profit", "R 81,000"],
-]
-
-for i, row in enumerate(metrics):
-    ws_summary.cell(row=6+i, column=1, value=row[0]).border = thin_border
-    ws_summary.cell(row=6+i, column=2, value=row[1]).border = thin_border
-    if i == 0:
-        ws_summary.cell(row=6+i, column=1).font = Font(bold=True)
-        ws_summary.cell(row=6+i, column=2).font = Font(bold=True)
-
-# ============== SHEET 2: MONTHLY FORECAST ==============
-ws_monthly = wb.create_sheet("Monthly Forecast")
-
-# Headers
-headers = ["Month", "Date", "Phase", "Expenses", "B2B Revenue", "B2C Revenue", "Total Revenue", "Net P/L", "Cumulative"]
-for col, header in enumerate(headers, 1):
-    ws_monthly.cell(row=1, column=col, value=header)
-style_header_row(ws_monthly, 1, len(headers))
-
-# Data
-monthly_data = [
-    [1, "Feb 2026", "Build", 433333, 0, 0, 0, -433333, -433333],
-    [2, "Mar 2026", "Build", 378333, 0, 0, 0, -378333, -811666],
-    [3, "Apr 2026", "Build", 546333, 0, 0, 0, -546333, -1358000],
-    [4, "May 2026", "Launch", 324000, 8750, 3000, 11750, -312250, -1670250],
-    [5, "Jun 2026", "Grow", 324000, 17500, 6000, 23500, -300500, -1970750],
-    [6, "Jul 2026", "Grow", 404000, 43750, 14415, 58165, -345835, -2316585],
-    [7, "Aug 2026", "Grow", 404000, 61250, 18000, 79250, -324750, -2641335],
-    [8, "Sep 2026", "Grow", 404000, 78750, 22000, 100750, -303250, -2944585],
-    [9, "Oct 2026", "Grow", 404000, 105000, 28000, 133000, -271000, -3215585],
-    [10, "Nov 2026", "Grow", 404000, 131250, 35000, 166250, -237750, -3453335],
-    [11, "Dec 2026", "Grow", 404000, 148750, 40000, 188750, -215250, -3668585],
-    [12, "Jan 2027", "Grow", 404000, 175000, 48000, 223000, -181000, -3849585],
-    [13, "Feb 2027", "Grow", 404000, 201250, 55000, 256250, -147750, -3997335],
-    [14, "Mar 2027", "Grow", 404000, 227500, 62000, 289500, -114500, -4111835],
-    [15, "Apr 2027", "Grow", 404000, 262500, 70000, 332500, -71500, -4183335],
-    [16, "May 2027", "Grow", 404000, 297500, 78000, 375500, -28500, -4211835],
-    [17, "Jun 2027", "Grow", 404000, 341250, 88000, 429250, 25250, -4186585],
-    [18, "Jul 2027", "Grow", 404000, 385000, 100000, 485000, 81000, -4105585],
-]
-
-for row_idx, row_data in enumerate(monthly_data, 2):
-    for col_idx, value in enumerate(row_data, 1):
-        cell = ws_monthly.cell(row=row_idx, column=col_idx, value=value)
-        cell.border = thin_border
-        # Format currency columns
-        if col_idx >= 4:
-            cell.number_format = currency_format_neg
-        # Highlight break-even row
-        if row_data[0] == 17:
-            cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-
-auto_column_width(ws_monthly)
-
-# ============== SHEET 3: B2B PRICING ==============
-ws_b2b = wb.create_sheet("B2B Pricing (ex VAT)")
-
-ws_b2b['A1'] = "B2B PRICING - All prices ex VAT"
-ws_b2b['A1'].font = Font(bold=True, size=14)
-
-b2b_headers = ["Product", "Price", "Unit", "Description"]
-for col, header in enumerate(b2b_headers, 1):
-    ws_b2b.cell(row=3, column=col, value=header)
-style_header_row(ws_b2b, 3, len(b2b_headers))
-
-b2b_products = [
-    ["CV Screening", "R 1,750", "per role", "Unlimited CVs per role, AI scoring & ranking"],
-    ["ID Verification", "R 50", "per candidate", "Verify candidate identity"],
-    ["Credit Check", "R 100", "per candidate", "Financial background verification"],
-    ["Criminal Check", "R 150", "per candidate", "Criminal record verification"],
-    ["AI Interview + Psychometric", "R 750", "per candidate", "Avatar interview with full analysis"],
-    ["Job Listing (Phase 2)", "R 2,500", "per listing", "Post job publicly to attract candidates"],
-    ["Subscription Starter (Phase 3)", "R 5,000", "per month", "Up to 10 roles/month"],
-    ["Subscription Pro (Phase 3)", "R 10,000", "per month", "Up to 25 roles/month"],
-    ["Subscription Enterprise (Phase 3)", "R 15,000", "per month", "Unlimited roles + support"],
-    ["Boutique AI Agent", "R 20,000", "per month", "Custom-trained AI for your company"],
-]
-
-for row_idx, row_data in enumerate(b2b_products, 4):
-    for col_idx, value in enumerate(row_data, 1):
-        cell = ws_b2b.cell(row=row_idx, column=col_idx, value=value)
-        cell.border = thin_border
-
-auto_column_width(ws_b2b)
-
-# ============== SHEET 4: B2C PRICING ==============
-ws_b2c = wb.create_sheet("B2C Pricing (ex VAT)")
-
-ws_b2c['A1'] = "B2C PRICING - All prices ex VAT"
-ws_b2c['A1'].font = Font(bold=True, size=14)
-
-b2c_headers = ["Product", "Price", "Description"]
-for col, header in enumerate(b2c_headers, 1):
-    ws_b2c.cell(row=3, column=col, value=header)
-style_header_row(ws_b2c, 3, len(b2c_headers))
-
-b2c_products = [
-    ["CV Scan", "FREE (1x)", "AI analysis of CV with feedback"],
-    ["CV Redo/Rewrite", "FREE (1x)", "AI rewrites CV professionally"],
-    ["Video Analysis", "R 149", "AI coaching on interview video"],
-    ["AI Avatar Coaching", "R 199", "Interview prep with AI avatar"],
-    ["Position-Specific Prep", "R 199", "Guidance for specific job application"],
-    ["Video Pitch Package", "R 149", "Create video pitch for employers"],
+# ============== INPUT DRIVERS ==============
+# Month, Date, Phase, Expenses, B2B Revenue, B2C Revenue.
+# Total Revenue, Net P/L and Cumulative are derived - see compute_monthly_forecast()
+DRIVER_HEADERS = ["Month", "Date", "Phase", "Expenses", "B2B Revenue", "B2C Revenue"]
+
+MONTHLY_DRIVERS = [
+    [1, "Feb 2026", "Build", 433333, 0, 0],
+    [2, "Mar 2026", "Build", 378333, 0, 0],
+    [3, "Apr 2026", "Build", 546333, 0, 0],
+    [4, "May 2026", "Launch", 324000, 8750, 3000],
+    [5, "Jun 2026", "Grow", 324000, 17500, 6000],
+    [6, "Jul 2026", "Grow", 404000, 43750, 14415],
+    [7, "Aug 2026", "Grow", 404000, 61250, 18000],
+    [8, "Sep 2026", "Grow", 404000, 78750, 22000],
+    [9, "Oct 2026", "Grow", 404000, 105000, 28000],
+    [10, "Nov 2026", "Grow", 404000, 131250, 35000],
+    [11, "Dec 2026", "Grow", 404000, 148750, 40000],
+    [12, "Jan 2027", "Grow", 404000, 175000, 48000],
+    [13, "Feb 2027", "Grow", 404000, 201250, 55000],
+    [14, "Mar 2027", "Grow", 404000, 227500, 62000],
+    [15, "Apr 2027", "Grow", 404000, 262500, 70000],
+    [16, "May 2027", "Grow", 404000, 297500, 78000],
+    [17, "Jun 2027", "Grow", 404000, 341250, 88000],
+    [18, "Jul 2027", "Grow", 404000, 385000, 100000],
 ]
 
-for row_idx, row_data in enumerate(b2c_products, 4):
-    for col_idx, value in enumerate(row_data, 1):
-        cell = ws_b2c.cell(row=row_idx, column=col_idx, value=value)
-        cell.border = thin_border
 
-auto_column_width(ws_b2c)
-
-# ============== SHEET 5: TEAM & SALARIES ==============
-ws_team = wb.create_sheet("Team & Salaries")
-
-ws_team['A1'] = "TEAM & SALARIES - Cape Town Startup Market Rates"
-ws_team['A1'].font = Font(bold=True, size=14)
-
-team_headers = ["Role", "Monthly Salary", "Start Date", "Notes"]
-for col, header in enumerate(team_headers, 1):
-    ws_team.cell(row=3, column=col, value=header)
-style_header_row(ws_team, 3, len(team_headers))
-
-team_data = [
-    ["Marketing Manager", "R 45,000", "1 Apr 2026", "Mid-senior, growth-focused"],
-    ["Full-Stack Developer", "R 60,000", "1 Apr 2026", "Senior, Cape Town rate"],
-    ["Success Manager", "R 38,000", "1 Apr 2026", "Mid-level, customer-focused"],
-    ["CEO (Simon Rubin)", "R 40,000", "1 Jul 2026", "Below market, founder"],
-    ["Co-CEO (Shay Sinbeti)", "R 40,000", "1 Jul 2026", "Below market, founder"],
-]
-
-for row_idx, row_data in enumerate(team_data, 4):
-    for col_idx, value in enumerate(row_data, 1):
-        cell = ws_team.cell(row=row_idx, column=col_idx, value=value)
-        cell.border = thin_border
-
-ws_team['A10'] = "Team hired 1 month before launch to allow for onboarding and preparation."
-ws_team['A10'].font = Font(italic=True)
-
-auto_column_width(ws_team)
-
-# ============== SHEET 6: EXPENSES BREAKDOWN ==============
-ws_expenses = wb.create_sheet("Expense Breakdown")
-
-ws_expenses['A1'] = "MONTHLY EXPENSE BREAKDOWN (Post-Launch)"
-ws_expenses['A1'].font = Font(bold=True, size=14)
-
-expense_headers = ["Category", "Item", "Monthly Cost"]
-for col, header in enumerate(expense_headers, 1):
-    ws_expenses.cell(row=3, column=col, value=header)
-style_header_row(ws_expenses, 3, len(expense_headers))
-
-expenses = [
-    ["Salaries", "Marketing Manager", 45000],
-    ["Salaries", "Full-Stack Developer", 60000],
-    ["Salaries", "Success Manager", 38000],
-    ["Salaries", "CEO (from Month 6)", 40000],
-    ["Salaries", "Co-CEO (from Month 6)", 40000],
-    ["Marketing", "Advertising & Campaigns", 100000],
-    ["Technology", "Cloud Hosting", 10000],
-    ["Technology", "AI API (OpenAI)", 20000],
-    ["Technology", "Database (Supabase)", 3000],
-    ["Technology", "Tools & Services", 5000],
-    ["Operations", "Office/Co-working", 15000],
-    ["Operations", "Insurance", 5000],
-    ["Operations", "Accounting", 8000],
-    ["Operations", "Legal", 5000],
-    ["Operations", "Miscellaneous", 10000],
-]
-
-for row_idx, row_data in enumerate(expenses, 4):
-    for col_idx, value in enumerate(row_data, 1):
-        cell = ws_expenses.cell(row=row_idx, column=col_idx, value=value)
-        cell.border = thin_border
-        if col_idx == 3:
-            cell.number_format = currency_format
-
-# Total row
-total_row = len(expenses) + 4
-ws_expenses.cell(row=total_row, column=1, value="TOTAL").font = Font(bold=True)
-ws_expenses.cell(row=total_row, column=3, value=404000).font = Font(bold=True)
-ws_expenses.cell(row=total_row, column=3).number_format = currency_format
-
-auto_column_width(ws_expenses)
-
-# Save workbook
-wb.save(OUTPUT_PATH)
-print(f"Excel file created: {OUTPUT_PATH}")
-print("Sheets: Summary, Monthly Forecast, B2B Pricing, B2C Pricing, Team & Salaries, Expense Breakdown")
+def compute_monthly_forecast(drivers):
+    """Derive Total Revenue, Net P/L and Cumulative from the monthly drivers"""
+    rows = []
+    cumulative = 0
+    for month, date, phase, expenses, b2b, b2c in drivers:
+        total = b2b + b2c
+        net = total - expenses
+        cumulative += net
+        rows.append([month, date, phase, expenses, b2b, b2c, total, net, cumulative])
+    return rows
+
+
+def blend_actuals(drivers, actuals):
+    """Replace projected revenue with billed actuals for the segments billed in each month"""
+    blended = []
+    for month, date, phase, expenses, b2b, b2c in drivers:
+        month_key = datetime.strptime(date, "%b %Y").strftime("%Y-%m")
+        if month_key in actuals:
+            # Segments with no billing events (B2C today) keep their projection
+            totals = segment_totals(actuals[month_key])
+            b2b, b2c, phase = totals.get("b2b", b2b), totals.get("b2c", b2c), f"{phase} (Actual)"
+        blended.append([month, date, phase, expenses, b2b, b2c])
+    return blended
+
+
+def load_drivers(actuals_dsn=None, actuals_until=None):
+    """Monthly drivers, with billed actuals from the database blended in when a DSN is given"""
+    if not actuals_dsn:
+        return MONTHLY_DRIVERS
+    conn, dialect = connect(actuals_dsn)
+    try:
+        actuals = fetch_monthly_actuals(conn, dialect, until=actuals_until)
+    finally:
+        conn.close()
+    print(f"Actuals: {len(actuals)} billed month(s) from {dialect}")
+    return blend_actuals(MONTHLY_DRIVERS, actuals)
+
+
+def monthly_frame(monthly_data):
+    """Typed monthly forecast table (month as date, amounts in cents) for columnar export"""
+    return forecast_frame(
+        monthly_data,
+        ["month_number", "month", "phase", "expenses", "b2b_revenue", "b2c_revenue",
+         "total_revenue", "net_pl", "cumulative"],
+        month_column="month",
+        amount_columns=["expenses", "b2b_revenue", "b2c_revenue", "total_revenue", "net_pl", "cumulative"],
+    )
+
+
+def monthly_formula_row(row):
+    """Live-formula version of one Monthly Forecast row, reading drivers from Assumptions"""
+    inputs = [f"=Assumptions!{col}{row}" for col in "ABCDEF"]
+    cumulative = f"=H{row}" if row == 2 else f"=I{row - 1}+H{row}"
+    return inputs + [f"=E{row}+F{row}", f"=G{row}-D{row}", cumulative]
+
+
+def summary_metrics(monthly_data, live_formulas=False):
+    """Summary KEY METRICS rows derived from the forecast; formulas into Monthly Forecast when live"""
+    last = monthly_data[-1]
+    last_row = len(monthly_data) + 1
+    build_rows = [row_idx for row_idx, row in enumerate(monthly_data, 2) if row[2].startswith("Build")]
+    break_even = next((row for row in monthly_data if row[7] > 0), None)
+    break_even_text = f"Month {break_even[0]} ({break_even[1]})" if break_even else f"Not within {last[0]} months"
+    if live_formulas:
+        sheet = "'Monthly Forecast'"
+        build_cost = "=SUM(" + ",".join(f"{sheet}!D{row_idx}" for row_idx in build_rows) + ")" if build_rows else 0
+        burn, revenue, profit = (f"={sheet}!{col}{last_row}" for col in "DGH")
+    else:
+        build_cost = sum(monthly_data[row_idx - 2][3] for row_idx in build_rows)
+        burn, revenue, profit = last[3], last[6], last[7]
+    return [
+        ["Build Phase Cost", build_cost],
+        ["Monthly Burn (Post-Launch)", burn],
+        ["Break-Even Month", break_even_text],
+        [f"Month {last[0]} Revenue", revenue],
+        [f"Month {last[0]} Profit", profit],
+    ]
+
+
+def generated_on():
+    """Date stamped on the Summary sheet; part of the render key, so a cached workbook never shows a stale date"""
+    return datetime.now().strftime('%d %B %Y')
+
+
+def build_workbook(monthly_data, live_formulas=False, scenario_name=None, generated=None):
+    """Build the forecast workbook; live_formulas emits Excel formulas for derived columns"""
+    wb = Workbook()
+    drivers = [row[:len(DRIVER_HEADERS)] for row in monthly_data]
+
+    # ============== SHEET 1: SUMMARY ==============
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+
+    # Title
+    ws_summary['A1'] = "HIREINBOX - 18 Month Financial Forecast"
+    ws_summary['A1'].font = Font(bold=True, size=16)
+    ws_summary['A2'] = "February 2026 - July 2027 | All figures ex VAT"
+    ws_summary['A2'].font = Font(italic=True, size=11)
+    ws_summary['A3'] = f"Generated: {generated or generated_on()}"
+    if scenario_name:
+        ws_summary['A4'] = f"Scenario: {scenario_name}"
+        ws_summary['A4'].font = Font(bold=True, color="1F4E79")
+
+    # Key Metrics
+    ws_summary['A5'] = "KEY METRICS"
+    ws_summary['A5'].font = Font(bold=True, size=14)
+
+    metrics = [["Metric", "Value"], ["Total Investment Required", "R 5,500,000"]] + summary_metrics(
+        monthly_data, live_formulas)
+
+    for i, row in enumerate(metrics):
+        ws_summary.cell(row=6+i, column=1, value=row[0]).border = thin_border
+        value_cell = ws_summary.cell(row=6+i, column=2, value=row[1])
+        value_cell.border = thin_border
+        if not isinstance(row[1], str) or row[1].startswith("="):
+            value_cell.number_format = currency_format_neg
+        if i == 0:
+            ws_summary.cell(row=6+i, column=1).font = Font(bold=True)
+            ws_summary.cell(row=6+i, column=2).font = Font(bold=True)
+
+    # ============== SHEET 2: MONTHLY FORECAST ==============
+    ws_monthly = wb.create_sheet("Monthly Forecast")
+
+    # Headers
+    headers = ["Month", "Date", "Phase", "Expenses", "B2B Revenue", "B2C Revenue", "Total Revenue", "Net P/L", "Cumulative"]
+    for col, header in enumerate(headers, 1):
+        ws_monthly.cell(row=1, column=col, value=header)
+    style_header_row(ws_monthly, 1, len(headers))
+
+    # Data
+    if live_formulas:
+        ws_inputs = wb.create_sheet("Assumptions")
+        for col, header in enumerate(DRIVER_HEADERS, 1):
+            ws_inputs.cell(row=1, column=col, value=header)
+        style_header_row(ws_inputs, 1, len(DRIVER_HEADERS))
+        for row_idx, driver in enumerate(drivers, 2):
+            for col_idx, value in enumerate(driver, 1):
+                cell = ws_inputs.cell(row=row_idx, column=col_idx, value=value)
+                cell.border = thin_border
+                if col_idx >= 4:
+                    cell.number_format = currency_format_neg
+        auto_column_width(ws_inputs)
+
+    break_even_month = next((row[0] for row in monthly_data if row[7] > 0), None)
+
+    for row_idx, row_data in enumerate(monthly_data, 2):
+        if live_formulas:
+            row_data = monthly_formula_row(row_idx)
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws_monthly.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+            # Format currency columns
+            if col_idx >= 4:
+                cell.number_format = currency_format_neg
+            # Highlight break-even row
+            if monthly_data[row_idx - 2][0] == break_even_month:
+                cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+
+    auto_column_width(ws_monthly)
+
+    # ============== SHEET 3: B2B PRICING ==============
+    ws_b2b = wb.create_sheet("B2B Pricing (ex VAT)")
+
+    ws_b2b['A1'] = "B2B PRICING - All prices ex VAT"
+    ws_b2b['A1'].font = Font(bold=True, size=14)
+
+    b2b_headers = ["Product", "Price", "Unit", "Description"]
+    for col, header in enumerate(b2b_headers, 1):
+        ws_b2b.cell(row=3, column=col, value=header)
+    style_header_row(ws_b2b, 3, len(b2b_headers))
+
+    b2b_products = [
+        ["CV Screening", "R 1,750", "per role", "Unlimited CVs per role, AI scoring & ranking"],
+        ["ID Verification", "R 50", "per candidate", "Verify candidate identity"],
+        ["Credit Check", "R 100", "per candidate", "Financial background verification"],
+        ["Criminal Check", "R 150", "per candidate", "Criminal record verification"],
+        ["AI Interview + Psychometric", "R 750", "per candidate", "Avatar interview with full analysis"],
+        ["Job Listing (Phase 2)", "R 2,500", "per listing", "Post job publicly to attract candidates"],
+        ["Subscription Starter (Phase 3)", "R 5,000", "per month", "Up to 10 roles/month"],
+        ["Subscription Pro (Phase 3)", "R 10,000", "per month", "Up to 25 roles/month"],
+        ["Subscription Enterprise (Phase 3)", "R 15,000", "per month", "Unlimited roles + support"],
+        ["Boutique AI Agent", "R 20,000", "per month", "Custom-trained AI for your company"],
+    ]
+
+    for row_idx, row_data in enumerate(b2b_products, 4):
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws_b2b.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+
+    auto_column_width(ws_b2b)
+
+    # ============== SHEET 4: B2C PRICING ==============
+    ws_b2c = wb.create_sheet("B2C Pricing (ex VAT)")
+
+    ws_b2c['A1'] = "B2C PRICING - All prices ex VAT"
+    ws_b2c['A1'].font = Font(bold=True, size=14)
+
+    b2c_headers = ["Product", "Price", "Description"]
+    for col, header in enumerate(b2c_headers, 1):
+        ws_b2c.cell(row=3, column=col, value=header)
+    style_header_row(ws_b2c, 3, len(b2c_headers))
+
+    b2c_products = [
+        ["CV Scan", "FREE (1x)", "AI analysis of CV with feedback"],
+        ["CV Redo/Rewrite", "FREE (1x)", "AI rewrites CV professionally"],
+        ["Video Analysis", "R 149", "AI coaching on interview video"],
+        ["AI Avatar Coaching", "R 199", "Interview prep with AI avatar"],
+        ["Position-Specific Prep", "R 199", "Guidance for specific job application"],
+        ["Video Pitch Package", "R 149", "Create video pitch for employers"],
+    ]
+
+    for row_idx, row_data in enumerate(b2c_products, 4):
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws_b2c.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+
+    auto_column_width(ws_b2c)
+
+    # ============== SHEET 5: TEAM & SALARIES ==============
+    ws_team = wb.create_sheet("Team & Salaries")
+
+    ws_team['A1'] = "TEAM & SALARIES - Cape Town Startup Market Rates"
+    ws_team['A1'].font = Font(bold=True, size=14)
+
+    team_headers = ["Role", "Monthly Salary", "Start Date", "Notes"]
+    for col, header in enumerate(team_headers, 1):
+        ws_team.cell(row=3, column=col, value=header)
+    style_header_row(ws_team, 3, len(team_headers))
+
+    team_data = [
+        ["Marketing Manager", "R 45,000", "1 Apr 2026", "Mid-senior, growth-focused"],
+        ["Full-Stack Developer", "R 60,000", "1 Apr 2026", "Senior, Cape Town rate"],
+        ["Success Manager", "R 38,000", "1 Apr 2026", "Mid-level, customer-focused"],
+        ["CEO (Simon Rubin)", "R 40,000", "1 Jul 2026", "Below market, founder"],
+        ["Co-CEO (Shay Sinbeti)", "R 40,000", "1 Jul 2026", "Below market, founder"],
+    ]
+
+    for row_idx, row_data in enumerate(team_data, 4):
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws_team.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+
+    ws_team['A10'] = "Team hired 1 month before launch to allow for onboarding and preparation."
+    ws_team['A10'].font = Font(italic=True)
+
+    auto_column_width(ws_team)
+
+    # ============== SHEET 6: EXPENSES BREAKDOWN ==============
+    ws_expenses = wb.create_sheet("Expense Breakdown")
+
+    ws_expenses['A1'] = "MONTHLY EXPENSE BREAKDOWN (Post-Launch)"
+    ws_expenses['A1'].font = Font(bold=True, size=14)
+
+    expense_headers = ["Category", "Item", "Monthly Cost"]
+    for col, header in enumerate(expense_headers, 1):
+        ws_expenses.cell(row=3, column=col, value=header)
+    style_header_row(ws_expenses, 3, len(expense_headers))
+
+    expenses = [
+        ["Salaries", "Marketing Manager", 45000],
+        ["Salaries", "Full-Stack Developer", 60000],
+        ["Salaries", "Success Manager", 38000],
+        ["Salaries", "CEO (from Month 6)", 40000],
+        ["Salaries", "Co-CEO (from Month 6)", 40000],
+        ["Marketing", "Advertising & Campaigns", 100000],
+        ["Technology", "Cloud Hosting", 10000],
+        ["Technology", "AI API (OpenAI)", 20000],
+        ["Technology", "Database (Supabase)", 3000],
+        ["Technology", "Tools & Services", 5000],
+        ["Operations", "Office/Co-working", 15000],
+        ["Operations", "Insurance", 5000],
+        ["Operations", "Accounting", 8000],
+        ["Operations", "Legal", 5000],
+        ["Operations", "Miscellaneous", 10000],
+    ]
+
+    for row_idx, row_data in enumerate(expenses, 4):
+        for col_idx, value in enumerate(row_data, 1):
+            cell = ws_expenses.cell(row=row_idx, column=col_idx, value=value)
+            cell.border = thin_border
+            if col_idx == 3:
+                cell.number_format = currency_format
+
+    # Total row
+    total_row = len(expenses) + 4
+    ws_expenses.cell(row=total_row, column=1, value="TOTAL").font = Font(bold=True)
+    expense_total = f"=SUM(C4:C{total_row - 1})" if live_formulas else sum(row[2] for row in expenses)
+    ws_expenses.cell(row=total_row, column=3, value=expense_total).font = Font(bold=True)
+    ws_expenses.cell(row=total_row, column=3).number_format = currency_format
+
+    auto_column_width(ws_expenses)
+
+    return wb
+
+
+def verify_formulas(wb, monthly_data):
+    """Recompute a live-formula workbook in Python and compare against the derived rows"""
+    evaluator = FormulaEvaluator.from_openpyxl(wb)
+    evaluator.calculate()
+
+    mismatches = []
+    for row_idx, expected in enumerate(monthly_data, 2):
+        for col_idx in (7, 8, 9):
+            coord = f"{get_column_letter(col_idx)}{row_idx}"
+            actual = evaluator.value("Monthly Forecast", coord)
+            if actual != expected[col_idx - 1]:
+                mismatches.append((f"Monthly Forecast!{coord}", expected[col_idx - 1], actual))
+
+    ws_summary = wb["Summary"]
+    for row_idx, (label, expected) in enumerate(summary_metrics(monthly_data), 8):
+        actual = evaluator.value("Summary", f"B{row_idx}")
+        if ws_summary.cell(row=row_idx, column=1).value == label and actual != expected:
+            mismatches.append((f"Summary!B{row_idx}", expected, actual))
+
+    ws_expenses = wb["Expense Breakdown"]
+    total_coord = f"C{ws_expenses.max_row}"
+    expected_total = sum(
+        ws_expenses.cell(row=r, column=3).value for r in range(4, ws_expenses.max_row)
+    )
+    actual_total = evaluator.value("Expense Breakdown", total_coord)
+    if actual_total != expected_total:
+        mismatches.append((f"Expense Breakdown!{total_coord}", expected_total, actual_total))
+
+    return mismatches
+
+
+# ============== CACHED PIPELINE ==============
+
+def forecast_rows(drivers, cache):
+    """Compute stage: monthly rows memoized on a hash of the input drivers"""
+    key = content_hash("monthly-forecast", FORECAST_VERSION, drivers)
+    return cache.memoize(key, lambda: compute_monthly_forecast(drivers))
+
+
+def render_key(monthly_data, live_formulas, scenario_name, generated):
+    return content_hash("forecast-workbook", TEMPLATE_VERSION, monthly_data, live_formulas, scenario_name, generated)
+
+
+def render_workbook(monthly_data, cache, live_formulas=False, scenario_name=None, generated=None):
+    """Render stage: xlsx bytes memoized on the computed rows, generation date plus TEMPLATE_VERSION"""
+    generated = generated or generated_on()
+    key = render_key(monthly_data, live_formulas, scenario_name, generated)
+    data = cache.get_bytes(key)
+    if data is None:
+        buffer = BytesIO()
+        build_workbook(monthly_data, live_formulas, scenario_name, generated).save(buffer)
+        data = cache.put_bytes(key, buffer.getvalue())
+    return data
+
+
+# ============== BATCH SCENARIOS ==============
+
+def apply_scenario(drivers, scenario):
+    """Scale the Expenses / B2B / B2C driver columns by a scenario's multipliers"""
+    scale = [scenario.get(key, 1.0) for key in SCENARIO_MULTIPLIERS]
+    scaled = []
+    for row in drivers:
+        # Billed actuals are facts, only projected revenue is scaled
+        factors = scale[:1] + [1.0, 1.0] if row[2].endswith("(Actual)") else scale
+        scaled.append(row[:3] + [round(value * factor) for value, factor in zip(row[3:], factors)])
+    return scaled
+
+
+def load_scenario_matrix(path):
+    """
+    Read a scenario matrix (YAML or JSON) into a list of named scenarios.
+
+    Either list scenarios explicitly:
+        scenarios: [{name: lean, expenses: 0.85}, ...]
+    or give axes whose cross product is expanded (multipliers multiply):
+        matrix:
+          region: {gauteng: {}, western_cape: {b2b_revenue: 0.8}}
+          hiring_plan: {lean: {expenses: 0.85}, base: {}}
+    An optional output_dir is resolved relative to the matrix file.
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            print("❌ Error: PyYAML not installed (needed for YAML scenario files)")
+            print("Install with: pip3 install pyyaml")
+            sys.exit(1)
+        spec = yaml.safe_load(text) or {}
+    else:
+        spec = json.loads(text)
+
+    scenarios = [dict(s) for s in spec.get("scenarios", [])]
+    axes = spec.get("matrix", {})
+    if axes:
+        for combo in product(*(axis.items() for axis in axes.values())):
+            scenario = {"name": "_".join(label for label, _ in combo)}
+            for _, overrides in combo:
+                for key, factor in (overrides or {}).items():
+                    scenario[key] = scenario.get(key, 1.0) * factor
+            scenarios.append(scenario)
+
+    for scenario in scenarios:
+        unknown = set(scenario) - set(SCENARIO_MULTIPLIERS) - {"name"}
+        if unknown:
+            raise ValueError(f"Scenario {scenario.get('name')}: unknown keys {sorted(unknown)}")
+
+    output_dir = spec.get("output_dir")
+    if output_dir:
+        output_dir = path.parent / output_dir
+    return scenarios, output_dir
+
+
+def build_scenario(name, monthly_data, live_formulas, output_path, use_cache, generated):
+    """Worker: render and save one scenario workbook, returning its output hash"""
+    cache = ContentCache("forecast-render", enabled=use_cache)
+    write_if_changed(output_path, render_workbook(monthly_data, cache, live_formulas, name, generated))
+    return file_hash(output_path)
+
+
+def run_batch(matrix_path, output_dir=None, jobs=None, live_formulas=False, force=False, use_cache=True,
+              base_drivers=MONTHLY_DRIVERS):
+    """Build one workbook per scenario in parallel, skipping unchanged outputs"""
+    scenarios, matrix_output_dir = load_scenario_matrix(matrix_path)
+    output_dir = Path(output_dir or matrix_output_dir or Path(matrix_path).parent)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = output_dir / BATCH_MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    compute_cache = ContentCache("forecast-compute", enabled=use_cache)
+    generated = generated_on()
+    pending = {}
+    skipped = 0
+    for scenario in scenarios:
+        monthly_data = forecast_rows(apply_scenario(base_drivers, scenario), compute_cache)
+        output_path = output_dir / f"{OUTPUT_STEM}_{scenario['name']}.xlsx"
+        key = render_key(monthly_data, live_formulas, scenario["name"], generated)
+        entry = manifest.get(output_path.name, {})
+        unchanged = (
+            not force
+            and entry.get("render") == key
+            and output_path.exists()
+            and entry.get("output") == file_hash(output_path)
+        )
+        if unchanged:
+            skipped += 1
+            continue
+        pending[output_path] = (scenario["name"], monthly_data, key)
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(build_scenario, name, monthly_data, live_formulas, str(output_path), use_cache,
+                        generated): output_path
+            for output_path, (name, monthly_data, _) in pending.items()
+        }
+        for future in as_completed(futures):
+            output_path = futures[future]
+            try:
+                manifest[output_path.name] = {
+                    "render": pending[output_path][2],
+                    "output": future.result(),
+                }
+                print(f"✅ Created: {output_path}")
+            except Exception as e:
+                failed += 1
+                manifest.pop(output_path.name, None)
+                print(f"❌ Failed: {output_path} ({e})")
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    print(f"\n{len(scenarios)} scenarios: {len(pending) - failed} built, {skipped} unchanged, {failed} failed")
+    print(f"Cache: {compute_cache.stats()}")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the HireInbox 18-month forecast workbook")
+    parser.add_argument("--formulas", action="store_true",
+                        help="Emit Excel formulas for derived columns with drivers on an Assumptions sheet")
+    parser.add_argument("--verify", action="store_true",
+                        help="Recompute the formulas in Python and check totals (implies --formulas, no file written)")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Output path for a single workbook")
+    parser.add_argument("--matrix", help="Scenario matrix (YAML/JSON): build one workbook per scenario")
+    parser.add_argument("--output-dir", help="Directory for batch workbooks (overrides the matrix file)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for batch mode (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Rebuild batch scenarios even if unchanged")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute and re-render without the on-disk cache")
+    parser.add_argument("--export", type=parse_formats, default=[],
+                        help="Also write the monthly table as columnar files: csv,parquet,arrow")
+    parser.add_argument("--export-dir", help="Directory for columnar exports (default: next to --output)")
+    parser.add_argument("--actuals", metavar="DSN", default=os.environ.get("HIREINBOX_BILLING_DSN"),
+                        help="Blend billed actuals from postgresql://... or sqlite:///... (env HIREINBOX_BILLING_DSN)")
+    parser.add_argument("--actuals-until", metavar="YYYY-MM", help="Last month to take from actuals")
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    if args.verify:
+        monthly_data = compute_monthly_forecast(MONTHLY_DRIVERS)
+        mismatches = verify_formulas(build_workbook(monthly_data, live_formulas=True), monthly_data)
+        for ref, expected, actual in mismatches:
+            print(f"MISMATCH {ref}: expected {expected}, got {actual}")
+        print("Formula check failed" if mismatches else "Formula check passed")
+        sys.exit(1 if mismatches else 0)
+
+    if args.matrix:
+        drivers = load_drivers(args.actuals, args.actuals_until)
+        failed = run_batch(args.matrix, args.output_dir, args.jobs, args.formulas, args.force, use_cache, drivers)
+        sys.exit(1 if failed else 0)
+
+    compute_cache = ContentCache("forecast-compute", enabled=use_cache)
+    render_cache = ContentCache("forecast-render", enabled=use_cache)
+    monthly_data = forecast_rows(load_drivers(args.actuals, args.actuals_until), compute_cache)
+    written = write_if_changed(args.output, render_workbook(monthly_data, render_cache, args.formulas))
+    print(f"Excel file {'created' if written else 'unchanged'}: {args.output}")
+    print(f"Cache: {compute_cache.stats()}; {render_cache.stats()}")
+
+    if args.export:
+        export_dir = args.export_dir or os.path.dirname(os.path.abspath(args.output))
+        for path in export_frames({"monthly_forecast": monthly_frame(monthly_data)}, export_dir, args.export):
+            print(f"Exported: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Read commits, trees and blobs straight from the git object store
+Lets the scanner look at any revision without checking it out.
+"""
+
+import subprocess
+import threading
+
+from build_cache import PROJECT_ROOT
+
+
+def git(*args) -> str:
+    result = subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True,
+                            encoding="utf-8", errors="ignore")
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def rev_list(rev_range):
+    """[(commit sha, commit timestamp)] for a revision or range, oldest first"""
+    commits = []
+    for line in git("log", "--reverse", "--format=%H %ct", rev_range).splitlines():
+        sha, timestamp = line.split()
+        commits.append((sha, int(timestamp)))
+    return commits
+
+
+def list_tree(rev, prefix="src"):
+    """[(blob sha, path)] for every file under prefix at rev"""
+    blobs = []
+    for entry in git("ls-tree", "-r", "-z", "--full-tree", rev, "--", prefix).split("\0"):
+        if not entry:
+            continue
+        meta, path = entry.split("\t", 1)
+        _, kind, sha = meta.split()
+        if kind == "blob":
+            blobs.append((sha, path))
+    return blobs
+
+
+def stream_blobs(shas):
+    """Yield (sha, text) for each blob through one `git cat-file --batch` process
+
+    A writer thread feeds the requests while objects are read back in the same
+    order, so neither side blocks on a full pipe. Missing objects are skipped.
+    """
+    shas = list(shas)
+    if not shas:
+        return
+    process = subprocess.Popen(["git", "cat-file", "--batch", "--buffer"], cwd=PROJECT_ROOT,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def feed():
+        try:
+            process.stdin.write("".join(f"{sha}\n" for sha in shas).encode())
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # the reader stopped early and git exited
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for _ in shas:
+            header = process.stdout.readline().split()
+            if len(header) != 3:
+                continue  # "<sha> missing"
+            data = process.stdout.read(int(header[2]) + 1)[:-1]
+            if header[1] == b"blob":
+                yield header[0].decode(), data.decode("utf-8", errors="ignore")
+    finally:
+        process.stdout.close()
+        process.wait()
+        writer.join()
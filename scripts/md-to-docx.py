@@ -1,248 +1,259 @@
 #!/usr/bin/env python3
-"""Convert Markdown PRD to Word document"""
-
-import re
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-
-def add_hyperlink(paragraph, url, text):
-    """Add a hyperlink to a paragraph."""
-    part = paragraph.part
-    r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    new_run = OxmlElement('w:r')
-    rPr = OxmlElement('w:rPr')
-    c = OxmlElement('w:color')
-    c.set(qn('w:val'), '0563C1')
-    rPr.append(c)
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-    new_run.append(rPr)
-    new_run.text = text
-    hyperlink.append(new_run)
-    paragraph._p.append(hyperlink)
-    return hyperlink
-
-def set_cell_shading(cell, color):
-    """Set cell background color."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    shd = OxmlElement('w:shd')
-    shd.set(qn('w:fill'), color)
-    tcPr.append(shd)
+"""Convert Markdown PRD to Word document (and optionally HTML/PDF from the same parse)"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from docx.shared import Pt
+
+from build_cache import file_hash
+from docx_helpers import HEADER_SHADING, TABLE_FRAGMENTS, add_hyperlink, build_table, new_document
+from docx_stream import StreamingDocxWriter
+from md_backends import HtmlWriter, PdfWriter
+from md_blocks import BlockWriter, FanOutWriter, inline_spans, is_title, parse_blocks, plain_text
+
+# Bump when converter output changes so hash-based skipping rebuilds everything
+CONVERTER_VERSION = 1
+BATCH_MANIFEST = '.md-to-docx-manifest.json'
+
+DEFAULT_FILES = [
+    ('/Users/simon/Desktop/hireinbox/HIREINBOX_Technical_PRD.md',
+     '/Users/simon/Desktop/hireinbox/HIREINBOX_Technical_PRD.docx'),
+    ('/Users/simon/Desktop/hireinbox/HIREINBOX_Partner_PRD.md',
+     '/Users/simon/Desktop/hireinbox/HIREINBOX_Partner_PRD.docx'),
+    ('/Users/simon/Desktop/hireinbox/HIREINBOX_Business_PRD.md',
+     '/Users/simon/Desktop/hireinbox/HIREINBOX_Business_PRD.docx'),
+]
+
+class DocxWriter(BlockWriter):
+    """DOCX backend: consumes md_blocks events and builds a python-docx Document"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.doc = new_document()
+        self.table_rows = []
+
+    def on_heading(self, block):
+        self.doc.add_heading(block.text, 0 if is_title(block) else block.level)
+
+    def on_paragraph(self, block):
+        if block.text.strip():
+            add_inline_runs(self.doc.add_paragraph(), block.text)
+
+    def on_list_item(self, block):
+        style = 'List Number' if block.ordered else 'List Bullet'
+        add_inline_runs(self.doc.add_paragraph(style=style), block.text)
+
+    def on_code(self, block):
+        p = self.doc.add_paragraph()
+        p.style = 'No Spacing'
+        run = p.add_run(block.text)
+        run.font.name = 'Courier New'
+        run.font.size = Pt(9)
+
+    def on_rule(self, block):
+        self.doc.add_paragraph('_' * 50)
+
+    def on_table_start(self, block):
+        self.table_rows = []
+
+    def on_table_row(self, block):
+        self.table_rows.append(block.cells)
+
+    def on_table_end(self, block):
+        create_table(self.doc, self.table_rows)
+        self.table_rows = []
+
+    def close(self):
+        self.doc.save(self.output_path)
+
+# Output format -> writer class (all take the output path)
+OUTPUT_FORMATS = {'docx': DocxWriter, 'html': HtmlWriter, 'pdf': PdfWriter}
+
+def parse_output_formats(value):
+    """'docx,pdf' -> ['docx', 'pdf'] with validation."""
+    formats = [f.strip().lower() for f in value.split(',') if f.strip()]
+    unknown = set(formats) - set(OUTPUT_FORMATS)
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(f"choose from {', '.join(OUTPUT_FORMATS)}")
+    return formats
+
+def output_paths(output_path, formats):
+    """The output path with each requested format's suffix."""
+    return [Path(output_path).with_suffix(f'.{fmt}') for fmt in formats]
 
 def parse_markdown_to_docx(md_content, output_path):
     """Parse markdown and create Word document."""
-    doc = Document()
-
-    # Set up styles
-    styles = doc.styles
-
-    # Title style
-    title_style = styles['Title']
-    title_style.font.size = Pt(28)
-    title_style.font.bold = True
-    title_style.font.color.rgb = RGBColor(0, 51, 102)
-
-    # Heading styles
-    for i in range(1, 5):
-        h_style = styles[f'Heading {i}']
-        h_style.font.color.rgb = RGBColor(0, 51, 102)
-        h_style.font.bold = True
-        if i == 1:
-            h_style.font.size = Pt(20)
-        elif i == 2:
-            h_style.font.size = Pt(16)
-        elif i == 3:
-            h_style.font.size = Pt(14)
-        else:
-            h_style.font.size = Pt(12)
-
-    lines = md_content.split('\n')
-    i = 0
-    in_code_block = False
-    code_buffer = []
-    in_table = False
-    table_rows = []
-
-    while i < len(lines):
-        line = lines[i]
-
-        # Skip empty lines
-        if not line.strip():
-            if in_table and table_rows:
-                # End table
-                create_table(doc, table_rows)
-                table_rows = []
-                in_table = False
-            i += 1
-            continue
-
-        # Horizontal rule
-        if line.strip() == '---':
-            if in_table and table_rows:
-                create_table(doc, table_rows)
-                table_rows = []
-                in_table = False
-            doc.add_paragraph('_' * 50)
-            i += 1
-            continue
-
-        # Code block
-        if line.strip().startswith('```'):
-            if in_code_block:
-                # End code block
-                code_text = '\n'.join(code_buffer)
-                p = doc.add_paragraph()
-                p.style = 'No Spacing'
-                run = p.add_run(code_text)
-                run.font.name = 'Courier New'
-                run.font.size = Pt(9)
-                code_buffer = []
-                in_code_block = False
-            else:
-                in_code_block = True
-            i += 1
-            continue
-
-        if in_code_block:
-            code_buffer.append(line)
-            i += 1
-            continue
-
-        # Table row
-        if '|' in line and line.strip().startswith('|'):
-            # Check if this is a separator row
-            if re.match(r'^[\|\-\s:]+$', line.strip()):
-                i += 1
-                continue
-
-            in_table = True
-            cells = [c.strip() for c in line.split('|')[1:-1]]
-            table_rows.append(cells)
-            i += 1
-            continue
-
-        # If we were in a table, create it
-        if in_table and table_rows:
-            create_table(doc, table_rows)
-            table_rows = []
-            in_table = False
-
-        # Headers
-        if line.startswith('# '):
-            text = line[2:].strip()
-            if 'HIREINBOX' in text and 'Technical Product' in text:
-                doc.add_heading(text, 0)
-            else:
-                doc.add_heading(text, 1)
-            i += 1
-            continue
-
-        if line.startswith('## '):
-            doc.add_heading(line[3:].strip(), 2)
-            i += 1
-            continue
-
-        if line.startswith('### '):
-            doc.add_heading(line[4:].strip(), 3)
-            i += 1
-            continue
-
-        if line.startswith('#### '):
-            doc.add_heading(line[5:].strip(), 4)
-            i += 1
-            continue
-
-        # Bullet points
-        if line.strip().startswith('- ') or line.strip().startswith('* '):
-            text = line.strip()[2:]
-            text = process_inline_formatting(text)
-            p = doc.add_paragraph(text, style='List Bullet')
-            i += 1
-            continue
-
-        # Numbered list
-        if re.match(r'^\d+\.\s', line.strip()):
-            text = re.sub(r'^\d+\.\s', '', line.strip())
-            text = process_inline_formatting(text)
-            p = doc.add_paragraph(text, style='List Number')
-            i += 1
-            continue
-
-        # Regular paragraph
-        text = process_inline_formatting(line)
-        if text.strip():
-            doc.add_paragraph(text)
-
-        i += 1
-
-    # Handle any remaining table
-    if table_rows:
-        create_table(doc, table_rows)
-
-    doc.save(output_path)
+    DocxWriter(output_path).write_all(parse_blocks(md_content.splitlines()))
     print(f"Document saved to: {output_path}")
 
+def convert_file(input_path, output_path, formats=('docx',), stream=False):
+    """
+    Stream a Markdown file through the block parser once, feeding every requested
+    format. stream=True writes the .docx incrementally (large-document mode).
+    """
+    writer_classes = {**OUTPUT_FORMATS, 'docx': StreamingDocxWriter} if stream else OUTPUT_FORMATS
+    writers = [writer_classes[fmt](path) for fmt, path in zip(formats, output_paths(output_path, formats))]
+    with open(input_path, 'r', encoding='utf-8') as f:
+        FanOutWriter(writers).write_all(parse_blocks(f))
+
 def process_inline_formatting(text):
-    """Process inline markdown formatting."""
-    # Remove markdown links but keep text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-    # Remove bold markers
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
-    # Remove italic markers
-    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
-    # Remove inline code markers
-    text = re.sub(r'`([^`]+)`', r'\1', text)
-    return text
+    """Process inline markdown formatting (returns plain text with markers removed)."""
+    return plain_text(text)
+
+def add_inline_runs(paragraph, text, bold=False):
+    """Add inline markdown to a paragraph as formatted runs (bold/italic/code/hyperlink)."""
+    for span in inline_spans(text, bold=bold):
+        if span.url:
+            add_hyperlink(paragraph, span.url, span.text)
+            continue
+        run = paragraph.add_run(span.text)
+        if span.bold:
+            run.bold = True
+        if span.italic:
+            run.italic = True
+        if span.code:
+            run.font.name = 'Courier New'
 
 def create_table(doc, rows):
     """Create a table from parsed rows."""
     if not rows:
         return
 
-    num_cols = max(len(row) for row in rows)
-    table = doc.add_table(rows=len(rows), cols=num_cols)
-    table.style = 'Table Grid'
-
-    for i, row in enumerate(rows):
-        for j, cell_text in enumerate(row):
-            if j < num_cols:
-                cell = table.cell(i, j)
-                cell.text = process_inline_formatting(cell_text)
-                # Header row styling
-                if i == 0:
-                    set_cell_shading(cell, 'E6E6E6')
-                    cell.paragraphs[0].runs[0].bold = True if cell.paragraphs[0].runs else False
+    build_table(doc, rows, header_fill=HEADER_SHADING)
 
     # Add spacing after table
     doc.add_paragraph()
 
+def collect_inputs(patterns, output_dir=None):
+    """Expand files, directories (recursive *.md) and globs into (input, output) pairs."""
+    pairs = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            root = Path(pattern)
+            matches = [(path, path.relative_to(root)) for path in sorted(root.rglob('*.md'))]
+        else:
+            matches = [(Path(path), Path(Path(path).name)) for path in sorted(glob.glob(pattern, recursive=True))]
+            if not matches:
+                print(f"Skipping {pattern} - no matching files")
+        for input_path, relative in matches:
+            if output_dir:
+                output_path = Path(output_dir) / relative.with_suffix('.docx')
+            else:
+                output_path = input_path.with_suffix('.docx')
+            pairs.append((input_path, output_path))
+    return pairs
+
+def build_config(formats, stream):
+    """Everything besides the input that shapes the outputs."""
+    return {'version': CONVERTER_VERSION, 'formats': list(formats), 'stream': stream}
+
+def manifest_entry(input_path, formats, stream=False):
+    stat = Path(input_path).stat()
+    return {'input': file_hash(input_path), 'stat': [stat.st_mtime_ns, stat.st_size], **build_config(formats, stream)}
+
+def is_up_to_date(input_path, output_path, manifest, formats=('docx',), stream=False):
+    """
+    The last build used this converter version, formats and mode, its outputs
+    exist, and the input is unchanged: same mtime and size as recorded (fast
+    path), else the same content hash.
+    """
+    entry = manifest.get(str(output_path))
+    if not entry or any(entry.get(key) != value for key, value in build_config(formats, stream).items()):
+        return False
+    if not all(path.exists() for path in output_paths(output_path, formats)):
+        return False
+    stat = Path(input_path).stat()
+    if entry.get('stat') == [stat.st_mtime_ns, stat.st_size]:
+        return True
+    return entry.get('input') == file_hash(input_path)
+
+def convert_job(input_path, output_path, formats=('docx',), stream=False):
+    """
+    Worker: convert one file, returning (bytes read, seconds, error, table fragment
+    counts for this job) instead of raising.
+    """
+    started = time.perf_counter()
+    before = TABLE_FRAGMENTS.counts()
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        convert_file(input_path, output_path, formats, stream)
+        size, error = os.path.getsize(input_path), None
+    except Exception as e:
+        size, error = 0, f"{type(e).__name__}: {e}"
+    counts = tuple(after - prior for after, prior in zip(TABLE_FRAGMENTS.counts(), before))
+    return size, time.perf_counter() - started, error, counts
+
+def convert_batch(pairs, jobs=None, force=False, manifest_dir=None, formats=('docx',), stream=False):
+    """Convert (input, output) pairs across a process pool with per-file error isolation."""
+    manifest_path = Path(manifest_dir or '.') / BATCH_MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    pending = [(i, o) for i, o in pairs if force or not is_up_to_date(i, o, manifest, formats, stream)]
+    skipped = len(pairs) - len(pending)
+    converted, failed, total_bytes = 0, 0, 0
+    fragment_counts = (0, 0, 0)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(convert_job, str(i), str(o), formats, stream): (i, o) for i, o in pending}
+        for future in as_completed(futures):
+            input_path, output_path = futures[future]
+            size, seconds, error, counts = future.result()
+            fragment_counts = tuple(total + n for total, n in zip(fragment_counts, counts))
+            if error:
+                failed += 1
+                manifest.pop(str(output_path), None)
+                print(f"FAILED {input_path}: {error}")
+                continue
+            converted += 1
+            total_bytes += size
+            manifest[str(output_path)] = manifest_entry(input_path, formats, stream)
+            saved = ', '.join(str(path) for path in output_paths(output_path, formats))
+            print(f"Document saved to: {saved} ({seconds:.2f}s)")
+    elapsed = time.perf_counter() - started
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    rate = converted / elapsed if elapsed else 0
+    mb_rate = total_bytes / 1e6 / elapsed if elapsed else 0
+    print(f"\n{len(pairs)} files: {converted} converted, {skipped} up to date, {failed} failed")
+    print(f"Throughput: {rate:.1f} files/s, {mb_rate:.2f} MB/s of Markdown in {elapsed:.2f}s")
+    print(f"Fragments: {TABLE_FRAGMENTS.stats(fragment_counts)}")
+    return failed
+
 def main():
-    import sys
-
-    files = [
-        ('/Users/simon/Desktop/hireinbox/HIREINBOX_Technical_PRD.md',
-         '/Users/simon/Desktop/hireinbox/HIREINBOX_Technical_PRD.docx'),
-        ('/Users/simon/Desktop/hireinbox/HIREINBOX_Partner_PRD.md',
-         '/Users/simon/Desktop/hireinbox/HIREINBOX_Partner_PRD.docx'),
-        ('/Users/simon/Desktop/hireinbox/HIREINBOX_Business_PRD.md',
-         '/Users/simon/Desktop/hireinbox/HIREINBOX_Business_PRD.docx'),
-    ]
-
-    for input_path, output_path in files:
-        try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            parse_markdown_to_docx(md_content, output_path)
-        except FileNotFoundError:
-            print(f"Skipping {input_path} - file not found")
+    parser = argparse.ArgumentParser(description='Convert Markdown files to Word documents')
+    parser.add_argument('inputs', nargs='*', help='Markdown files, directories or glob patterns')
+    parser.add_argument('--output-dir', help='Write .docx files here (default: next to each input)')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--force', action='store_true', help='Convert even if outputs are up to date')
+    parser.add_argument('--format', type=parse_output_formats, default=['docx'],
+                        help='Output formats from one parse, e.g. docx,html,pdf (default: docx)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Large-document mode: write the .docx incrementally with bounded memory')
+    args = parser.parse_args()
+
+    if not args.inputs:
+        for input_path, output_path in DEFAULT_FILES:
+            try:
+                convert_file(input_path, output_path, args.format, args.stream)
+                print(f"Document saved to: {', '.join(str(p) for p in output_paths(output_path, args.format))}")
+            except FileNotFoundError:
+                print(f"Skipping {input_path} - file not found")
+        print(f"Fragments: {TABLE_FRAGMENTS.stats()}")
+        return
+
+    pairs = collect_inputs(args.inputs, args.output_dir)
+    failed = convert_batch(pairs, args.jobs, args.force, args.output_dir, args.format, args.stream)
+    sys.exit(1 if failed else 0)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+HTML and PDF backends for the Markdown converter
+Both consume the same md_blocks events as the DOCX writer in md-to-docx.py,
+so one parse can feed every output format (see md_blocks.FanOutWriter).
+
+HtmlWriter streams markup to the file as events arrive. PdfWriter renders
+with ReportLab (pure Python, no office suite needed), in the DejaVu TTFs
+when they are installed so non-Latin-1 text survives, else the built-in
+Helvetica/Courier.
+"""
+
+import re
+import sys
+from html import escape
+from pathlib import Path
+
+from docx_helpers import BRAND_COLOR, HEADER_SHADING, HEADING_SIZES, HYPERLINK_COLOR, TITLE_SIZE
+from md_blocks import BlockWriter, inline_spans, is_title, plain_text
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import cm
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFError, TTFont
+    from reportlab.platypus import (
+        HRFlowable, Paragraph, Preformatted, SimpleDocTemplate, Spacer, Table, TableStyle,
+    )
+except ImportError:
+    SimpleDocTemplate = None  # PDF output reports the missing dependency when requested
+
+# Unicode TTFs for the PDF, looked up on ReportLab's TTF search path: family -> {variant: file}
+PDF_FONT_FILES = {
+    "DejaVuSans": {"normal": "DejaVuSans.ttf", "bold": "DejaVuSans-Bold.ttf",
+                   "italic": "DejaVuSans-Oblique.ttf", "boldItalic": "DejaVuSans-BoldOblique.ttf"},
+    "DejaVuSansMono": {"normal": "DejaVuSansMono.ttf", "bold": "DejaVuSansMono-Bold.ttf",
+                       "italic": "DejaVuSansMono-Oblique.ttf", "boldItalic": "DejaVuSansMono-BoldOblique.ttf"},
+}
+# Built-in (Latin-1 only) (regular, bold) faces used when a family's TTFs aren't installed
+PDF_FALLBACK_FONTS = {"DejaVuSans": ("Helvetica", "Helvetica-Bold"), "DejaVuSansMono": ("Courier", "Courier-Bold")}
+
+# {"body", "bold", "code"} font names, resolved once per process by pdf_fonts()
+_pdf_fonts = None
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Calibri, Arial, sans-serif; max-width: 50em; margin: 2em auto; line-height: 1.4; color: #222; }}
+h1, h2, h3, h4 {{ color: {brand}; }}
+h1.title {{ font-size: {title_size}pt; }}
+table {{ border-collapse: collapse; margin: 1em 0; }}
+th, td {{ border: 1px solid #999; padding: 0.3em 0.6em; text-align: left; }}
+th {{ background: {shading}; }}
+pre {{ font-family: 'Courier New', monospace; font-size: 9pt; background: #f6f6f6; padding: 0.6em; }}
+a {{ color: {link}; }}
+</style>
+</head>
+<body>
+"""
+
+
+def heading_anchor(text):
+    """GitHub-style anchor slug, so in-document links like [Summary](#1-summary) resolve"""
+    return re.sub(r"[^\w\- ]", "", plain_text(text).lower()).replace(" ", "-")
+
+
+def html_inline(text, bold=False):
+    """Inline Markdown -> HTML (escaped, with strong/em/code/a)"""
+    parts = []
+    for span in inline_spans(text, bold=bold):
+        html = escape(span.text)
+        if span.code:
+            html = f"<code>{html}</code>"
+        if span.italic:
+            html = f"<em>{html}</em>"
+        if span.bold:
+            html = f"<strong>{html}</strong>"
+        if span.url:
+            html = f'<a href="{escape(span.url)}">{html}</a>'
+        parts.append(html)
+    return "".join(parts)
+
+
+class HtmlWriter(BlockWriter):
+    """HTML backend: writes each block to the output file as soon as it is parsed"""
+
+    def __init__(self, output_path, title=None):
+        self.out = open(output_path, "w", encoding="utf-8")
+        self.list_tag = None
+        self.table_row = 0
+        self.out.write(HTML_HEAD.format(
+            title=escape(title or Path(output_path).stem), title_size=TITLE_SIZE,
+            brand=f"#{BRAND_COLOR}", shading=f"#{HEADER_SHADING}", link=f"#{HYPERLINK_COLOR}",
+        ))
+
+    def handle(self, block):
+        if self.list_tag and block.kind != "list_item":
+            self.out.write(f"</{self.list_tag}>\n")
+            self.list_tag = None
+        super().handle(block)
+
+    def on_heading(self, block):
+        anchor = heading_anchor(block.text)
+        if is_title(block):
+            self.out.write(f'<h1 class="title" id="{anchor}">{html_inline(block.text)}</h1>\n')
+        else:
+            self.out.write(f'<h{block.level} id="{anchor}">{html_inline(block.text)}</h{block.level}>\n')
+
+    def on_paragraph(self, block):
+        if block.text.strip():
+            self.out.write(f"<p>{html_inline(block.text)}</p>\n")
+
+    def on_list_item(self, block):
+        tag = "ol" if block.ordered else "ul"
+        if tag != self.list_tag:
+            if self.list_tag:
+                self.out.write(f"</{self.list_tag}>\n")
+            self.out.write(f"<{tag}>\n")
+            self.list_tag = tag
+        self.out.write(f"<li>{html_inline(block.text)}</li>\n")
+
+    def on_code(self, block):
+        self.out.write(f"<pre><code>{escape(block.text)}</code></pre>\n")
+
+    def on_rule(self, block):
+        self.out.write("<hr>\n")
+
+    def on_table_start(self, block):
+        self.out.write("<table>\n")
+        self.table_row = 0
+
+    def on_table_row(self, block):
+        tag = "th" if self.table_row == 0 else "td"
+        cells = "".join(f"<{tag}>{html_inline(cell)}</{tag}>" for cell in block.cells)
+        self.out.write(f"<tr>{cells}</tr>\n")
+        self.table_row += 1
+
+    def on_table_end(self, block):
+        self.out.write("</table>\n")
+
+    def close(self):
+        if self.list_tag:
+            self.out.write(f"</{self.list_tag}>\n")
+        self.out.write("</body>\n</html>\n")
+        self.out.close()
+
+
+def register_ttf_family(family, files):
+    """
+    Register a TTF family so <b>/<i> markup maps onto it; missing variants reuse
+    the regular or bold face. Returns (regular, bold) names, or None without
+    the regular face.
+    """
+    registered = {}
+    for variant, filename in files.items():
+        name = family if variant == "normal" else f"{family}-{variant}"
+        try:
+            pdfmetrics.registerFont(TTFont(name, filename))
+        except TTFError:
+            continue
+        registered[variant] = name
+    if "normal" not in registered:
+        return None
+    bold = registered.get("bold", family)
+    pdfmetrics.registerFontFamily(family, normal=family, bold=bold, italic=registered.get("italic", family),
+                                  boldItalic=registered.get("boldItalic", bold))
+    return family, bold
+
+
+def pdf_fonts():
+    """{"body", "bold", "code"} font names for the PDF, registering the DejaVu TTFs on first use"""
+    global _pdf_fonts
+    if _pdf_fonts is None:
+        faces = {}
+        for family, files in PDF_FONT_FILES.items():
+            faces[family] = register_ttf_family(family, files)
+            if faces[family] is None:
+                faces[family] = PDF_FALLBACK_FONTS[family]
+                print(f"⚠️  {family} not found - PDF uses {faces[family][0]} (Latin-1 only)")
+        _pdf_fonts = {"body": faces["DejaVuSans"][0], "bold": faces["DejaVuSans"][1],
+                      "code": faces["DejaVuSansMono"][0]}
+    return _pdf_fonts
+
+
+def pdf_inline(text, bold=False):
+    """Inline Markdown -> ReportLab paragraph markup (in-document #anchor links become plain text)"""
+    parts = []
+    for span in inline_spans(text, bold=bold):
+        markup = escape(span.text, quote=False)
+        if span.code:
+            markup = f'<font face="{pdf_fonts()["code"]}">{markup}</font>'
+        if span.italic:
+            markup = f"<i>{markup}</i>"
+        if span.bold:
+            markup = f"<b>{markup}</b>"
+        if span.url and not span.url.startswith("#"):
+            markup = f'<link href="{escape(span.url)}" color="#{HYPERLINK_COLOR}"><u>{markup}</u></link>'
+        parts.append(markup)
+    return "".join(parts)
+
+
+class PdfWriter(BlockWriter):
+    """PDF backend: builds ReportLab flowables from block events and lays them out on close()"""
+
+    def __init__(self, output_path, title=None):
+        if SimpleDocTemplate is None:
+            print("❌ Error: reportlab not installed (needed for PDF output)")
+            print("Install with: pip3 install reportlab")
+            sys.exit(1)
+
+        self.doc = SimpleDocTemplate(str(output_path), pagesize=A4, title=title or Path(output_path).stem,
+                                     leftMargin=2 * cm, rightMargin=2 * cm, topMargin=2 * cm, bottomMargin=2 * cm)
+        self.story = []
+        self.table_rows = []
+        self.list_number = 0
+
+        sample = getSampleStyleSheet()
+        brand = colors.HexColor(f"#{BRAND_COLOR}")
+        fonts = pdf_fonts()
+        body = ParagraphStyle("HireInboxBody", parent=sample["BodyText"], fontName=fonts["body"],
+                              bulletFontName=fonts["body"])
+        self.styles = {
+            "title": ParagraphStyle("HireInboxTitle", parent=sample["Title"], fontName=fonts["bold"],
+                                    fontSize=TITLE_SIZE, leading=TITLE_SIZE * 1.2, textColor=brand),
+            "body": body,
+            "bullet": ParagraphStyle("HireInboxBullet", parent=body, leftIndent=18, bulletIndent=6),
+            "cell": ParagraphStyle("HireInboxCell", parent=body, fontSize=9, leading=11),
+            "code": ParagraphStyle("HireInboxCode", parent=sample["Code"], fontName=fonts["code"],
+                                   fontSize=9, leading=11),
+        }
+        for level, size in HEADING_SIZES.items():
+            self.styles[level] = ParagraphStyle(
+                f"HireInboxHeading{level}", parent=sample[f"Heading{level}"], fontName=fonts["bold"],
+                fontSize=size, leading=size * 1.2, textColor=brand,
+            )
+
+    def add(self, flowable):
+        self.story.append(flowable)
+
+    def handle(self, block):
+        if block.kind != "list_item":
+            self.list_number = 0
+        super().handle(block)
+
+    def on_heading(self, block):
+        style = self.styles["title"] if is_title(block) else self.styles[block.level]
+        self.add(Paragraph(pdf_inline(block.text), style))
+
+    def on_paragraph(self, block):
+        if block.text.strip():
+            self.add(Paragraph(pdf_inline(block.text), self.styles["body"]))
+
+    def on_list_item(self, block):
+        if block.ordered:
+            self.list_number += 1
+            bullet = f"{self.list_number}."
+        else:
+            bullet = "•"
+        self.add(Paragraph(pdf_inline(block.text), self.styles["bullet"], bulletText=bullet))
+
+    def on_code(self, block):
+        self.add(Preformatted(block.text, self.styles["code"]))
+
+    def on_rule(self, block):
+        self.add(HRFlowable(width="100%", color=colors.grey, spaceBefore=6, spaceAfter=6))
+
+    def on_table_start(self, block):
+        self.table_rows = []
+
+    def on_table_row(self, block):
+        bold = not self.table_rows
+        self.table_rows.append([
+            Paragraph(pdf_inline(cell, bold=bold), self.styles["cell"]) for cell in block.cells
+        ])
+
+    def on_table_end(self, block):
+        if not self.table_rows:
+            return
+        num_cols = max(len(row) for row in self.table_rows)
+        rows = [row + [""] * (num_cols - len(row)) for row in self.table_rows]
+        table = Table(rows, colWidths=[self.doc.width / num_cols] * num_cols, repeatRows=1)
+        table.setStyle(TableStyle([
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(f"#{HEADER_SHADING}")),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ]))
+        self.add(table)
+        self.add(Spacer(1, 8))
+        self.table_rows = []
+
+    def close(self):
+        self.doc.build(self.story)
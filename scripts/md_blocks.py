@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Streaming Markdown block parser shared by the HireInbox document converters
+Reads lines one at a time (a file object works) and yields block events, so
+documents of any size are parsed in constant memory and any number of output
+backends can consume the same parse.
+
+Events (Block.kind):
+    heading        text, level 1-4
+    paragraph      text
+    list_item      text, ordered
+    code           text (the whole fenced block)
+    rule
+    table_start / table_row (cells) / table_end
+
+Inline formatting (links, bold, italic, code) is split into Span runs by
+inline_spans() in a single regex scan.
+"""
+
+import re
+from collections import namedtuple
+
+Block = namedtuple("Block", "kind text level cells ordered", defaults=("", 0, None, False))
+Span = namedtuple("Span", "text bold italic code url", defaults=(False, False, False, None))
+
+HEADING_RE = re.compile(r"(#{1,4}) ")
+NUMBERED_RE = re.compile(r"\d+\.\s")
+TABLE_SEPARATOR_RE = re.compile(r"^[\|\-\s:]+$")
+
+# One alternation instead of a regex pass per marker; group order = precedence
+INLINE_RE = re.compile(
+    r"\[(?P<label>[^\]]+)\]\((?P<url>[^\)]+)\)"
+    r"|\*\*(?P<bold>[^*]+)\*\*"
+    r"|\*(?P<italic>[^*]+)\*"
+    r"|`(?P<code>[^`]+)`"
+)
+INLINE_MARKERS = ("[", "*", "`")
+
+RULE = Block("rule")
+TABLE_START = Block("table_start")
+TABLE_END = Block("table_end")
+
+
+def parse_blocks(lines):
+    """Yield Block events from an iterable of Markdown lines"""
+    in_table = False
+    code_buffer = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+
+        # Inside a fence everything is code until the closing fence
+        if code_buffer is not None:
+            if stripped.startswith("```"):
+                yield Block("code", "\n".join(code_buffer))
+                code_buffer = None
+            else:
+                code_buffer.append(line)
+            continue
+
+        is_table_row = stripped.startswith("|")
+        if in_table and not is_table_row:
+            yield TABLE_END
+            in_table = False
+
+        if not stripped:
+            continue
+
+        if is_table_row:
+            if TABLE_SEPARATOR_RE.match(stripped):
+                continue
+            if not in_table:
+                yield TABLE_START
+                in_table = True
+            yield Block("table_row", cells=[cell.strip() for cell in line.split("|")[1:-1]])
+            continue
+
+        if stripped == "---":
+            yield RULE
+            continue
+
+        if stripped.startswith("```"):
+            code_buffer = []
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            yield Block("heading", line[level + 1:].strip(), level)
+            continue
+
+        if stripped.startswith(("- ", "* ")):
+            yield Block("list_item", stripped[2:])
+            continue
+
+        numbered = NUMBERED_RE.match(stripped)
+        if numbered:
+            yield Block("list_item", stripped[numbered.end():], ordered=True)
+            continue
+
+        yield Block("paragraph", line)
+
+    if in_table:
+        yield TABLE_END
+    if code_buffer is not None:
+        yield Block("code", "\n".join(code_buffer))
+
+
+def inline_spans(text, bold=False, italic=False):
+    """Split inline Markdown into formatted Span runs (markers removed)"""
+    if not any(marker in text for marker in INLINE_MARKERS):
+        return [Span(text, bold, italic)] if text else []
+
+    spans = []
+    pos = 0
+    for match in INLINE_RE.finditer(text):
+        if match.start() > pos:
+            spans.append(Span(text[pos:match.start()], bold, italic))
+        kind = match.lastgroup
+        if kind == "url":
+            spans.extend(
+                span._replace(url=match.group("url"))
+                for span in inline_spans(match.group("label"), bold, italic)
+            )
+        elif kind == "bold":
+            spans.extend(inline_spans(match.group("bold"), True, italic))
+        elif kind == "italic":
+            spans.extend(inline_spans(match.group("italic"), bold, True))
+        else:
+            spans.append(Span(match.group("code"), bold, italic, code=True))
+        pos = match.end()
+    if pos < len(text):
+        spans.append(Span(text[pos:], bold, italic))
+    return spans
+
+
+def is_title(block):
+    """The Technical PRD's H1 is rendered as the document title by every backend"""
+    return block.level == 1 and "HIREINBOX" in block.text and "Technical Product" in block.text
+
+
+def plain_text(text):
+    """Inline Markdown with all formatting markers stripped"""
+    return "".join(span.text for span in inline_spans(text))
+
+
+class BlockWriter:
+    """
+    Base class for output backends: handle() dispatches each event to an
+    on_<kind>(block) method; close() finishes the output.
+    """
+
+    def handle(self, block):
+        getattr(self, f"on_{block.kind}")(block)
+
+    def write_all(self, blocks):
+        for block in blocks:
+            self.handle(block)
+        return self.close()
+
+    def close(self):
+        pass
+
+
+class FanOutWriter(BlockWriter):
+    """Feeds every event to several writers, so one parse produces all outputs"""
+
+    def __init__(self, writers):
+        self.writers = list(writers)
+
+    def handle(self, block):
+        for writer in self.writers:
+            writer.handle(block)
+
+    def close(self):
+        return [writer.close() for writer in self.writers]
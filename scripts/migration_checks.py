@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Performance checks for the SQL migrations in supabase/migrations
+Migrations are replayed in filename order into a small schema model (tables,
+columns, foreign keys, indexes, RLS policies) and each statement is checked
+for hazards that only show up on production-sized tables:
+
+    FK_WITHOUT_INDEX     foreign key column with no index leading on it
+    UNBATCHED_BACKFILL   UPDATE / INSERT ... SELECT over a whole existing table
+    LOCKING_ALTER        ALTER TABLE that rewrites or scans a table under lock
+    RLS_UNINDEXED        column compared in an RLS policy with no index
+
+Issues use check_issues.py's item format ({"file", "line", "issue"}).
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MIGRATIONS_DIR = PROJECT_ROOT / "supabase" / "migrations"
+
+# Supabase tables are keyed by id even when created outside these migrations
+DEFAULT_INDEXED = {"id"}
+
+# ADD COLUMN defaults that force a table rewrite (volatile, evaluated per row)
+VOLATILE_DEFAULT_RE = re.compile(r"\bDEFAULT\s+(?:gen_random_uuid|uuid_generate_v4|random|clock_timestamp|timeofday)\s*\(",
+                                 re.IGNORECASE)
+
+IDENT = r'(?:"[^"]+"|\w+)'
+TABLE_NAME = rf"{IDENT}(?:\.{IDENT})?"
+SQL_KEYWORDS = {"and", "or", "not", "null", "true", "false", "is", "in", "select", "from", "where", "exists",
+                "any", "all", "current_user", "session_user"}
+
+CREATE_TABLE_RE = re.compile(rf"^CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?({TABLE_NAME})\s*\((.*)\)[^)]*$",
+                             re.IGNORECASE | re.DOTALL)
+CREATE_INDEX_RE = re.compile(rf"^CREATE\s+(UNIQUE\s+)?INDEX\s+(CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?"
+                             rf"(?:{IDENT}\s+)?ON\s+(?:ONLY\s+)?({TABLE_NAME})\s*(?:USING\s+\w+\s*)?\((.*?)\)",
+                             re.IGNORECASE | re.DOTALL)
+ALTER_TABLE_RE = re.compile(rf"^ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?({TABLE_NAME})\s+(.*)$",
+                            re.IGNORECASE | re.DOTALL)
+CREATE_POLICY_RE = re.compile(rf"^CREATE\s+POLICY\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:{IDENT}|'[^']*')\s+ON\s+({TABLE_NAME})\s+(.*)$",
+                              re.IGNORECASE | re.DOTALL)
+UPDATE_RE = re.compile(rf"^UPDATE\s+(?:ONLY\s+)?({TABLE_NAME})\b(.*)$", re.IGNORECASE | re.DOTALL)
+INSERT_SELECT_RE = re.compile(rf"^INSERT\s+INTO\s+({TABLE_NAME}).*?\bSELECT\b.*?\bFROM\s+({TABLE_NAME})(.*)$",
+                              re.IGNORECASE | re.DOTALL)
+REFERENCES_RE = re.compile(rf"\bREFERENCES\s+({TABLE_NAME})", re.IGNORECASE)
+FOREIGN_KEY_RE = re.compile(rf"\bFOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+({TABLE_NAME})", re.IGNORECASE)
+KEY_LIST_RE = re.compile(r"\b(PRIMARY\s+KEY|UNIQUE)\s*\(([^)]*)\)", re.IGNORECASE)
+BOOLEAN_COMPARISON_RE = re.compile(rf"{IDENT}(?:\.{IDENT})?\s*=\s*(?:TRUE|FALSE)\b", re.IGNORECASE)
+COMPARISON_RE = re.compile(rf"({IDENT}(?:\.{IDENT})?)(\s*\()?\s*(=|\bIN\b)\s*(\()?|(=)\s*({IDENT}(?:\.{IDENT})?)(\s*\()?",
+                           re.IGNORECASE)
+
+
+def table_key(name):
+    """Normalized table name: unquoted, lower case, public. schema dropped"""
+    name = name.replace('"', "").lower()
+    return name[len("public."):] if name.startswith("public.") else name
+
+
+def column_names(text):
+    return [part.strip().strip('"').lower().split()[0] for part in text.split(",") if part.strip()]
+
+
+def split_top_level(text, separator=","):
+    """Split on separator outside parentheses: [(offset in text, stripped part), ...]"""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text + separator):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == separator and depth == 0:
+            part = text[start:i]
+            if part.strip():
+                parts.append((start + len(part) - len(part.lstrip()), part.strip()))
+            start = i + 1
+    return parts
+
+
+def line_at(statement, line, offset):
+    """Source line of a character offset within a statement starting at line"""
+    return line + statement.count("\n", 0, offset)
+
+
+def statements(sql):
+    """
+    (line, statement) pairs with comments removed (newlines are kept, so offsets
+    map back to source lines). Quoted strings and dollar-quoted function bodies
+    are kept intact but never split.
+    """
+    result, current, line, start_line = [], [], 1, None
+    i, n = 0, len(sql)
+    while i < n:
+        char = sql[i]
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        if sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            line += sql.count("\n", i, end)
+            current.append(" ")
+            i = end
+            continue
+        if char in "'\"" or (char == "$" and re.match(r"\$\w*\$", sql[i:])):
+            delimiter = char if char in "'\"" else re.match(r"\$\w*\$", sql[i:]).group()
+            end = sql.find(delimiter, i + len(delimiter))
+            end = n if end == -1 else end + len(delimiter)
+            if start_line is None:
+                start_line = line
+            current.append(sql[i:end])
+            line += sql.count("\n", i, end)
+            i = end
+            continue
+        if char == ";":
+            text = "".join(current).strip()
+            if text:
+                result.append((start_line, text))
+            current, start_line = [], None
+        else:
+            if start_line is None and not char.isspace():
+                start_line = line
+            current.append(char)
+            if char == "\n":
+                line += 1
+        i += 1
+    text = "".join(current).strip()
+    if text:
+        result.append((start_line, text))
+    return result
+
+
+def extract_subqueries(expr):
+    """Replace each (SELECT ...) with (?) and return (outer expr, [subquery text, ...])"""
+    outer, subqueries = [], []
+    i = 0
+    while True:
+        match = re.search(r"\(\s*SELECT\b", expr[i:], re.IGNORECASE)
+        if not match:
+            outer.append(expr[i:])
+            break
+        start = i + match.start()
+        depth, end = 0, start
+        while end < len(expr):
+            depth += {"(": 1, ")": -1}.get(expr[end], 0)
+            end += 1
+            if depth == 0:
+                break
+        outer.append(expr[i:start] + "(?)")
+        subqueries.append(expr[start + 1:end - 1])
+        i = end
+    return "".join(outer), subqueries
+
+
+def compared_columns(expr, table):
+    """
+    [(table, {column, ...}), ...]: one entry per predicate scope - the expression
+    itself, and each (SELECT ... FROM t WHERE ...) inside it, whose columns belong
+    to t. Columns compared with = or IN count; boolean flags are not selective
+    enough to need an index.
+    """
+    outer, subqueries = extract_subqueries(expr)
+    outer = BOOLEAN_COMPARISON_RE.sub(" ", outer)
+    columns = set()
+    for match in COMPARISON_RE.finditer(outer):
+        if match.group(1):
+            name, is_call = match.group(1), match.group(2)
+        else:
+            name, is_call = match.group(6), match.group(7)
+        if is_call or name.lower() in SQL_KEYWORDS or name[0].isdigit():
+            continue
+        columns.add(name.replace('"', "").lower().split(".")[-1])
+    scopes = [(table, columns)] if columns else []
+    for subquery in subqueries:
+        source = re.search(rf"\bFROM\s+({TABLE_NAME})", subquery, re.IGNORECASE)
+        where = re.search(r"\bWHERE\b(.*)$", subquery, re.IGNORECASE | re.DOTALL)
+        if source and where:
+            scopes += compared_columns(where.group(1), table_key(source.group(1)))
+    return scopes
+
+
+class Schema:
+    """Tables, foreign keys and indexes as built up by the migrations so far"""
+
+    def __init__(self):
+        self.created_in = {}  # table -> migration file that created it
+        self.indexes = defaultdict(list)  # table -> [[column, ...], ...]
+        self.foreign_keys = []  # (table, [columns], referenced table, file, line)
+        self.policy_scopes = []  # (table, {columns}, policy table, file, line)
+
+    def add_index(self, table, columns):
+        self.indexes[table].append(columns)
+
+    def is_indexed(self, table, columns):
+        """True if some index (or the primary key) leads with columns"""
+        if len(columns) == 1 and columns[0] in DEFAULT_INDEXED and table not in self.created_in:
+            return True
+        return any(index[:len(columns)] == columns for index in self.indexes.get(table, []))
+
+    def existed_before(self, table, path):
+        """Table already has rows when path runs (created earlier, or outside the migrations)"""
+        return self.created_in.get(table) != path
+
+
+def column_definition(table, definition, path, line, schema):
+    """Record the keys, indexes and FKs of one column definition in CREATE/ALTER TABLE"""
+    column = definition.split()[0].strip('"').lower()
+    upper = definition.upper()
+    if "PRIMARY KEY" in upper or re.search(r"\bUNIQUE\b", upper):
+        schema.add_index(table, [column])
+    reference = REFERENCES_RE.search(definition)
+    if reference:
+        schema.foreign_keys.append((table, [column], table_key(reference.group(1)), path, line))
+
+
+def table_constraint(table, definition, path, line, schema):
+    """Record a table-level PRIMARY KEY / UNIQUE / FOREIGN KEY constraint"""
+    keys = KEY_LIST_RE.search(definition)
+    if keys and not re.match(r"^\s*(?:CONSTRAINT\s+\S+\s+)?FOREIGN", definition, re.IGNORECASE):
+        schema.add_index(table, column_names(keys.group(2)))
+    foreign = FOREIGN_KEY_RE.search(definition)
+    if foreign:
+        schema.foreign_keys.append((table, column_names(foreign.group(1)), table_key(foreign.group(2)), path, line))
+
+
+def is_constraint(definition):
+    return re.match(r"^(CONSTRAINT|PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b", definition, re.IGNORECASE)
+
+
+def check_alter(table, actions, path, line, schema, issues):
+    """Record what an ALTER TABLE adds and flag actions that hold a long lock on an existing table"""
+    existing = schema.existed_before(table, path)
+    for offset, action in split_top_level(actions):
+        action_line = line_at(actions, line, offset)
+        upper = action.upper()
+        hazard = None
+        add_column = re.match(r"^ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)$", action, re.IGNORECASE | re.DOTALL)
+        if add_column and not is_constraint(add_column.group(1)):
+            definition = add_column.group(1)
+            column_definition(table, definition, path, action_line, schema)
+            if VOLATILE_DEFAULT_RE.search(definition):
+                hazard = "ADD COLUMN with a volatile DEFAULT rewrites the whole table"
+            elif re.search(r"\bCHECK\s*\(", definition, re.IGNORECASE):
+                hazard = "ADD COLUMN with CHECK scans the table under ACCESS EXCLUSIVE (add NOT VALID, then VALIDATE)"
+            elif REFERENCES_RE.search(definition):
+                hazard = "ADD COLUMN ... REFERENCES validates under lock (add the FK NOT VALID, then VALIDATE)"
+            elif "PRIMARY KEY" in upper or re.search(r"\bUNIQUE\b", upper):
+                hazard = "ADD COLUMN with a key builds its index under ACCESS EXCLUSIVE"
+        elif upper.startswith("ADD"):
+            definition = re.sub(r"^ADD\s+", "", action, flags=re.IGNORECASE)
+            table_constraint(table, definition, path, action_line, schema)
+            if re.search(r"\bUSING\s+INDEX\b", upper):
+                pass
+            elif re.search(r"\b(PRIMARY\s+KEY|UNIQUE|EXCLUDE)\b", upper):
+                hazard = "ADD PRIMARY KEY/UNIQUE builds the index under lock (CREATE INDEX CONCURRENTLY + USING INDEX)"
+            elif re.search(r"\b(FOREIGN\s+KEY|CHECK)\b", upper) and "NOT VALID" not in upper:
+                hazard = "ADD CONSTRAINT validates every row under lock (add NOT VALID, then VALIDATE)"
+        elif re.search(r"^ALTER\s+(?:COLUMN\s+)?\S+\s+(?:SET\s+DATA\s+)?TYPE\b", action, re.IGNORECASE):
+            hazard = "ALTER COLUMN TYPE rewrites the table under ACCESS EXCLUSIVE"
+        elif re.search(r"\bSET\s+NOT\s+NULL\b", upper):
+            hazard = "SET NOT NULL scans the table under ACCESS EXCLUSIVE (validate a CHECK NOT VALID first)"
+        elif re.match(r"^SET\s+(LOGGED|UNLOGGED|TABLESPACE)\b", upper):
+            hazard = f"{' '.join(upper.split()[:2])} rewrites the table under ACCESS EXCLUSIVE"
+
+        if hazard and existing:
+            issues["LOCKING_ALTER"].append({"file": path, "line": action_line, "issue": f"{table}: {hazard}"})
+
+
+def is_batched(clause):
+    """Bounded by LIMIT, a key range, or a list of literal keys"""
+    return bool(re.search(r"\bLIMIT\s+\d+|\bBETWEEN\b|\bid\s*[<>]=?|=\s*'|=\s*\d|\bIN\s*\(\s*'|\bIN\s*\(\s*\d",
+                          clause, re.IGNORECASE))
+
+
+def check_statement(line, statement, path, schema, issues):
+    create_table = CREATE_TABLE_RE.match(statement)
+    if create_table:
+        table = table_key(create_table.group(1))
+        schema.created_in.setdefault(table, path)
+        for offset, definition in split_top_level(create_table.group(2)):
+            definition_line = line_at(statement, line, create_table.start(2) + offset)
+            if is_constraint(definition):
+                table_constraint(table, definition, path, definition_line, schema)
+            else:
+                column_definition(table, definition, path, definition_line, schema)
+        return
+
+    create_index = CREATE_INDEX_RE.match(statement)
+    if create_index:
+        expressions = split_top_level(create_index.group(4))
+        schema.add_index(table_key(create_index.group(3)),
+                         [expr.strip('"').lower().split()[0] for _, expr in expressions])
+        return
+
+    alter = ALTER_TABLE_RE.match(statement)
+    if alter:
+        check_alter(table_key(alter.group(1)), alter.group(2), path, line_at(statement, line, alter.start(2)),
+                    schema, issues)
+        return
+
+    policy = CREATE_POLICY_RE.match(statement)
+    if policy:
+        table = table_key(policy.group(1))
+        for scope_table, columns in compared_columns(policy.group(2), table):
+            schema.policy_scopes.append((scope_table, columns, table, path, line))
+        return
+
+    update = UPDATE_RE.match(statement)
+    if update:
+        table = table_key(update.group(1))
+        where = re.search(r"\bWHERE\b(.*)$", update.group(2), re.IGNORECASE | re.DOTALL)
+        if schema.existed_before(table, path) and not (where and is_batched(where.group(1))):
+            scope = "with no WHERE" if not where else "unbounded WHERE"
+            issues["UNBATCHED_BACKFILL"].append({
+                "file": path, "line": line,
+                "issue": f"UPDATE {table} {scope}: one transaction locks every row (batch by key range)",
+            })
+        return
+
+    insert = INSERT_SELECT_RE.match(statement)
+    if insert:
+        source = table_key(insert.group(2))
+        if schema.existed_before(source, path) and not is_batched(insert.group(3)):
+            issues["UNBATCHED_BACKFILL"].append({
+                "file": path, "line": line,
+                "issue": f"INSERT INTO {table_key(insert.group(1))} SELECT FROM {source}: copies the whole table in one "
+                         f"transaction (batch by key range)",
+            })
+
+
+def check_migrations(migration_files=None):
+    """Replay the migrations and return (issues by type, schema)"""
+    schema = Schema()
+    issues = defaultdict(list)
+    files = sorted(migration_files if migration_files is not None else MIGRATIONS_DIR.glob("*.sql"))
+    for filepath in files:
+        filepath = Path(filepath).resolve()
+        path = str(filepath.relative_to(PROJECT_ROOT) if filepath.is_relative_to(PROJECT_ROOT) else filepath)
+        for line, statement in statements(filepath.read_text(encoding="utf-8", errors="ignore")):
+            check_statement(line, statement, path, schema, issues)
+
+    # Index checks run against the final schema: a later migration may add the index
+    reported = set()
+    for table, columns, referenced, path, line in schema.foreign_keys:
+        if (table, tuple(columns)) not in reported and not schema.is_indexed(table, columns):
+            reported.add((table, tuple(columns)))
+            issues["FK_WITHOUT_INDEX"].append({
+                "file": path, "line": line,
+                "issue": f"{table}({', '.join(columns)}) -> {referenced}: no index; joins and cascades scan {table}",
+            })
+    # A predicate scope is fine if any of its compared columns leads an index
+    for table, columns, policy_table, path, line in schema.policy_scopes:
+        key = (table, tuple(sorted(columns)))
+        if key not in reported and not any(schema.is_indexed(table, [column]) for column in columns):
+            reported.add(key)
+            issues["RLS_UNINDEXED"].append({
+                "file": path, "line": line,
+                "issue": f"{table}({', '.join(sorted(columns))}) filtered by RLS on {policy_table} with no index",
+            })
+    return dict(issues), schema
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Hot-path checks for Supabase queries in the API route handlers
+Each src/app/api/**/route.ts is masked (comments and string contents blanked,
+offsets kept) and scanned for supabase-js query chains - .from('table')
+followed by its chained calls - which are reported as:
+
+    N_PLUS_ONE          a query inside a for/while loop or a .map/.forEach callback
+    UNBOUNDED_SELECT    a select with no .limit/.range/.single and no id lookup
+    SEQUENTIAL_AWAIT    consecutive awaited selects that don't depend on each other
+
+Filters are cross-referenced with the schema built from the migrations
+(migration_checks.Schema), and every finding carries an estimated cost in
+round-trip units so the worst hot paths sort first:
+
+    query      1, +3 if a filtered column has no index, +2 if unbounded
+               (tables the migrations never create count as "index unknown")
+    N+1        LOOP_ITERATIONS ^ loop depth x query (halved for concurrent .map callbacks)
+    unbounded  query x 2 for select('*') or select()
+    sequential one round trip per query that could have run concurrently
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+API_DIR = PROJECT_ROOT / "src" / "app" / "api"
+
+# Rows/iterations assumed for a loop whose bound isn't known statically
+LOOP_ITERATIONS = 10
+
+QUERY_OPERATIONS = {"select", "insert", "update", "upsert", "delete", "rpc"}
+BOUNDING_METHODS = {"limit", "range", "single", "maybeSingle"}
+FILTER_METHODS = {"eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike", "is", "in", "contains",
+                  "containedBy", "match", "textSearch"}
+# Lookups that return at most one row without an explicit limit
+UNIQUE_COLUMNS = {"id"}
+
+FROM_RE = re.compile(r"\.from\(\s*['\"`](\w+)['\"`]\s*\)")
+LOOP_RE = re.compile(r"\b(for|while)\s*\(|\.(map|forEach|flatMap)\s*\(")
+METHOD_RE = re.compile(r"\s*\.\s*(\w+)\s*\(")
+DECLARATION_RE = re.compile(r"\b(?:const|let|var)\s+(\{[^}]*\}|\[[^\]]*\]|\w+)")
+IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+# [const { data: x } =] await supabase<newline>  - up to the .from( of a chain
+AWAITED_RE = re.compile(r"(?:\b(?:const|let|var)\s+(?:\{[^{}]*\}|\[[^\]]*\]|[\w$]+)\s*=\s*)?\bawait\s+[\w$.\s]*$")
+
+
+def mask_source(text):
+    """Blank comments and the contents of string/template literals (same length, newlines kept)"""
+    out = list(text)
+    i, n = 0, len(text)
+    while i < n:
+        if text.startswith("//", i):
+            end = text.find("\n", i)
+            end = n if end == -1 else end
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+        elif text[i] in "'\"`":
+            quote, end = text[i], i + 1
+            while end < n and text[end] != quote:
+                end += 2 if text[end] == "\\" else 1
+            i += 1  # keep the opening quote
+            end = min(end, n)
+        else:
+            i += 1
+            continue
+        for j in range(i, end):
+            if out[j] != "\n":
+                out[j] = " "
+        i = end + 1 if end < n and text[end] in "'\"`" else end
+    return "".join(out)
+
+
+def matching(masked, start):
+    """Index just past the bracket that closes the one at start"""
+    pairs = {"(": ")", "{": "}", "[": "]"}
+    stack = []
+    for i in range(start, len(masked)):
+        char = masked[i]
+        if char in pairs:
+            stack.append(pairs[char])
+        elif stack and char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return i + 1
+    return len(masked)
+
+
+def loop_ranges(masked):
+    """[(start, end, concurrent)] for loop bodies and iteration callbacks"""
+    ranges = []
+    for match in LOOP_RE.finditer(masked):
+        paren = match.end() - 1
+        close = matching(masked, paren)
+        if match.group(1):
+            body = re.match(r"\s*\{", masked[close:])
+            end = matching(masked, close + body.end() - 1) if body else masked.find(";", close) + 1
+            ranges.append((close, end, False))
+        else:
+            # .map(async ...) is usually awaited with Promise.all: concurrent, but still N queries
+            ranges.append((paren, close, match.group(2) == "map"))
+    return ranges
+
+
+def query_chain(text, masked, match):
+    """{"table", "start", "end", "methods": [(name, raw args)]} for the chain starting at a .from() match"""
+    methods = []
+    position = match.end()
+    while True:
+        method = METHOD_RE.match(masked, position)
+        if not method:
+            break
+        close = matching(masked, method.end() - 1)
+        methods.append((method.group(1), text[method.end():close - 1]))
+        position = close
+    return {"table": match.group(1), "start": match.start(), "end": position, "methods": methods}
+
+
+def filter_columns(chain):
+    """Columns used by filter calls, JSON paths reduced to their column"""
+    columns = []
+    for name, args in chain["methods"]:
+        if name in FILTER_METHODS:
+            column = re.match(r"\s*['\"`]([\w.]+)", args)
+            if column:
+                columns.append(re.split(r"->|\.", column.group(1))[0])
+    return columns
+
+
+def is_unique_lookup(chain):
+    for name, args in chain["methods"]:
+        column = re.match(r"\s*['\"`](\w+)['\"`]", args)
+        if name == "eq" and column and column.group(1) in UNIQUE_COLUMNS:
+            return True
+    return False
+
+
+def index_state(table, column, schema):
+    """'indexed', 'NOT indexed', or 'index unknown' for tables created outside the migrations"""
+    if schema.is_indexed(table, [column]):
+        return "indexed"
+    return "NOT indexed" if table in schema.created_in else "index unknown"
+
+
+def query_cost(chain, schema):
+    """(estimated cost of one execution, unindexed filter columns, bounded?)"""
+    names = {name for name, _ in chain["methods"]}
+    columns = filter_columns(chain)
+    unindexed = [column for column in columns if index_state(chain["table"], column, schema) == "NOT indexed"]
+    is_select = chain["methods"] and chain["methods"][0][0] == "select"
+    head_only = is_select and re.search(r"head\s*:\s*true", chain["methods"][0][1])
+    bounded = not is_select or head_only or bool(names & BOUNDING_METHODS) or is_unique_lookup(chain)
+    cost = 1 + (3 if unindexed else 0) + (0 if bounded else 2)
+    return cost, unindexed, bounded
+
+
+def index_note(chain, schema):
+    columns = filter_columns(chain)
+    if not columns:
+        return "no filter"
+    notes = [f"{column} {index_state(chain['table'], column, schema)}" for column in dict.fromkeys(columns)]
+    return ", ".join(notes)
+
+
+def declared_names(text):
+    names = set()
+    for declaration in DECLARATION_RE.findall(text):
+        if declaration[0] in "{[":
+            # { data: roles, error } binds roles and error
+            for part in declaration[1:-1].split(","):
+                names.update(IDENTIFIER_RE.findall(part.split(":")[-1].split("=")[0]))
+        else:
+            names.add(declaration)
+    return names
+
+
+def sequential_runs(masked, awaited):
+    """Runs of consecutive awaited queries in one block where no query uses an earlier one's results"""
+    runs, current = [], []
+    for chain in awaited:
+        if current:
+            previous = current[-1]
+            between = masked[previous["end"]:chain["statement"]]
+            depth, balanced = 0, True
+            for char in between:
+                depth += {"{": 1, "}": -1}.get(char, 0)
+                balanced = balanced and depth >= 0
+            bound = set().union(*(declared_names(masked[c["statement"]:c["end"]]) for c in current))
+            bound |= declared_names(between)
+            used = set(IDENTIFIER_RE.findall(masked[chain["start"]:chain["end"]]))
+            if balanced and depth == 0 and "await" not in between and not (used & bound):
+                current.append(chain)
+                continue
+            if len(current) > 1:
+                runs.append(current)
+        current = [chain]
+    if len(current) > 1:
+        runs.append(current)
+    return runs
+
+
+def check_route(filepath, schema, issues):
+    text = filepath.read_text(encoding="utf-8", errors="ignore")
+    masked = mask_source(text)
+    path = str(filepath.relative_to(PROJECT_ROOT))
+    loops = loop_ranges(masked)
+    awaited = []
+
+    def line_of(position):
+        return text.count("\n", 0, position) + 1
+
+    for match in FROM_RE.finditer(text):
+        receiver = masked[:match.start()].rstrip()
+        if masked[match.start()] != "." or receiver.endswith("storage") or re.search(r"\b(Array|Buffer)$", receiver):
+            continue
+        chain = query_chain(text, masked, match)
+        if not chain["methods"] or chain["methods"][0][0] not in QUERY_OPERATIONS:
+            continue
+        line = line_of(chain["start"])
+        cost, unindexed, bounded = query_cost(chain, schema)
+        operation = chain["methods"][0][0]
+        described = f"{operation} {chain['table']} ({index_note(chain, schema)})"
+
+        enclosing = [loop for loop in loops if loop[0] <= chain["start"] < loop[1]]
+        if enclosing:
+            concurrent = all(loop[2] for loop in enclosing)
+            total = LOOP_ITERATIONS ** len(enclosing) * cost // (2 if concurrent else 1)
+            kind = "concurrent .map" if concurrent else "loop"
+            issues["N_PLUS_ONE"].append({
+                "file": path, "line": line, "cost": total,
+                "issue": f"[cost {total}] {described} runs once per {kind} iteration",
+            })
+
+        if operation == "select" and not bounded:
+            star = re.match(r"\s*(['\"`]\*['\"`])?\s*$", chain["methods"][0][1].split(",")[0])
+            total = cost * (2 if star else 1)
+            issues["UNBOUNDED_SELECT"].append({
+                "file": path, "line": line, "cost": total,
+                "issue": f"[cost {total}] {described} has no .limit/.range/.single"
+                         + (" and selects every column" if star else ""),
+            })
+
+        # Only reads can be reordered: writes usually depend on the checks before them
+        awaited_match = AWAITED_RE.search(masked, 0, chain["start"])
+        if awaited_match and not enclosing and operation == "select":
+            chain["statement"] = awaited_match.start()
+            awaited.append(chain)
+
+    for run in sequential_runs(masked, awaited):
+        total = len(run) - 1
+        tables = ", ".join(chain["table"] for chain in run)
+        issues["SEQUENTIAL_AWAIT"].append({
+            "file": path, "line": line_of(run[0]["start"]), "cost": total,
+            "issue": f"[cost {total}] {len(run)} independent awaited selects ({tables}) could use Promise.all",
+        })
+
+
+def check_queries(schema, api_dir=API_DIR):
+    """Scan every route handler; returns issues by type, most expensive first"""
+    issues = defaultdict(list)
+    for filepath in sorted(api_dir.rglob("route.ts")):
+        check_route(filepath, schema, issues)
+    for items in issues.values():
+        items.sort(key=lambda item: -item["cost"])
+    return dict(issues)
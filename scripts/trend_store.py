@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Columnar store for per-commit scanner totals
+One append-only binary file per column under .cache/build/trends:
+
+    commit.bin      20-byte raw commit sha per row
+    time.bin        int64 commit timestamp per row
+    <TYPE>.bin      uint32 issue count per row, one file per issue type
+
+meta.json records the committed row count and is rewritten last, so an
+interrupted append is ignored (and trimmed) on the next run. A trend query
+only reads the columns it asks for.
+"""
+
+import json
+from array import array
+from pathlib import Path
+
+from build_cache import CACHE_ROOT, write_atomic
+
+TREND_DIR = CACHE_ROOT / "trends"
+SHA_BYTES = 20
+
+
+class TrendStore:
+    """Per-commit issue counts as fixed-width columns"""
+
+    def __init__(self, directory=TREND_DIR):
+        self.dir = Path(directory)
+        meta_path = self.dir / "meta.json"
+        meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+        self.rows = meta.get("rows", 0)
+        self.columns = meta.get("columns", [])
+
+    def _path(self, name):
+        return self.dir / f"{name}.bin"
+
+    def _read(self, name, typecode, rows=None):
+        values = array(typecode)
+        path = self._path(name)
+        if path.exists():
+            values.frombytes(path.read_bytes()[:(self.rows if rows is None else rows) * values.itemsize])
+        return values
+
+    def commits(self):
+        """Hex shas of the commits already stored"""
+        raw = self._path("commit").read_bytes() if self._path("commit").exists() else b""
+        return {raw[i:i + SHA_BYTES].hex() for i in range(0, self.rows * SHA_BYTES, SHA_BYTES)}
+
+    def append(self, rows):
+        """Add [(commit sha, timestamp, {type: count})]; new types are backfilled with zeros"""
+        if not rows:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        columns = list(self.columns)
+        for _, _, counts in rows:
+            columns += [name for name in sorted(counts) if name not in columns]
+        appended = {
+            "commit": b"".join(bytes.fromhex(sha) for sha, _, _ in rows),
+            "time": array("q", [timestamp for _, timestamp, _ in rows]).tobytes(),
+        }
+        for name in columns:
+            backfill = [] if name in self.columns else [0] * self.rows
+            appended[name] = array("I", backfill + [counts.get(name, 0) for _, _, counts in rows]).tobytes()
+        widths = {"commit": SHA_BYTES, "time": 8, **{name: 4 for name in self.columns}}
+        for name, data in appended.items():
+            path = self._path(name)
+            with open(path, "r+b" if path.exists() else "wb") as f:
+                # Drop anything past the committed rows (an interrupted append); new columns start empty
+                f.truncate(self.rows * widths.get(name, 0))
+                f.seek(0, 2)
+                f.write(data)
+        self.rows += len(rows)
+        self.columns = columns
+        write_atomic(self.dir / "meta.json", json.dumps({"rows": self.rows, "columns": columns}).encode())
+
+    def query(self, names):
+        """[(timestamp, commit sha, {name: count})] in commit-time order, reading only the named columns"""
+        if not self.rows or not self._path("commit").exists():
+            return []
+        times = self._read("time", "q")
+        raw = self._path("commit").read_bytes()
+        values = {name: self._read(name, "I") if name in self.columns else array("I", [0] * self.rows)
+                  for name in names}
+        order = sorted(range(self.rows), key=times.__getitem__)
+        return [(times[i], raw[i * SHA_BYTES:(i + 1) * SHA_BYTES].hex(), {name: values[name][i] for name in names})
+                for i in order]